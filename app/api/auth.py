@@ -1,15 +1,23 @@
 import os
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, Body, Response, status, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from app.db.database import SessionLocal
+from app.db.database import AuthSessionLocal
 from app.db.models.user import User
 from app.db.models.account import Account
 from app.db.models.refresh_token import RefreshToken
 from app.schemas.user import UserResponse
+from app.service.auth.user_cache import AuthUser, get_auth_user, invalidate_user
+from app.service.auth import refresh_tokens
+from app.service.auth.google import (
+    GOOGLE_CLIENT_ID, GOOGLE_REDIRECT_URI, GoogleAuthError, exchange_code, verify_id_token,
+)
+from app.service.auth.password import (
+    hash_password, verify_password, PasswordHasherBusy, PasswordHasherUnavailable,
+)
 import logging
 from pydantic import BaseModel, EmailStr
-from passlib.context import CryptContext
 import random
 import string
 from jose import jwt
@@ -23,23 +31,11 @@ logger = logging.getLogger('app.api')
 
 router = APIRouter()
 
-GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
-GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET")
-GOOGLE_REDIRECT_URI = os.getenv("GOOGLE_REDIRECT_URI")
-
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your_secret_key")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 REFRESH_TOKEN_EXPIRE_DAYS = 14
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
-
 def generate_nickname(base, db):
     salt = ''.join(random.choices(string.ascii_lowercase + string.digits, k=4))
     nickname = f"{base}_{salt}"
@@ -81,43 +77,67 @@ class ChangeNicknameRequest(BaseModel):
     new_nickname: str
 
 def get_db():
-    db = SessionLocal()
+    db = AuthSessionLocal()
     try:
         yield db
     finally:
         db.close()
 
+def password_hasher_error(e):
+    """해시 풀 과부하는 429, 장애/시간 초과는 503 (Retry-After 포함)"""
+    if isinstance(e, PasswordHasherBusy):
+        return HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="요청이 많습니다. 잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="잠시 후 다시 시도해 주세요.",
+        headers={"Retry-After": str(e.retry_after)},
+    )
+
+# 이메일 가입/로그인: bcrypt는 프로세스 풀에서 실행하고, DB 세션은 쿼리 구간에서만 열어 둠
+def _email_account_exists(email):
+    with AuthSessionLocal() as db:
+        return db.query(Account.id).filter(Account.provider == 'email', Account.email == email).first() is not None
+
+def _create_email_user(req, hashed_pw):
+    with AuthSessionLocal() as db:
+        nickname = generate_nickname(req.username, db)
+        user = User(nickname=nickname, username=req.username, is_active=True)
+        db.add(user)
+        db.flush()
+        account = Account(
+            user_id=user.id,
+            provider='email',
+            email=req.email,
+            password_hash=hashed_pw
+        )
+        db.add(account)
+        db.commit()
+        db.refresh(user)
+        return UserResponse.model_validate(user)
+
 @router.post("/auth/email/register", response_model=UserResponse)
-def email_register(req: RegisterRequest, db: Session = Depends(get_db)):
-    nickname = generate_nickname(req.username, db)
-    # 이메일+provider 중복 체크 (Account)
-    if db.query(Account).filter(Account.provider == 'email', Account.email == req.email).first():
+async def email_register(req: RegisterRequest):
+    # 이메일+provider 중복 체크 (Account) - 해시 전에 확인해 불필요한 bcrypt 실행을 피함
+    if await run_in_threadpool(_email_account_exists, req.email):
         raise HTTPException(status_code=400, detail="이미 사용 중인 이메일입니다.")
-    user = User(nickname=nickname, username=req.username, is_active=True)
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    hashed_pw = get_password_hash(req.password)
-    account = Account(
-        user_id=user.id,
-        provider='email',
-        email=req.email,
-        password_hash=hashed_pw
-    )
-    db.add(account)
-    db.commit()
-    db.refresh(account)
-    user.accounts.append(account)
-    db.commit()
-    return user
+    try:
+        hashed_pw = await hash_password(req.password)
+    except (PasswordHasherBusy, PasswordHasherUnavailable) as e:
+        raise password_hasher_error(e)
+    return await run_in_threadpool(_create_email_user, req, hashed_pw)
 
-@router.post("/auth/email/login", response_model=LoginResponse)
-def email_login(req: LoginRequest, response: Response, db: Session = Depends(get_db)):
-    account = db.query(Account).filter(Account.provider == 'email', Account.email == req.email).first()
-    if not account or not account.password_hash:
-        raise HTTPException(status_code=400, detail="이메일 또는 비밀번호가 올바르지 않습니다.")
-    if not verify_password(req.password, account.password_hash):
-        raise HTTPException(status_code=400, detail="이메일 또는 비밀번호가 올바르지 않습니다.")
+def _load_email_account(email):
+    """(account_id, user_id, provider, email, password_hash) 또는 None"""
+    with AuthSessionLocal() as db:
+        return db.query(
+            Account.id, Account.user_id, Account.provider, Account.email, Account.password_hash
+        ).filter(Account.provider == 'email', Account.email == email).first()
+
+def _create_login_tokens(db, account):
     access_token = create_access_token(
         data={
             "sub": str(account.user_id),
@@ -136,16 +156,6 @@ def email_login(req: LoginRequest, response: Response, db: Session = Depends(get
     )
     db.add(refresh_token_obj)
     db.commit()
-    db.refresh(refresh_token_obj)
-    # refresh_token을 HTTP Only 쿠키로도 내려줌(보안 강화)
-    response.set_cookie(
-        key="refresh_token",
-        value=refresh_token,
-        httponly=True,
-        secure=True,
-        samesite="lax",
-        max_age=REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
-    )
     user = db.query(User).filter(User.id == account.user_id).first()
     return {
         "access_token": access_token,
@@ -155,6 +165,33 @@ def email_login(req: LoginRequest, response: Response, db: Session = Depends(get
         "user": UserResponse.model_validate(user)
     }
 
+def _issue_login_tokens(account):
+    with AuthSessionLocal() as db:
+        return _create_login_tokens(db, account)
+
+@router.post("/auth/email/login", response_model=LoginResponse)
+async def email_login(req: LoginRequest, response: Response):
+    account = await run_in_threadpool(_load_email_account, req.email)
+    if not account or not account.password_hash:
+        raise HTTPException(status_code=400, detail="이메일 또는 비밀번호가 올바르지 않습니다.")
+    try:
+        verified = await verify_password(req.password, account.password_hash)
+    except (PasswordHasherBusy, PasswordHasherUnavailable) as e:
+        raise password_hasher_error(e)
+    if not verified:
+        raise HTTPException(status_code=400, detail="이메일 또는 비밀번호가 올바르지 않습니다.")
+    result = await run_in_threadpool(_issue_login_tokens, account)
+    # refresh_token을 HTTP Only 쿠키로도 내려줌(보안 강화)
+    response.set_cookie(
+        key="refresh_token",
+        value=result["refresh_token"],
+        httponly=True,
+        secure=True,
+        samesite="lax",
+        max_age=REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+    )
+    return result
+
 @router.get("/auth/google/login")
 def google_login():
     google_auth_url = (
@@ -169,112 +206,46 @@ def google_login():
     logger.info(f"Google auth URL: {google_auth_url}")
     return {"auth_url": google_auth_url}
 
-@router.get("/auth/google/callback", response_model=LoginResponse)
-async def google_callback(code: str, db: Session = Depends(get_db)):
-    token_url = "https://oauth2.googleapis.com/token"
-    data = {
-        "code": code,
-        "client_id": GOOGLE_CLIENT_ID,
-        "client_secret": GOOGLE_CLIENT_SECRET,
-        "redirect_uri": GOOGLE_REDIRECT_URI,
-        "grant_type": "authorization_code",
-    }
-    async with httpx.AsyncClient() as client:
-        token_resp = await client.post(token_url, data=data)
-        if token_resp.status_code != 200:
-            logger.error(f"구글 토큰 요청 실패: {token_resp.status_code}")
-            raise HTTPException(status_code=400, detail="구글 토큰 요청 실패")
-        tokens = token_resp.json()
-    access_token = tokens.get("access_token")
-    if not access_token:
-        logger.error("구글 access_token 획득 실패")
-        raise HTTPException(status_code=400, detail="구글 access_token 획득 실패")
-    userinfo_url = "https://www.googleapis.com/oauth2/v2/userinfo"
-    headers = {"Authorization": f"Bearer {access_token}"}
-    async with httpx.AsyncClient() as client:
-        userinfo_resp = await client.get(userinfo_url, headers=headers)
-        if userinfo_resp.status_code != 200:
-            logger.error(f"구글 사용자 정보 조회 실패: {userinfo_resp.status_code}")
-            raise HTTPException(status_code=400, detail="구글 사용자 정보 조회 실패")
-        userinfo = userinfo_resp.json()
-    email = userinfo["email"]
-    google_id = userinfo["id"]
-    username = userinfo.get("name", email.split("@")[0])
+def _google_login(claims, tokens):
+    """구글 계정 조회/신규 생성 후 로그인 토큰 발급 (스레드풀에서 실행)"""
+    google_id = claims["sub"]
+    email = claims["email"]
     # username은 구글 name 그대로, nickname은 username+salt로 자동 생성
-    account = db.query(Account).filter(Account.provider == 'google', Account.provider_user_id == google_id).first()
-    if account:
-        user = db.query(User).filter(User.id == account.user_id).first()
-        access_token = create_access_token(
-            data={
-                "sub": str(user.id),
-                "account_id": account.id,
-                "provider": account.provider,
-                "email": account.email
-            }
-        )
-        refresh_token = create_refresh_token()
-        refresh_expires_at = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-        refresh_token_obj = RefreshToken(
-            user_id=user.id,
-            account_id=account.id,
-            token=hash_token(refresh_token),
-            expires_at=refresh_expires_at
-        )
-        db.add(refresh_token_obj)
-        db.commit()
-        db.refresh(refresh_token_obj)
-        return {
-            "access_token": access_token,
-            "token_type": "bearer",
-            "refresh_token": refresh_token,
-            "refresh_token_expires_at": refresh_expires_at.isoformat(),
-            "user": UserResponse.model_validate(user)
-        }
-    # 신규 유저 생성
-    nickname = generate_nickname(username, db)
-    user = User(username=username, nickname=nickname, is_active=True)
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    account = Account(
-        user_id=user.id,
-        provider='google',
-        provider_user_id=google_id,
-        email=email,
-        access_token=access_token,
-        refresh_token=tokens.get("refresh_token")
-    )
-    db.add(account)
-    db.commit()
-    db.refresh(account)
-    user.accounts.append(account)
-    db.commit()
-    access_token = create_access_token(
-        data={
-            "sub": str(user.id),
-            "account_id": account.id,
-            "provider": account.provider,
-            "email": account.email
-        }
-    )
-    refresh_token = create_refresh_token()
-    refresh_expires_at = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-    refresh_token_obj = RefreshToken(
-        user_id=user.id,
-        account_id=account.id,
-        token=hash_token(refresh_token),
-        expires_at=refresh_expires_at
-    )
-    db.add(refresh_token_obj)
-    db.commit()
-    db.refresh(refresh_token_obj)
-    return {
-        "access_token": access_token,
-        "token_type": "bearer",
-        "refresh_token": refresh_token,
-        "refresh_token_expires_at": refresh_expires_at.isoformat(),
-        "user": UserResponse.model_validate(user)
-    }
+    username = claims.get("name", email.split("@")[0])
+    with AuthSessionLocal() as db:
+        account = db.query(Account).filter(
+            Account.provider == 'google', Account.provider_user_id == google_id
+        ).first()
+        if account is None:
+            # 신규 유저 생성
+            nickname = generate_nickname(username, db)
+            user = User(username=username, nickname=nickname, is_active=True)
+            db.add(user)
+            db.flush()
+            account = Account(
+                user_id=user.id,
+                provider='google',
+                provider_user_id=google_id,
+                email=email,
+                access_token=tokens.get("access_token"),
+                refresh_token=tokens.get("refresh_token")
+            )
+            db.add(account)
+            # 유저/계정/리프레시 토큰을 한 트랜잭션으로 커밋
+            db.flush()
+        return _create_login_tokens(db, account)
+
+@router.get("/auth/google/callback", response_model=LoginResponse)
+async def google_callback(code: str):
+    try:
+        tokens = await exchange_code(code)
+        claims = await verify_id_token(tokens["id_token"], tokens["access_token"])
+    except GoogleAuthError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except httpx.HTTPError as e:
+        logger.error(f"구글 OAuth 요청 실패: {e}")
+        raise HTTPException(status_code=502, detail="구글 서버와 통신하지 못했습니다.")
+    return await run_in_threadpool(_google_login, claims, tokens)
 
 @router.post("/auth/change-nickname")
 def change_nickname(req: ChangeNicknameRequest, db: Session = Depends(get_db)):
@@ -286,6 +257,7 @@ def change_nickname(req: ChangeNicknameRequest, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
     user.nickname = req.new_nickname
     db.commit()
+    invalidate_user(user.id)
     db.refresh(user)
     return {"id": user.id, "nickname": user.nickname}
 
@@ -300,38 +272,23 @@ def refresh_token_api(request: Request, response: Response, db: Session = Depend
         raise HTTPException(status_code=401, detail="리프레시 토큰이 없습니다.")
     
     hashed = hash_token(refresh_token)
-    token_obj = db.query(RefreshToken).filter(RefreshToken.token == hashed).first()
-    # timezone-naive datetime을 timezone-aware로 변환
-    expires_at_aware = token_obj.expires_at.replace(tzinfo=timezone.utc) if token_obj.expires_at.tzinfo is None else token_obj.expires_at
-    if not token_obj or expires_at_aware < datetime.now(timezone.utc):
+    # 토큰 -> 계정 -> 사용자 조인 조회 (짧은 TTL 캐시)
+    record = refresh_tokens.lookup(db, hashed)
+    if record is None:
         raise HTTPException(status_code=401, detail="리프레시 토큰이 유효하지 않거나 만료되었습니다.")
-    account = db.query(Account).filter(Account.id == token_obj.account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="계정을 찾을 수 없습니다.")
-    # 기존 refresh_token 폐기(로테이션)
-    db.delete(token_obj)
-    db.commit()
-    # 새 refresh_token 발급
+    # 기존 refresh_token 폐기 + 새 refresh_token 발급(로테이션)을 한 트랜잭션으로
     new_refresh_token = create_refresh_token()
     refresh_expires_at = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-    new_token_obj = RefreshToken(
-        user_id=account.user_id,
-        account_id=account.id,
-        token=hash_token(new_refresh_token),
-        expires_at=refresh_expires_at
-    )
-    db.add(new_token_obj)
-    db.commit()
-    db.refresh(new_token_obj)
+    if not refresh_tokens.rotate(db, hashed, record, hash_token(new_refresh_token), refresh_expires_at):
+        raise HTTPException(status_code=401, detail="리프레시 토큰이 유효하지 않거나 만료되었습니다.")
     access_token = create_access_token(
         data={
-            "sub": str(account.user_id),
-            "account_id": account.id,
-            "provider": account.provider,
-            "email": account.email
+            "sub": str(record.user_id),
+            "account_id": record.account_id,
+            "provider": record.provider,
+            "email": record.email
         }
     )
-    user = db.query(User).filter(User.id == account.user_id).first()
     # refresh_token을 HTTP Only 쿠키로도 내려줌(보안 강화)
     response.set_cookie(
         key="refresh_token",
@@ -346,7 +303,7 @@ def refresh_token_api(request: Request, response: Response, db: Session = Depend
         "token_type": "bearer",
         "refresh_token": new_refresh_token,
         "refresh_token_expires_at": refresh_expires_at.isoformat(),
-        "user": UserResponse.model_validate(user)
+        "user": record.user
     }
 
 class LogoutRequest(BaseModel):
@@ -357,16 +314,12 @@ def logout(request: Request, db: Session = Depends(get_db)):
     # 쿠키에서 refresh_token 읽기
     refresh_token = request.cookies.get("refresh_token")
     if refresh_token:
-        hashed = hash_token(refresh_token)
-        token_obj = db.query(RefreshToken).filter(RefreshToken.token == hashed).first()
-        if token_obj:
-            db.delete(token_obj)
-            db.commit()
+        refresh_tokens.revoke(db, hash_token(refresh_token))
     return {"detail": "로그아웃 및 리프레시 토큰 폐기 완료"}
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> AuthUser:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -375,7 +328,8 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id = int(payload.get("sub"))
-        user = db.query(User).filter(User.id == user_id).first()
+        # 사용자 정보는 캐시된 스냅샷 (AuthUser), 캐시 미스일 때만 DB 조회
+        user = get_auth_user(db, user_id, payload)
         if not user or not user.is_active:
             raise credentials_exception
         return user
@@ -384,7 +338,7 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     except JWTError:
         raise credentials_exception
 
-def require_superuser(current_user: User = Depends(get_current_user)):
+def require_superuser(current_user: AuthUser = Depends(get_current_user)):
     if not current_user.is_superuser:
         raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
     return current_user
@@ -402,5 +356,5 @@ def get_me(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
         raise HTTPException(status_code=401, detail="Invalid token") 
 
 @router.get("/admin-only")
-def admin_api(current_user: User = Depends(require_superuser)):
+def admin_api(current_user: AuthUser = Depends(require_superuser)):
     return {"msg": "관리자만 접근 가능"}
\ No newline at end of file
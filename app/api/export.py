@@ -0,0 +1,67 @@
+import logging
+logger = logging.getLogger('app.api')
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from typing import List, Optional
+from datetime import date
+from app.api.auth import get_current_user
+from app.config import EXPORT_RETRY_AFTER
+from app.service.auth.user_cache import AuthUser
+from app.service.export.ohlcv_export import (
+    MEDIA_TYPES, FILE_EXTENSIONS, STOCK_OHLCV_SCHEMA, INDEX_OHLCV_SCHEMA,
+    ExportBusy, build_stock_ohlcv_query, build_index_ohlcv_query, stream_export,
+)
+
+router = APIRouter(prefix="/export", tags=["데이터 내보내기"])
+
+def _export_response(stmt, schema, fmt, name):
+    """슬롯/커넥션을 먼저 확보하고 응답 시작 (동시 내보내기 초과는 429, 커넥션 대기 초과는 503)"""
+    try:
+        chunks = stream_export(stmt, schema, fmt)
+    except ExportBusy as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="동시에 진행 중인 내보내기가 많습니다. 잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    except PoolTimeoutError:
+        logger.warning('내보내기 커넥션 대기 시간 초과')
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": str(EXPORT_RETRY_AFTER)},
+        )
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[fmt],
+        headers={'Content-Disposition': f'attachment; filename="{name}.{FILE_EXTENSIONS[fmt]}"'},
+    )
+
+@router.get("/stock_ohlcv")
+def export_stock_ohlcv(
+    format: str = Query('arrow', pattern='^(arrow|parquet)$', description="arrow: Arrow IPC stream, parquet: Parquet"),
+    tickers: Optional[List[str]] = Query(None, description="티커 목록"),
+    market: Optional[str] = Query(None, description="시장 (KOSPI, KOSDAQ 등)"),
+    from_date: Optional[date] = Query(None, alias='from', description="시작일 (포함)"),
+    to_date: Optional[date] = Query(None, alias='to', description="종료일 (포함)"),
+    current_user: AuthUser = Depends(get_current_user),
+):
+    """tb_stock_ohlcv 대용량 내보내기"""
+    logger.info(f'stock_ohlcv {format} export: user={current_user.id}, tickers={tickers}, market={market}, from={from_date}, to={to_date}')
+    stmt = build_stock_ohlcv_query(tickers, market, from_date, to_date)
+    return _export_response(stmt, STOCK_OHLCV_SCHEMA, format, 'stock_ohlcv')
+
+@router.get("/index_ohlcv")
+def export_index_ohlcv(
+    format: str = Query('arrow', pattern='^(arrow|parquet)$', description="arrow: Arrow IPC stream, parquet: Parquet"),
+    names: Optional[List[str]] = Query(None, description="지수명 목록 (KS11, IXIC 등)"),
+    from_date: Optional[date] = Query(None, alias='from', description="시작일 (포함)"),
+    to_date: Optional[date] = Query(None, alias='to', description="종료일 (포함)"),
+    current_user: AuthUser = Depends(get_current_user),
+):
+    """tb_index_ohlcv 대용량 내보내기"""
+    logger.info(f'index_ohlcv {format} export: user={current_user.id}, names={names}, from={from_date}, to={to_date}')
+    stmt = build_index_ohlcv_query(names, from_date, to_date)
+    return _export_response(stmt, INDEX_OHLCV_SCHEMA, format, 'index_ohlcv')
@@ -1,27 +1,25 @@
 import logging
 logger = logging.getLogger('app.api')
 
-from fastapi import APIRouter, Depends, Query, HTTPException
-from app.db.database import SessionLocal
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
+from app.db.database import get_async_db, get_async_read_db
+from app.core.cache import market_cache
+from app.core.http_cache import load_etag, etag_matches, not_modified, set_etag
 from app.schemas.index_detail import IndexDetailResponse
 from app.db.models.index_info import IndexInfo
 from app.db.models.index_ohlcv import IndexOhlcv
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func, true
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
-from collections import defaultdict
+from itertools import groupby
+import numpy as np
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.get('/index/{index_code}')
-def get_index(index_code: str, db: Session = Depends(get_db)):
-    index = db.query(IndexInfo).filter(IndexInfo.code == index_code).first()
+async def get_index(index_code: str, db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(select(IndexInfo).filter(IndexInfo.code == index_code))
+    index = result.scalars().first()
     if not index:
         logger.warning(f'Index not found: {index_code}')
         raise HTTPException(status_code=404, detail='Index not found')
@@ -29,12 +27,14 @@ def get_index(index_code: str, db: Session = Depends(get_db)):
     return index
 
 @router.get('/index/{index_code}/ohlcv')
-def get_index_ohlcv(index_code: str, db: Session = Depends(get_db)):
-    index = db.query(IndexInfo).filter(IndexInfo.code == index_code).first()
+async def get_index_ohlcv(index_code: str, db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(select(IndexInfo).filter(IndexInfo.code == index_code))
+    index = result.scalars().first()
     if not index:
         logger.warning(f'Index not found: {index_code}')
         raise HTTPException(status_code=404, detail='Index not found')
-    ohlcv = db.query(IndexOhlcv).filter(IndexOhlcv.index_id == index.id).all()
+    result = await db.execute(select(IndexOhlcv).filter(IndexOhlcv.index_id == index.id))
+    ohlcv = result.scalars().all()
     if not ohlcv:
         logger.warning(f'OHLCV not found for index: {index_code}')
         raise HTTPException(status_code=404, detail='OHLCV not found')
@@ -42,10 +42,10 @@ def get_index_ohlcv(index_code: str, db: Session = Depends(get_db)):
     return ohlcv
 
 @router.get("/index/{index_id}", response_model=list[IndexDetailResponse])
-def get_index_detail(index_id: int, db: Session = Depends(get_db)):
+async def get_index_detail(index_id: int, db: AsyncSession = Depends(get_async_db)):
     last_30_days = datetime.now() - timedelta(days=30)
-    results = (
-        db.query(
+    stmt = (
+        select(
             IndexOhlcv.index_id,
             IndexInfo.name,
             IndexOhlcv.ymd,
@@ -60,63 +60,97 @@ def get_index_detail(index_id: int, db: Session = Depends(get_db)):
         .filter(IndexOhlcv.index_id == index_id)
         .filter(IndexOhlcv.ymd >= last_30_days)
         .order_by(IndexOhlcv.ymd.asc())
-        .all()
     )
+    results = (await db.execute(stmt)).all()
     if not results:
         logger.warning(f'No results found for index: {index_id}')
         raise HTTPException(status_code=404, detail='No results found')
     logger.info(f'Index detail found for index: {index_id}, count={len(results)}')
     return [IndexDetailResponse(**dict(r._mapping)) for r in results]
 
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close')
+
+def _round_column(values):
+    """컬럼 단위 반올림 (NULL은 그대로 유지)"""
+    arr = np.array(values, dtype=np.float64)
+    return np.where(np.isnan(arr), None, np.round(arr, 2)).tolist()
+
 @router.get("/index_all")
-def get_index_detail_all(n_days: int = Query(30, ge=1, le=365), db: Session = Depends(get_db)):
-    results = (
-        db.query(
-            IndexOhlcv.index_id,
+async def get_index_detail_all(
+    request: Request,
+    response: Response,
+    n_days: int = Query(30, ge=1, le=365),
+    format: str = Query('rows', pattern='^(rows|columnar)$', description="rows: 일자별 dict 목록, columnar: 컬럼별 배열"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    cache_key = f'index_all:{n_days}:{format}'
+    # tb_index_ohlcv에는 mod_date가 없으므로 최신 일자와 건수로 버전을 판단
+    etag = await load_etag(
+        db, f'{cache_key}:etag',
+        select(func.max(IndexOhlcv.ymd), func.count()).select_from(IndexOhlcv),
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    cached = market_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    # 조회 도중 크롤링이 끝나 무효화되면 이전 데이터이므로 저장하지 않음
+    generation = market_cache.generation()
+
+    # 지수별 최근 n_days건만 PK(index_id, ymd) 역순 스캔으로 조회
+    price_columns = [
+        getattr(IndexOhlcv, col) if format == 'columnar' else func.round(getattr(IndexOhlcv, col), 2).label(col)
+        for col in OHLCV_COLUMNS
+    ]
+    latest = (
+        select(IndexOhlcv.ymd, *price_columns, IndexOhlcv.volume)
+        .where(IndexOhlcv.index_id == IndexInfo.id)
+        .where(IndexOhlcv.close.isnot(None))
+        .order_by(IndexOhlcv.ymd.desc())
+        .limit(n_days)
+        .lateral('latest')
+    )
+    stmt = (
+        select(
+            IndexInfo.id.label('index_id'),
             IndexInfo.name,
-            IndexOhlcv.ymd,
-            IndexOhlcv.open,
-            IndexOhlcv.high,
-            IndexOhlcv.low,
-            IndexOhlcv.close,
-            IndexOhlcv.volume,
-            IndexInfo.description
+            IndexInfo.description,
+            latest.c.ymd,
+            latest.c.open,
+            latest.c.high,
+            latest.c.low,
+            latest.c.close,
+            latest.c.volume,
         )
-        .join(IndexInfo, IndexInfo.id == IndexOhlcv.index_id)
-        .filter(IndexOhlcv.close.isnot(None))
-        .order_by(IndexOhlcv.index_id.asc(), IndexOhlcv.ymd.asc())
-        .all()
+        .join(latest, true())
+        .order_by(IndexInfo.id.asc(), latest.c.ymd.asc())
     )
-
-    grouped = defaultdict(list)
-    meta = {}
-
-    for r in results:
-        d = dict(r._mapping)
-        idx = d['index_id']
-        ohlcv = {
-            'ymd': d['ymd'],
-            'open': round(d['open'], 2),
-            'high': round(d['high'], 2),
-            'low': round(d['low'], 2),
-            'close': round(d['close'], 2),
-            'volume': d['volume'],
-        }
-        grouped[idx].append(ohlcv)
-        if idx not in meta:
-            meta[idx] = {
-                'index_id': idx,
-                'name': d['name'],
-                'description': d['description'],
-            }
+    results = (await db.execute(stmt)).all()
 
     result = []
-    for idx in grouped:
-        # 마지막 n_days개만 슬라이싱
-        ohlcv_list = grouped[idx][-n_days:]
+    for idx, rows in groupby(results, key=lambda r: r.index_id):
+        rows = list(rows)
+        if format == 'columnar':
+            _, _, _, ymd, open_, high, low, close, volume = zip(*rows)
+            ohlcv = {
+                'ymd': list(ymd),
+                'open': _round_column(open_),
+                'high': _round_column(high),
+                'low': _round_column(low),
+                'close': _round_column(close),
+                'volume': list(volume),
+            }
+        else:
+            ohlcv = [
+                {'ymd': r.ymd, 'open': r.open, 'high': r.high, 'low': r.low, 'close': r.close, 'volume': r.volume}
+                for r in rows
+            ]
         result.append({
-            **meta[idx],
-            'ohlcv': ohlcv_list
+            'index_id': idx,
+            'name': rows[0].name,
+            'description': rows[0].description,
+            'ohlcv': ohlcv
         })
 
     if not result:
@@ -124,4 +158,5 @@ def get_index_detail_all(n_days: int = Query(30, ge=1, le=365), db: Session = De
         raise HTTPException(status_code=404, detail='No results found')
     logger.info(f'Index detail found for index_all, count={len(result)}')
 
-    return result
\ No newline at end of file
+    market_cache.set(cache_key, result, generation=generation)
+    return result
@@ -1,10 +1,13 @@
 import logging
 logger = logging.getLogger('app.api')
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from app.db.database import SessionLocal
+from app.db.database import get_async_db, get_async_read_db
+from app.core.cache import market_cache
+from app.core.http_cache import load_etag, etag_matches, not_modified, set_etag
 from app.db.models.sector_info import SectorInfo
 from app.db.models.stock_sector_relation import StockSectorRelation
 from app.db.models.stock_info import StockInfo
@@ -13,23 +16,32 @@ from app.schemas.sector_detail import SectorDetailResponse
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.get("/sectors", response_model=List[SectorInfoResponse])
-def read_sectors(db: Session = Depends(get_db)):
-    sectors = db.query(SectorInfo).order_by(SectorInfo.change_rate.desc()).all()
+async def read_sectors(request: Request, response: Response, db: AsyncSession = Depends(get_async_read_db)):
+    etag = await load_etag(
+        db, 'sectors:etag',
+        select(func.max(SectorInfo.mod_date), func.count()).select_from(SectorInfo),
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    cached = market_cache.get('sectors')
+    if cached is not None:
+        return cached
+    # 조회 도중 크롤링이 끝나 무효화되면 이전 데이터이므로 저장하지 않음
+    generation = market_cache.generation()
+    result = await db.execute(select(SectorInfo).order_by(SectorInfo.change_rate.desc()))
+    sectors = result.scalars().all()
     if not sectors:
         raise HTTPException(status_code=404, detail="Sectors not found")
-    return sectors
+    sectors_response = [SectorInfoResponse.model_validate(s) for s in sectors]
+    market_cache.set('sectors', sectors_response, generation=generation)
+    return sectors_response
 
 @router.get('/sector/{sector_code}')
-def get_sector(sector_code: str, db: Session = Depends(get_db)):
-    sector = db.query(SectorInfo).filter(SectorInfo.sector_code == sector_code).first()
+async def get_sector(sector_code: str, db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(select(SectorInfo).filter(SectorInfo.sector_code == sector_code))
+    sector = result.scalars().first()
     if not sector:
         logger.warning(f'Sector not found: {sector_code}')
         raise HTTPException(status_code=404, detail='Sector not found')
@@ -37,12 +49,14 @@ def get_sector(sector_code: str, db: Session = Depends(get_db)):
     return sector
 
 @router.get('/sector/{sector_code}/stocks')
-def get_sector_stocks(sector_code: str, db: Session = Depends(get_db)):
-    sector = db.query(SectorInfo).filter(SectorInfo.sector_code == sector_code).first()
+async def get_sector_stocks(sector_code: str, db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(select(SectorInfo).filter(SectorInfo.sector_code == sector_code))
+    sector = result.scalars().first()
     if not sector:
         logger.warning(f'Sector not found: {sector_code}')
         raise HTTPException(status_code=404, detail='Sector not found')
-    relations = db.query(StockSectorRelation).filter(StockSectorRelation.sector_id == sector.id).all()
+    result = await db.execute(select(StockSectorRelation).filter(StockSectorRelation.sector_id == sector.id))
+    relations = result.scalars().all()
     if not relations:
         logger.warning(f'No stock-sector relations for sector: {sector_code}')
         raise HTTPException(status_code=404, detail='No stock-sector relations found')
@@ -50,9 +64,27 @@ def get_sector_stocks(sector_code: str, db: Session = Depends(get_db)):
     return relations
 
 @router.get("/sectors/{sector_id}", response_model=list[SectorDetailResponse])
-def read_sector_detail(sector_id: int, db: Session = Depends(get_db)):
-    results = (
-        db.query(
+async def read_sector_detail(sector_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_read_db)):
+    cache_key = f'sector_detail:{sector_id}'
+    etag = await load_etag(
+        db, f'{cache_key}:etag',
+        # 응답에 조인되는 종목명/업종명이 바뀌어도 ETag가 달라지도록 함께 집계
+        select(func.max(StockSectorRelation.mod_date), func.max(StockInfo.mod_date), func.max(SectorInfo.mod_date), func.count())
+        .select_from(StockSectorRelation)
+        .join(StockInfo, StockSectorRelation.stock_id == StockInfo.id)
+        .join(SectorInfo, StockSectorRelation.sector_id == SectorInfo.id)
+        .filter(StockSectorRelation.sector_id == sector_id),
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    cached = market_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    # 조회 도중 크롤링이 끝나 무효화되면 이전 데이터이므로 저장하지 않음
+    generation = market_cache.generation()
+    stmt = (
+        select(
             StockSectorRelation.stock_id,
             StockInfo.ticker,
             StockInfo.name,
@@ -70,10 +102,12 @@ def read_sector_detail(sector_id: int, db: Session = Depends(get_db)):
         .join(StockInfo, StockSectorRelation.stock_id == StockInfo.id)
         .join(SectorInfo, StockSectorRelation.sector_id == SectorInfo.id)
         .filter(StockSectorRelation.sector_id == sector_id)
-        .all()
     )
+    results = (await db.execute(stmt)).all()
     if not results:
         logger.warning(f'No results found for sector: {sector_id}')
         raise HTTPException(status_code=404, detail='No results found')
     logger.info(f'Sector detail found for sector: {sector_id}, count={len(results)}')
-    return [SectorDetailResponse(**dict(r._mapping)) for r in results]
\ No newline at end of file
+    detail_response = [SectorDetailResponse(**dict(r._mapping)) for r in results]
+    market_cache.set(cache_key, detail_response, generation=generation)
+    return detail_response
@@ -0,0 +1,80 @@
+import logging
+logger = logging.getLogger('app.api')
+
+from fastapi import APIRouter, Depends, Query, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, Union
+from datetime import date
+from app.db.database import get_async_read_db
+from app.db.models.stock_info import StockInfo
+from app.db.models.stock_ohlcv import StockOhlcv
+from app.schemas.stock_ohlcv import StockOhlcvResponse, StockOhlcvPageResponse, StockOhlcvCompactResponse
+
+router = APIRouter()
+
+OHLCV_COLUMNS = [
+    'ymd', 'open', 'high', 'low', 'close', 'volume', 'change_rate', 'trading_value',
+    'trading_value_institution', 'trading_value_other_corporation', 'trading_value_individual', 'trading_value_foreign',
+    'volume_institution', 'volume_other_corporation', 'volume_individual', 'volume_foreign',
+]
+
+def _to_json_value(value):
+    if value is None or isinstance(value, (int, str)):
+        return value
+    if isinstance(value, date):
+        return value.isoformat()
+    return float(value)
+
+@router.get("/stocks/{ticker}/ohlcv", response_model=Union[StockOhlcvPageResponse, StockOhlcvCompactResponse])
+async def get_stock_ohlcv(
+    ticker: str,
+    from_date: Optional[date] = Query(None, alias='from', description="시작일 (포함)"),
+    to_date: Optional[date] = Query(None, alias='to', description="종료일 (포함)"),
+    limit: int = Query(500, ge=1, le=5000, description="최대 행 수"),
+    cursor: Optional[date] = Query(None, description="이전 응답의 next_cursor"),
+    order: str = Query('asc', pattern='^(asc|desc)$', description="일자 정렬 방향"),
+    format: str = Query('rows', pattern='^(rows|compact)$', description="rows: 객체 목록, compact: 배열의 배열"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    stock = (await db.execute(select(StockInfo.id, StockInfo.name).filter(StockInfo.ticker == ticker))).first()
+    if not stock:
+        logger.warning(f'Stock not found: {ticker}')
+        raise HTTPException(status_code=404, detail='Stock not found')
+
+    # PK(stock_id, ymd, ticker) 범위 스캔 + ymd 기준 keyset 페이지네이션
+    stmt = select(*[getattr(StockOhlcv, col) for col in OHLCV_COLUMNS]).filter(StockOhlcv.stock_id == stock.id)
+    if from_date:
+        stmt = stmt.filter(StockOhlcv.ymd >= from_date)
+    if to_date:
+        stmt = stmt.filter(StockOhlcv.ymd <= to_date)
+    if order == 'asc':
+        if cursor:
+            stmt = stmt.filter(StockOhlcv.ymd > cursor)
+        stmt = stmt.order_by(StockOhlcv.ymd.asc())
+    else:
+        if cursor:
+            stmt = stmt.filter(StockOhlcv.ymd < cursor)
+        stmt = stmt.order_by(StockOhlcv.ymd.desc())
+    rows = (await db.execute(stmt.limit(limit + 1))).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = rows[-1].ymd
+    logger.info(f'Stock ohlcv found for ticker: {ticker}, count={len(rows)}')
+
+    if format == 'compact':
+        return StockOhlcvCompactResponse(
+            ticker=ticker,
+            name=stock.name,
+            columns=OHLCV_COLUMNS,
+            data=[[_to_json_value(v) for v in r] for r in rows],
+            next_cursor=next_cursor,
+        )
+    return StockOhlcvPageResponse(
+        ticker=ticker,
+        name=stock.name,
+        items=[StockOhlcvResponse.model_validate(r) for r in rows],
+        next_cursor=next_cursor,
+    )
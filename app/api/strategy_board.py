@@ -4,8 +4,8 @@ from sqlalchemy import and_, or_, desc, asc, func
 from typing import List, Optional
 import logging
 
-from app.db.database import SessionLocal
-from app.db.models.user import User
+from app.db.database import SessionLocal, get_read_db
+from app.service.auth.user_cache import AuthUser
 from app.db.models.strategy_post import StrategyPost
 from app.db.models.strategy_comment import StrategyComment
 from app.db.models.strategy_attachment import StrategyAttachment
@@ -15,9 +15,22 @@ from app.schemas.board import (
     PostListRequest, PostCreateRequest, PostUpdateRequest,
     PostListResponse, PostDetailResponse, PaginatedResponse,
     CommentCreateRequest, CommentUpdateRequest, CommentResponse,
-    LikeResponse, SortOrder
+    LikeResponse, SortOrder, SearchResultResponse, SearchResponse, CommentPageResponse
 )
 from app.api.auth import get_current_user
+from app.service.board.viewer_state import load_liked_ids
+from app.service.board.pagination import (
+    sort_keys, order_by_keys, keyset_filter, encode_cursor, decode_cursor, join_hot_scores
+)
+from app.service.board.search import (
+    MIN_QUERY_LENGTH, match_condition, rank_expr, keyset_after, encode_search_cursor, highlight, snippet
+)
+from app.service.board.likes import toggle_like
+from app.service.board.comments import assign_path, load_threads, load_replies, build_tree
+from app.service.board.detail_cache import (
+    get_detail, store_detail, invalidate_detail, recently_written, apply_viewer_state
+)
+from app.core.cache import board_count_cache
 
 logger = logging.getLogger('app.api')
 router = APIRouter(prefix="/strategy-board", tags=["전략게시판"])
@@ -29,6 +42,25 @@ def get_db():
     finally:
         db.close()
 
+def _comment_response(comment, liked_ids, more_replies=None):
+    more_replies = more_replies or {}
+    return CommentResponse(
+        id=comment.id,
+        content=comment.content,
+        depth=comment.depth,
+        parent_id=comment.parent_id,
+        user_id=comment.user.id,
+        user_nickname=comment.user.nickname,
+        user_profile_img=comment.user.profile_img,
+        like_count=comment.like_count or 0,
+        is_liked=comment.id in liked_ids,
+        crt_date=comment.crt_date,
+        mod_date=comment.mod_date,
+        children=[],
+        has_more_replies=comment.id in more_replies,
+        replies_cursor=more_replies.get(comment.id)
+    )
+
 # 게시글 목록 조회
 @router.get("/posts", response_model=PaginatedResponse)
 def get_strategy_posts(
@@ -36,46 +68,61 @@ def get_strategy_posts(
     size: int = Query(10, ge=1, le=100, description="페이지 크기"),
     search: Optional[str] = Query(None, description="검색어"),
     sort: SortOrder = Query(SortOrder.LATEST, description="정렬 기준"),
-    current_user: Optional[User] = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 page 무시)"),
+    current_user: Optional[AuthUser] = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    read_db: Session = Depends(get_read_db)
 ):
     """전략게시판 게시글 목록 조회"""
     
-    # 기본 쿼리
-    query = db.query(StrategyPost).options(
+    # 기본 쿼리 (복제본)
+    query = read_db.query(StrategyPost).options(
         joinedload(StrategyPost.user)
     )
     
-    # 검색 조건
-    if search:
+    # 검색 조건 (2글자 이상은 search_vector 인덱스, 1글자는 기존 부분 문자열 검색)
+    if search and len(search) >= MIN_QUERY_LENGTH:
+        query = query.filter(match_condition(StrategyPost, search))
+    elif search:
         search_filter = or_(
             StrategyPost.title.contains(search),
             StrategyPost.content.contains(search)
         )
         query = query.filter(search_filter)
     
-    # 정렬
-    if sort == SortOrder.LATEST:
-        query = query.order_by(desc(StrategyPost.crt_date))
-    elif sort == SortOrder.OLDEST:
-        query = query.order_by(asc(StrategyPost.crt_date))
-    elif sort == SortOrder.VIEWS:
-        query = query.order_by(desc(StrategyPost.view_count))
-    elif sort == SortOrder.LIKES:
-        query = query.order_by(desc(StrategyPost.like_count))
-    elif sort == SortOrder.COMMENTS:
-        query = query.order_by(desc(StrategyPost.comment_count))
-    
-    # 공지사항 먼저 표시
-    query = query.order_by(desc(StrategyPost.is_notice))
-    
-    # 전체 개수
-    total = query.count()
+    # 인기순은 점수 테이블과 조인 (최근 활동으로 점수가 매겨진 게시글만)
+    if sort == SortOrder.HOT:
+        query = join_hot_scores(query, StrategyPost, 'strategy')
+    
+    # 전체 개수 (정렬 범위/검색어별 캐시, 게시글 작성/수정/삭제 시 무효화)
+    scope = 'hot' if sort == SortOrder.HOT else 'all'
+    count_key = f"board_count:strategy:{scope}:{search or ''}"
+    total = board_count_cache.get(count_key)
+    if total is None:
+        total = query.count()
+        board_count_cache.set(count_key, total)
+    
+    # 정렬: 공지사항 먼저, 정렬 컬럼, id (ix_*_notice_crt_date 인덱스 순서와 일치, 인기순은 점수, id)
+    keys = sort_keys(StrategyPost, sort)
+    query = order_by_keys(query, keys)
+    
+    # 페이징: 커서가 있으면 keyset, 없으면 기존 page/size
+    if cursor:
+        try:
+            query = query.filter(keyset_filter(keys, decode_cursor(cursor, keys)))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+    else:
+        query = query.offset((page - 1) * size)
+    posts = query.limit(size + 1).all()
+    has_next = len(posts) > size
+    posts = posts[:size]
     
-    # 페이징
-    posts = query.offset((page - 1) * size).limit(size).all()
+    # 사용자별 좋아요 상태 (페이지 전체를 한 번에 조회)
+    liked_ids = load_liked_ids(
+        db, current_user.id if current_user else None, {'strategy': [post.id for post in posts]}
+    )['strategy']
     
-    # 사용자별 좋아요 상태 확인
     post_list = []
     for post in posts:
         post_dict = {
@@ -89,23 +136,11 @@ def get_strategy_posts(
             "like_count": post.like_count,
             "comment_count": post.comment_count,
             "is_notice": post.is_notice,
-            "is_liked": False,
+            "is_liked": post.id in liked_ids,
             "crt_date": post.crt_date,
             "mod_date": post.mod_date
         }
         
-        # 현재 사용자의 좋아요 상태 확인
-        if current_user:
-            like = db.query(PostLike).filter(
-                and_(
-                    PostLike.post_type == 'strategy',
-                    PostLike.post_id == post.id,
-                    PostLike.user_id == current_user.id,
-                    PostLike.is_active == True
-                )
-            ).first()
-            post_dict["is_liked"] = like is not None
-        
         post_list.append(PostListResponse(**post_dict))
     
     total_pages = (total + size - 1) // size
@@ -113,30 +148,133 @@ def get_strategy_posts(
     return PaginatedResponse(
         items=post_list,
         total=total,
-        page=page,
+        page=None if cursor else page,
         size=size,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=encode_cursor(posts[-1], keys) if has_next else None
     )
 
+# 게시글 검색
+@router.get("/search", response_model=SearchResponse)
+def search_strategy_posts(
+    q: str = Query(..., min_length=MIN_QUERY_LENGTH, max_length=100, description="검색어"),
+    size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    current_user: Optional[AuthUser] = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    read_db: Session = Depends(get_read_db)
+):
+    """전략게시판 게시글 검색 (관련도순, 제목 가중치가 본문보다 높음)"""
+    
+    rank = rank_expr(StrategyPost, q)
+    query = read_db.query(StrategyPost, rank).options(
+        joinedload(StrategyPost.user)
+    ).filter(match_condition(StrategyPost, q))
+    
+    if cursor:
+        try:
+            query = query.filter(keyset_after(StrategyPost, rank, cursor))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+    
+    rows = query.order_by(rank.desc(), StrategyPost.id.desc()).limit(size + 1).all()
+    has_next = len(rows) > size
+    rows = rows[:size]
+    
+    liked_ids = load_liked_ids(
+        db, current_user.id if current_user else None, {'strategy': [post.id for post, _ in rows]}
+    )['strategy']
+    
+    items = []
+    for post, score in rows:
+        items.append(SearchResultResponse(
+            id=post.id,
+            title=post.title,
+            content_preview=post.content[:100] + "..." if len(post.content) > 100 else post.content,
+            user_id=post.user.id,
+            user_nickname=post.user.nickname,
+            user_profile_img=post.user.profile_img,
+            view_count=post.view_count,
+            like_count=post.like_count,
+            comment_count=post.comment_count,
+            is_notice=post.is_notice,
+            is_liked=post.id in liked_ids,
+            crt_date=post.crt_date,
+            mod_date=post.mod_date,
+            score=score,
+            title_highlight=highlight(post.title, q),
+            snippet=snippet(post.content, q)
+        ))
+    
+    next_cursor = None
+    if has_next:
+        last_post, last_score = rows[-1]
+        next_cursor = encode_search_cursor(last_score, last_post.id)
+    
+    return SearchResponse(items=items, size=size, next_cursor=next_cursor)
+
 # 게시글 상세 조회
 @router.get("/posts/{post_id}", response_model=PostDetailResponse)
 def get_strategy_post(
     post_id: int,
-    current_user: Optional[User] = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Optional[AuthUser] = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    read_db: Session = Depends(get_read_db)
 ):
     """전략게시판 게시글 상세 조회"""
     
-    post = db.query(StrategyPost).options(
-        joinedload(StrategyPost.user),
-        joinedload(StrategyPost.attachments),
-        joinedload(StrategyPost.comments).joinedload(StrategyComment.user)
-    ).filter(StrategyPost.id == post_id).first()
-    
-    if not post:
-        raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
+    # 사용자 공통 부분은 캐시, 없으면 게시글/댓글을 복제본에서 조회
+    detail = get_detail('strategy', post_id)
+    if detail is None:
+        # 방금 수정/댓글 작성된 게시글은 복제본 지연으로 이전 상태가 다시 캐시되지 않도록 primary에서 조회
+        source_db = db if recently_written('strategy', post_id) else read_db
+        post = source_db.query(StrategyPost).options(
+            joinedload(StrategyPost.user),
+            joinedload(StrategyPost.attachments)
+        ).filter(StrategyPost.id == post_id).first()
+        
+        if not post:
+            raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
+        
+        # 첫 페이지 루트 댓글 스레드 (스레드별 답글 수 제한, 트리 순서)
+        thread_comments, more_replies, comments_next_cursor = load_threads(source_db, StrategyComment, post_id)
+        
+        # 댓글 트리 구조 생성 (좋아요 여부는 아래에서 사용자별로 덮어씀)
+        comments = build_tree(thread_comments, lambda comment: _comment_response(comment, (), more_replies))
+        
+        # 첨부파일 정보
+        attachments = []
+        for attachment in post.attachments:
+            attachments.append({
+                "id": attachment.id,
+                "filename": attachment.file_name,
+                "original_filename": attachment.original_name,
+                "file_size": attachment.file_size,
+                "file_path": attachment.file_path,
+                "crt_date": attachment.crt_date
+            })
+        
+        detail = PostDetailResponse(
+            id=post.id,
+            title=post.title,
+            content=post.content,
+            user_id=post.user.id,
+            user_nickname=post.user.nickname,
+            user_profile_img=post.user.profile_img,
+            view_count=post.view_count,
+            like_count=post.like_count,
+            comment_count=post.comment_count,
+            is_notice=post.is_notice,
+            is_liked=False,
+            crt_date=post.crt_date,
+            mod_date=post.mod_date,
+            attachments=attachments,
+            comments=comments,
+            comments_next_cursor=comments_next_cursor
+        )
+        store_detail('strategy', detail, from_replica=source_db is read_db)
     
-    # 조회수 증가 (로그인한 사용자만)
+    # 조회수 증가 (로그인한 사용자만, 조회 기록은 primary)
     if current_user:
         # 중복 조회 방지
         existing_view = db.query(PostView).filter(
@@ -156,96 +294,14 @@ def get_strategy_post(
             db.add(view)
             db.commit()
     
-    # 사용자 좋아요 상태 확인
-    is_liked = False
-    if current_user:
-        like = db.query(PostLike).filter(
-            and_(
-                PostLike.post_type == 'strategy',
-                PostLike.post_id == post_id,
-                PostLike.user_id == current_user.id,
-                PostLike.is_active == True
-            )
-        ).first()
-        is_liked = like is not None
-    
-    # 댓글 트리 구조 생성
-    comments = []
-    comment_dict = {}
-    
-    for comment in post.comments:
-        comment_data = {
-            "id": comment.id,
-            "content": comment.content,
-            "depth": comment.depth,
-            "parent_id": comment.parent_id,
-            "user_id": comment.user.id,
-            "user_nickname": comment.user.nickname,
-            "user_profile_img": comment.user.profile_img,
-            "like_count": comment.like_count,
-            "is_liked": False,
-            "crt_date": comment.crt_date,
-            "mod_date": comment.mod_date,
-            "children": []
-        }
-        
-        # 댓글 좋아요 상태 확인
-        if current_user:
-            comment_like = db.query(PostLike).filter(
-                and_(
-                    PostLike.post_type == 'strategy_comment',
-                    PostLike.post_id == comment.id,
-                    PostLike.user_id == current_user.id,
-                    PostLike.is_active == True
-                )
-            ).first()
-            comment_data["is_liked"] = comment_like is not None
-        
-        comment_dict[comment.id] = CommentResponse(**comment_data)
-    
-    # 트리 구조 생성
-    for comment_id, comment in comment_dict.items():
-        if comment.parent_id is None:
-            comments.append(comment)
-        else:
-            if comment.parent_id in comment_dict:
-                comment_dict[comment.parent_id].children.append(comment)
-    
-    # 첨부파일 정보
-    attachments = []
-    for attachment in post.attachments:
-        attachments.append({
-            "id": attachment.id,
-            "filename": attachment.filename,
-            "original_filename": attachment.original_filename,
-            "file_size": attachment.file_size,
-            "file_path": attachment.file_path,
-            "crt_date": attachment.crt_date
-        })
-    
-    return PostDetailResponse(
-        id=post.id,
-        title=post.title,
-        content=post.content,
-        user_id=post.user.id,
-        user_nickname=post.user.nickname,
-        user_profile_img=post.user.profile_img,
-        view_count=post.view_count,
-        like_count=post.like_count,
-        comment_count=post.comment_count,
-        is_notice=post.is_notice,
-        is_liked=is_liked,
-        crt_date=post.crt_date,
-        mod_date=post.mod_date,
-        attachments=attachments,
-        comments=comments
-    )
+    # 사용자 좋아요 상태 (게시글 + 불러온 댓글을 한 번에 조회해 덮어씀)
+    return apply_viewer_state(db, current_user.id if current_user else None, 'strategy', detail)
 
 # 게시글 작성
 @router.post("/posts", response_model=PostDetailResponse, status_code=status.HTTP_201_CREATED)
 def create_strategy_post(
     post_data: PostCreateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """전략게시판 게시글 작성"""
@@ -269,6 +325,7 @@ def create_strategy_post(
     
     db.add(post)
     db.commit()
+    board_count_cache.invalidate_prefix('board_count:strategy:')
     db.refresh(post)
     
     # 작성자 정보 로드
@@ -297,7 +354,7 @@ def create_strategy_post(
 def update_strategy_post(
     post_id: int,
     post_data: PostUpdateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """전략게시판 게시글 수정"""
@@ -319,6 +376,8 @@ def update_strategy_post(
         post.is_notice = post_data.is_notice
     
     db.commit()
+    board_count_cache.invalidate_prefix('board_count:strategy:')
+    invalidate_detail('strategy', post_id)
     db.refresh(post)
     db.refresh(post.user)
     
@@ -344,7 +403,7 @@ def update_strategy_post(
 @router.delete("/posts/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_strategy_post(
     post_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """전략게시판 게시글 삭제"""
@@ -359,13 +418,68 @@ def delete_strategy_post(
     
     db.delete(post)
     db.commit()
+    board_count_cache.invalidate_prefix('board_count:strategy:')
+    invalidate_detail('strategy', post_id)
+
+# 루트 댓글 스레드 추가 조회 (상세 응답의 comments_next_cursor 이후)
+@router.get("/posts/{post_id}/comments", response_model=CommentPageResponse)
+def list_strategy_comments(
+    post_id: int,
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    current_user: Optional[AuthUser] = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    read_db: Session = Depends(get_read_db)
+):
+    """전략게시판 댓글 스레드 목록"""
+    
+    try:
+        thread_comments, more_replies, next_cursor = load_threads(read_db, StrategyComment, post_id, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+    
+    liked_ids = load_liked_ids(
+        db, current_user.id if current_user else None,
+        {'strategy_comment': [comment.id for comment in thread_comments]}
+    )
+    items = build_tree(
+        thread_comments,
+        lambda comment: _comment_response(comment, liked_ids['strategy_comment'], more_replies)
+    )
+    return CommentPageResponse(items=items, next_cursor=next_cursor)
+
+# 답글 추가 조회 (comment_id 하위 트리, 트리 순서)
+@router.get("/comments/{comment_id}/replies", response_model=CommentPageResponse)
+def list_strategy_comment_replies(
+    comment_id: int,
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (없으면 처음부터)"),
+    current_user: Optional[AuthUser] = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    read_db: Session = Depends(get_read_db)
+):
+    """전략게시판 답글 목록"""
+    
+    parent = read_db.query(StrategyComment).filter(StrategyComment.id == comment_id).first()
+    if not parent:
+        raise HTTPException(status_code=404, detail="댓글을 찾을 수 없습니다.")
+    
+    try:
+        replies, next_cursor = load_replies(read_db, StrategyComment, parent, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+    
+    liked_ids = load_liked_ids(
+        db, current_user.id if current_user else None,
+        {'strategy_comment': [comment.id for comment in replies]}
+    )
+    items = build_tree(replies, lambda comment: _comment_response(comment, liked_ids['strategy_comment']))
+    return CommentPageResponse(items=items, next_cursor=next_cursor)
 
 # 댓글 작성
 @router.post("/posts/{post_id}/comments", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
 def create_strategy_comment(
     post_id: int,
     comment_data: CommentCreateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """전략게시판 댓글 작성"""
@@ -376,6 +490,7 @@ def create_strategy_comment(
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
     
     # 부모 댓글 확인 (대댓글인 경우)
+    parent_comment = None
     if comment_data.parent_id:
         parent_comment = db.query(StrategyComment).filter(
             and_(
@@ -392,9 +507,12 @@ def create_strategy_comment(
         post_id=post_id,
         user_id=current_user.id
     )
+    # id/path/depth를 미리 채워 부모 조회 없이 INSERT
+    assign_path(db, StrategyComment, comment, parent_comment)
     
     db.add(comment)
     db.commit()
+    invalidate_detail('strategy', post_id)
     db.refresh(comment)
     db.refresh(comment.user)
     
@@ -418,7 +536,7 @@ def create_strategy_comment(
 def update_strategy_comment(
     comment_id: int,
     comment_data: CommentUpdateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """전략게시판 댓글 수정"""
@@ -435,6 +553,7 @@ def update_strategy_comment(
     db.commit()
     db.refresh(comment)
     db.refresh(comment.user)
+    invalidate_detail('strategy', comment.post_id)
     
     return CommentResponse(
         id=comment.id,
@@ -455,7 +574,7 @@ def update_strategy_comment(
 @router.delete("/comments/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_strategy_comment(
     comment_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """전략게시판 댓글 삭제"""
@@ -468,57 +587,42 @@ def delete_strategy_comment(
     if comment.user_id != current_user.id and not current_user.is_superuser:
         raise HTTPException(status_code=403, detail="댓글을 삭제할 권한이 없습니다.")
     
+    post_id = comment.post_id
     db.delete(comment)
     db.commit()
+    invalidate_detail('strategy', post_id)
 
 # 게시글 좋아요/취소
 @router.post("/posts/{post_id}/like", response_model=LikeResponse)
 def toggle_strategy_post_like(
     post_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """전략게시판 게시글 좋아요/취소"""
     
-    # 게시글 존재 확인
-    post = db.query(StrategyPost).filter(StrategyPost.id == post_id).first()
-    if not post:
+    # 좋아요 upsert/반전과 like_count 갱신을 한 문장으로 처리 (게시글이 없으면 None)
+    result = toggle_like(db, 'strategy', post_id, current_user.id)
+    if result is None:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
+    db.commit()
     
-    # 기존 좋아요 확인 (is_active 상태와 관계없이)
-    existing_like = db.query(PostLike).filter(
-        and_(
-            PostLike.post_type == 'strategy',
-            PostLike.post_id == post_id,
-            PostLike.user_id == current_user.id
-        )
-    ).first()
-    
-    if existing_like:
-        # 기존 좋아요가 있는 경우 토글
-        if existing_like.is_active:
-            # 현재 활성화된 상태면 비활성화 (좋아요 취소)
-            existing_like.is_active = False
-            is_liked = False
-        else:
-            # 현재 비활성화된 상태면 활성화 (좋아요 재활성화)
-            existing_like.is_active = True
-            is_liked = True
-    else:
-        # 기존 좋아요가 없는 경우 새로 생성
-        new_like = PostLike(
-            post_type='strategy',
-            post_id=post_id,
-            user_id=current_user.id,
-            is_active=True
-        )
-        db.add(new_like)
-        is_liked = True
+    is_liked, like_count = result
+    return LikeResponse(is_liked=is_liked, like_count=like_count)
+
+# 댓글 좋아요/취소
+@router.post("/comments/{comment_id}/like", response_model=LikeResponse)
+def toggle_strategy_comment_like(
+    comment_id: int,
+    current_user: AuthUser = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """전략게시판 댓글 좋아요/취소"""
     
+    result = toggle_like(db, 'strategy_comment', comment_id, current_user.id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="댓글을 찾을 수 없습니다.")
     db.commit()
     
-    # 이벤트 리스너가 자동으로 like_count를 업데이트하므로 
-    # 업데이트된 게시글 정보를 다시 조회
-    db.refresh(post)
-    
-    return LikeResponse(is_liked=is_liked, like_count=post.like_count) 
\ No newline at end of file
+    is_liked, like_count = result
+    return LikeResponse(is_liked=is_liked, like_count=like_count)
@@ -1,10 +1,13 @@
 import logging
 logger = logging.getLogger('app.api')
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from app.db.database import SessionLocal
+from app.db.database import get_async_db, get_async_read_db
+from app.core.cache import market_cache
+from app.core.http_cache import load_etag, etag_matches, not_modified, set_etag
 from app.db.models.theme_info import ThemeInfo
 from app.db.models.stock_theme_relation import StockThemeRelation
 from app.db.models.stock_info import StockInfo
@@ -13,23 +16,32 @@ from app.schemas.theme_detail import ThemeDetailResponse
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.get("/themes", response_model=List[ThemeInfoResponse])
-def read_themes(db: Session = Depends(get_db)):
-    themes = db.query(ThemeInfo).order_by(ThemeInfo.change_rate.desc()).all()
+async def read_themes(request: Request, response: Response, db: AsyncSession = Depends(get_async_read_db)):
+    etag = await load_etag(
+        db, 'themes:etag',
+        select(func.max(ThemeInfo.mod_date), func.count()).select_from(ThemeInfo),
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    cached = market_cache.get('themes')
+    if cached is not None:
+        return cached
+    # 조회 도중 크롤링이 끝나 무효화되면 이전 데이터이므로 저장하지 않음
+    generation = market_cache.generation()
+    result = await db.execute(select(ThemeInfo).order_by(ThemeInfo.change_rate.desc()))
+    themes = result.scalars().all()
     if not themes:
         raise HTTPException(status_code=404, detail="Themes not found")
-    return themes
+    themes_response = [ThemeInfoResponse.model_validate(t) for t in themes]
+    market_cache.set('themes', themes_response, generation=generation)
+    return themes_response
 
 @router.get('/theme/{theme_code}')
-def get_theme(theme_code: str, db: Session = Depends(get_db)):
-    theme = db.query(ThemeInfo).filter(ThemeInfo.theme_code == theme_code).first()
+async def get_theme(theme_code: str, db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(select(ThemeInfo).filter(ThemeInfo.theme_code == theme_code))
+    theme = result.scalars().first()
     if not theme:
         logger.warning(f'Theme not found: {theme_code}')
         raise HTTPException(status_code=404, detail='Theme not found')
@@ -37,12 +49,14 @@ def get_theme(theme_code: str, db: Session = Depends(get_db)):
     return theme
 
 @router.get('/theme/{theme_code}/stocks')
-def get_theme_stocks(theme_code: str, db: Session = Depends(get_db)):
-    theme = db.query(ThemeInfo).filter(ThemeInfo.theme_code == theme_code).first()
+async def get_theme_stocks(theme_code: str, db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(select(ThemeInfo).filter(ThemeInfo.theme_code == theme_code))
+    theme = result.scalars().first()
     if not theme:
         logger.warning(f'Theme not found: {theme_code}')
         raise HTTPException(status_code=404, detail='Theme not found')
-    relations = db.query(StockThemeRelation).filter(StockThemeRelation.theme_id == theme.id).all()
+    result = await db.execute(select(StockThemeRelation).filter(StockThemeRelation.theme_id == theme.id))
+    relations = result.scalars().all()
     if not relations:
         logger.warning(f'No stock-theme relations for theme: {theme_code}')
         raise HTTPException(status_code=404, detail='No stock-theme relations found')
@@ -50,9 +64,27 @@ def get_theme_stocks(theme_code: str, db: Session = Depends(get_db)):
     return relations
 
 @router.get("/themes/{theme_id}", response_model=list[ThemeDetailResponse])
-def read_theme_detail(theme_id: int, db: Session = Depends(get_db)):
-    results = (
-        db.query(
+async def read_theme_detail(theme_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_read_db)):
+    cache_key = f'theme_detail:{theme_id}'
+    etag = await load_etag(
+        db, f'{cache_key}:etag',
+        # 응답에 조인되는 종목명/테마명이 바뀌어도 ETag가 달라지도록 함께 집계
+        select(func.max(StockThemeRelation.mod_date), func.max(StockInfo.mod_date), func.max(ThemeInfo.mod_date), func.count())
+        .select_from(StockThemeRelation)
+        .join(StockInfo, StockThemeRelation.stock_id == StockInfo.id)
+        .join(ThemeInfo, StockThemeRelation.theme_id == ThemeInfo.id)
+        .filter(StockThemeRelation.theme_id == theme_id),
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    cached = market_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    # 조회 도중 크롤링이 끝나 무효화되면 이전 데이터이므로 저장하지 않음
+    generation = market_cache.generation()
+    stmt = (
+        select(
             StockThemeRelation.stock_id,
             StockInfo.ticker,
             StockInfo.name,
@@ -71,10 +103,12 @@ def read_theme_detail(theme_id: int, db: Session = Depends(get_db)):
         .join(StockInfo, StockThemeRelation.stock_id == StockInfo.id)
         .join(ThemeInfo, StockThemeRelation.theme_id == ThemeInfo.id)
         .filter(StockThemeRelation.theme_id == theme_id)
-        .all()
     )
+    results = (await db.execute(stmt)).all()
     if not results:
         logger.warning(f'No results found for theme: {theme_id}')
         raise HTTPException(status_code=404, detail='No results found')
     logger.info(f'Theme detail found for theme: {theme_id}, count={len(results)}')
-    return [ThemeDetailResponse(**dict(r._mapping)) for r in results]
\ No newline at end of file
+    detail_response = [ThemeDetailResponse(**dict(r._mapping)) for r in results]
+    market_cache.set(cache_key, detail_response, generation=generation)
+    return detail_response
@@ -3,3 +3,115 @@ from dotenv import load_dotenv
 
 load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL")
+
+def to_async_url(url):
+    # postgresql:// 또는 postgresql+psycopg2:// 를 asyncpg 드라이버 URL로 변환
+    if not url:
+        return url
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_url(DATABASE_URL)
+
+def _pool_config(name, pool_size, max_overflow, statement_timeout_ms):
+    # DB_POOL_<NAME>_SIZE 형식의 환경변수로 워크로드별 풀 설정을 덮어쓸 수 있음
+    prefix = f"DB_POOL_{name.upper()}_"
+    return {
+        'pool_size': int(os.getenv(prefix + 'SIZE', pool_size)),
+        'max_overflow': int(os.getenv(prefix + 'MAX_OVERFLOW', max_overflow)),
+        'pool_timeout': int(os.getenv(prefix + 'TIMEOUT', 30)),
+        'pool_recycle': int(os.getenv(prefix + 'RECYCLE', 1800)),
+        'pool_pre_ping': os.getenv(prefix + 'PRE_PING', 'true').lower() == 'true',
+        'statement_timeout_ms': int(os.getenv(prefix + 'STATEMENT_TIMEOUT_MS', statement_timeout_ms)),
+    }
+
+# 워크로드별 커넥션 풀 (api: 조회/게시판, batch: 스케줄러 작업, auth: 로그인/토큰, export: 대용량 내보내기)
+DB_POOLS = {
+    'api': _pool_config('api', pool_size=10, max_overflow=10, statement_timeout_ms=5000),
+    'batch': _pool_config('batch', pool_size=3, max_overflow=2, statement_timeout_ms=600000),
+    'auth': _pool_config('auth', pool_size=5, max_overflow=5, statement_timeout_ms=5000),
+    'export': _pool_config('export', pool_size=2, max_overflow=2, statement_timeout_ms=1800000),
+}
+
+# 읽기 전용 복제본 (콤마로 구분, 비어 있으면 모든 조회가 primary로 감)
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", 10))
+# 복제본 연결/지연 점검 주기(초, 스케줄러 작업으로 실행)
+REPLICA_HEALTH_CHECK_INTERVAL = float(os.getenv("REPLICA_HEALTH_CHECK_INTERVAL", 5))
+
+# 시세 조회 API 인메모리 캐시 (크롤링 완료 시 무효화)
+MARKET_CACHE_MAXSIZE = int(os.getenv("MARKET_CACHE_MAXSIZE", 512))
+MARKET_CACHE_TTL = int(os.getenv("MARKET_CACHE_TTL", 600))
+
+# 게시판 목록 전체 개수 캐시 (게시글 작성/수정/삭제 시 무효화)
+BOARD_COUNT_CACHE_MAXSIZE = int(os.getenv("BOARD_COUNT_CACHE_MAXSIZE", 1024))
+BOARD_COUNT_CACHE_TTL = int(os.getenv("BOARD_COUNT_CACHE_TTL", 60))
+
+# 게시글 상세 공유 캐시 (수정/삭제/댓글 작성 시 무효화, 조회수/좋아요 수는 TTL 동안 지연될 수 있음)
+POST_DETAIL_CACHE_MAXSIZE = int(os.getenv("POST_DETAIL_CACHE_MAXSIZE", 2048))
+POST_DETAIL_CACHE_TTL = int(os.getenv("POST_DETAIL_CACHE_TTL", 30))
+
+# 인기순 점수 (최근 HOT_SCORE_WINDOW_HOURS 동안의 활동, 반감기 HOT_SCORE_HALF_LIFE_HOURS로 감쇠)
+HOT_SCORE_INTERVAL_MINUTES = int(os.getenv("HOT_SCORE_INTERVAL_MINUTES", 10))
+HOT_SCORE_WINDOW_HOURS = int(os.getenv("HOT_SCORE_WINDOW_HOURS", 72))
+HOT_SCORE_HALF_LIFE_HOURS = float(os.getenv("HOT_SCORE_HALF_LIFE_HOURS", 12))
+
+# 인증 사용자 캐시 (닉네임/권한/비활성화 변경 시 무효화, 다른 프로세스에는 TTL 이후 반영)
+USER_CACHE_MAXSIZE = int(os.getenv("USER_CACHE_MAXSIZE", 10000))
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", 60))
+
+# 리프레시 토큰 조회 캐시 (토큰 해시 -> 계정/사용자 스냅샷, 재사용 여부는 로테이션 시 DB에서 다시 확인)
+REFRESH_TOKEN_CACHE_MAXSIZE = int(os.getenv("REFRESH_TOKEN_CACHE_MAXSIZE", 10000))
+REFRESH_TOKEN_CACHE_TTL = int(os.getenv("REFRESH_TOKEN_CACHE_TTL", 30))
+# 만료 리프레시 토큰 정리 (한 번에 지우는 행 수를 제한해 긴 잠금/WAL 폭증 방지)
+REFRESH_TOKEN_SWEEP_INTERVAL_MINUTES = int(os.getenv("REFRESH_TOKEN_SWEEP_INTERVAL_MINUTES", 60))
+REFRESH_TOKEN_SWEEP_BATCH_SIZE = int(os.getenv("REFRESH_TOKEN_SWEEP_BATCH_SIZE", 1000))
+
+# 비밀번호 해시(bcrypt) 전용 프로세스 풀 (대기 건수가 MAX_PENDING을 넘으면 429로 거절)
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", min(2, os.cpu_count() or 1)))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", 16))
+PASSWORD_HASH_TIMEOUT = float(os.getenv("PASSWORD_HASH_TIMEOUT", 10))
+PASSWORD_HASH_RETRY_AFTER = int(os.getenv("PASSWORD_HASH_RETRY_AFTER", 2))
+
+# 외부 API 호출용 공유 httpx.AsyncClient (앱 lifespan 동안 keep-alive 커넥션 재사용)
+HTTP_CLIENT_TIMEOUT = float(os.getenv("HTTP_CLIENT_TIMEOUT", 10))
+HTTP_CLIENT_MAX_CONNECTIONS = int(os.getenv("HTTP_CLIENT_MAX_CONNECTIONS", 50))
+HTTP_CLIENT_MAX_KEEPALIVE = int(os.getenv("HTTP_CLIENT_MAX_KEEPALIVE", 20))
+
+# 구글 id_token 서명 검증용 공개키(JWKS) 캐시 (응답의 Cache-Control max-age가 있으면 그 값을 사용)
+GOOGLE_JWKS_CACHE_TTL = int(os.getenv("GOOGLE_JWKS_CACHE_TTL", 3600))
+
+# 게시글 조회수/댓글 수 카운터 쓰기 병합 (반영 주기 = 비정상 종료 시 최대 유실 구간)
+COUNTER_FLUSH_INTERVAL = int(os.getenv("COUNTER_FLUSH_INTERVAL", 5))
+COUNTER_MAX_PENDING = int(os.getenv("COUNTER_MAX_PENDING", 10000))
+
+# OHLCV 대용량 내보내기 (서버 사이드 커서에서 한 번에 가져오는 행 수)
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 10000))
+# 동시 내보내기 수 (스트림마다 커넥션을 끝까지 점유하므로 export 풀 크기를 넘으면 429로 거절)
+EXPORT_MAX_CONCURRENT = int(os.getenv(
+    "EXPORT_MAX_CONCURRENT", DB_POOLS['export']['pool_size'] + DB_POOLS['export']['max_overflow']
+))
+EXPORT_RETRY_AFTER = int(os.getenv("EXPORT_RETRY_AFTER", 30))
+
+# tb_stock_ohlcv 연도별 파티션 (미리 만들어 둘 미래 연도 수, 보관 연수 - 0이면 분리하지 않음)
+OHLCV_PARTITION_YEARS_AHEAD = int(os.getenv("OHLCV_PARTITION_YEARS_AHEAD", 1))
+OHLCV_RETENTION_YEARS = int(os.getenv("OHLCV_RETENTION_YEARS", 0))
+OHLCV_ARCHIVE_SCHEMA = os.getenv("OHLCV_ARCHIVE_SCHEMA", "archive")
+
+# 네이버 금융 크롤링 (httpx로 직접 요청, 필요한 표가 없을 때만 Playwright로 렌더링)
+NAVER_CRAWL_TIMEOUT = float(os.getenv("NAVER_CRAWL_TIMEOUT", 10))
+NAVER_CRAWL_USER_AGENT = os.getenv(
+    "NAVER_CRAWL_USER_AGENT",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0 Safari/537.36",
+)
+# 상세 페이지 동시 요청 수, 같은 호스트 요청 간 최소 간격(초), 페이지당 제한 시간(재시도/브라우저 대체 포함)
+NAVER_CRAWL_CONCURRENCY = int(os.getenv("NAVER_CRAWL_CONCURRENCY", 4))
+NAVER_CRAWL_HOST_DELAY = float(os.getenv("NAVER_CRAWL_HOST_DELAY", 0.2))
+NAVER_CRAWL_PAGE_TIMEOUT = float(os.getenv("NAVER_CRAWL_PAGE_TIMEOUT", 30))
+# 429/5xx/네트워크 오류 재시도 횟수와 지수 백오프 기준(초)
+NAVER_CRAWL_RETRIES = int(os.getenv("NAVER_CRAWL_RETRIES", 2))
+NAVER_CRAWL_BACKOFF = float(os.getenv("NAVER_CRAWL_BACKOFF", 1.0))
+# 연속 실패가 이 횟수에 도달하면 이번 수집의 남은 요청을 중단 (차단/스로틀링 대응)
+NAVER_CRAWL_BREAKER_THRESHOLD = int(os.getenv("NAVER_CRAWL_BREAKER_THRESHOLD", 5))
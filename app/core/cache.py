@@ -0,0 +1,99 @@
+import threading
+import time
+from collections import OrderedDict
+from app.config import (
+    MARKET_CACHE_MAXSIZE, MARKET_CACHE_TTL, BOARD_COUNT_CACHE_MAXSIZE, BOARD_COUNT_CACHE_TTL,
+    POST_DETAIL_CACHE_MAXSIZE, POST_DETAIL_CACHE_TTL, USER_CACHE_MAXSIZE, USER_CACHE_TTL,
+    REFRESH_TOKEN_CACHE_MAXSIZE, REFRESH_TOKEN_CACHE_TTL,
+)
+
+_MISSING = object()
+
+
+class TTLCache:
+    """TTL 만료 + 크기 제한 LRU 캐시 (스레드 안전)
+
+    배치 작업은 스케줄러 스레드에서, 조회는 이벤트 루프에서 접근하므로 모든 연산을 락으로 보호한다.
+    """
+
+    def __init__(self, maxsize=256, ttl=600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING or entry[0] <= now:
+                if entry is not _MISSING:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def generation(self):
+        """무효화될 때마다 증가하는 세대 번호 (DB 조회 전에 읽어 두었다가 set에 넘김)"""
+        with self._lock:
+            return self._generation
+
+    def set(self, key, value, ttl=None, generation=None):
+        """generation을 넘기면 그 뒤로 무효화가 있었을 때는 저장하지 않음
+
+        무효화 이전에 읽은 값이 무효화 직후에 저장되어 TTL 동안 남는 것을 막는다.
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._generation += 1
+            self._data.pop(key, None)
+
+    def invalidate_prefix(self, prefix):
+        with self._lock:
+            self._generation += 1
+            for key in [k for k in self._data if k.startswith(prefix)]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            return {'size': len(self._data), 'maxsize': self.maxsize, 'hits': self.hits, 'misses': self.misses}
+
+
+# 테마/업종/지수 조회 결과 캐시
+# 키: 'themes', 'theme_detail:{id}', 'sectors', 'sector_detail:{id}', 'index_all:{n_days}'
+market_cache = TTLCache(maxsize=MARKET_CACHE_MAXSIZE, ttl=MARKET_CACHE_TTL)
+
+# 게시판 목록 전체 개수 캐시 (페이지를 넘길 때마다 count(*)를 다시 돌리지 않도록)
+# 키: 'board_count:{post_type}:{all|hot}:{검색어}'
+board_count_cache = TTLCache(maxsize=BOARD_COUNT_CACHE_MAXSIZE, ttl=BOARD_COUNT_CACHE_TTL)
+
+# 게시글 상세의 사용자 공통 부분 (좋아요 여부 제외, JSON 직렬화한 bytes)
+# 키: 'post_detail:{post_type}:{post_id}', 쓰기 직후 복제본 지연 구간 표시는 'post_detail:{post_type}:{post_id}:written'
+post_detail_cache = TTLCache(maxsize=POST_DETAIL_CACHE_MAXSIZE, ttl=POST_DETAIL_CACHE_TTL)
+
+# get_current_user가 쓰는 사용자 스냅샷 (app/service/auth/user_cache.py)
+# 키: 'user:{user_id}'
+user_cache = TTLCache(maxsize=USER_CACHE_MAXSIZE, ttl=USER_CACHE_TTL)
+
+# 리프레시 토큰 조회 결과 (app/service/auth/refresh_tokens.py)
+# 키: 'refresh_token:{토큰 해시}'
+refresh_token_cache = TTLCache(maxsize=REFRESH_TOKEN_CACHE_MAXSIZE, ttl=REFRESH_TOKEN_CACHE_TTL)
@@ -0,0 +1,43 @@
+import hashlib
+from fastapi import Request, Response
+from app.core.cache import market_cache
+
+
+def make_etag(*parts):
+    """데이터 버전 값들로 strong ETag 생성"""
+    digest = hashlib.sha1('|'.join(str(p) for p in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 현재 ETag와 일치하는지 (weak 비교)"""
+    header = request.headers.get('if-none-match')
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+    candidates = [tag.strip() for tag in header.split(',')]
+    return any(tag.removeprefix('W/') == etag for tag in candidates)
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={'ETag': etag, 'Cache-Control': 'no-cache'})
+
+
+def set_etag(response: Response, etag: str):
+    response.headers['ETag'] = etag
+    response.headers['Cache-Control'] = 'no-cache'
+
+
+async def load_etag(db, cache_key, version_stmt, *extra):
+    """max(mod_date), count(*) 등 버전 쿼리 결과로 ETag를 계산하고 크롤링 완료 전까지 캐시
+
+    버전 쿼리 도중 크롤링의 invalidate_prefix가 끝났다면 이전 버전이므로 캐시하지 않는다.
+    """
+    etag = market_cache.get(cache_key)
+    if etag is None:
+        generation = market_cache.generation()
+        row = (await db.execute(version_stmt)).one()
+        etag = make_etag(cache_key, *row, *extra)
+        market_cache.set(cache_key, etag, generation=generation)
+    return etag
@@ -0,0 +1,41 @@
+"""외부 API 호출용 공유 httpx.AsyncClient
+
+요청마다 클라이언트를 만들면 TLS 핸드셰이크를 매번 다시 하므로, 앱 lifespan에서 하나를 열고 닫는다.
+"""
+import httpx
+
+from app.config import HTTP_CLIENT_TIMEOUT, HTTP_CLIENT_MAX_CONNECTIONS, HTTP_CLIENT_MAX_KEEPALIVE
+
+_client = None
+
+
+def _create_client():
+    return httpx.AsyncClient(
+        timeout=HTTP_CLIENT_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=HTTP_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_CLIENT_MAX_KEEPALIVE,
+        ),
+    )
+
+
+async def start_http_client():
+    global _client
+    if _client is None:
+        _client = _create_client()
+    return _client
+
+
+async def close_http_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_http_client():
+    """공유 클라이언트 (lifespan 밖에서 호출되면 그 자리에서 생성)"""
+    global _client
+    if _client is None:
+        _client = _create_client()
+    return _client
@@ -1,8 +1,111 @@
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from app.config import DATABASE_URL
+from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from app.config import (
+    DATABASE_URL, ASYNC_DATABASE_URL, DB_POOLS, to_async_url,
+    DATABASE_REPLICA_URLS, REPLICA_MAX_LAG_SECONDS, REPLICA_HEALTH_CHECK_INTERVAL,
+)
+from app.db.pool import PoolMetrics, MeteredQueuePool, MeteredAsyncAdaptedQueuePool
+from app.db.replica import Replica, ReplicaRouter
 from sqlalchemy.ext.declarative import declarative_base
 
-engine = create_engine(DATABASE_URL)
+_metered_engines = {}
+
+def _pool_kwargs(pool_name):
+    config = DB_POOLS[pool_name]
+    return {
+        'pool_size': config['pool_size'],
+        'max_overflow': config['max_overflow'],
+        'pool_timeout': config['pool_timeout'],
+        'pool_recycle': config['pool_recycle'],
+        'pool_pre_ping': config['pool_pre_ping'],
+    }
+
+def create_pool_engine(pool_name, url=DATABASE_URL, metrics_name=None, connect_args=None):
+    """워크로드별 설정을 적용한 동기 엔진 생성"""
+    timeout_ms = DB_POOLS[pool_name]['statement_timeout_ms']
+    db_engine = create_engine(
+        url,
+        poolclass=MeteredQueuePool,
+        connect_args={'options': f'-c statement_timeout={timeout_ms}', **(connect_args or {})},
+        **_pool_kwargs(pool_name),
+    )
+    metrics = PoolMetrics(metrics_name or pool_name)
+    db_engine.pool.metrics = metrics
+    _metered_engines[metrics.name] = db_engine
+    return db_engine
+
+def create_async_pool_engine(pool_name, url=ASYNC_DATABASE_URL, metrics_name=None, connect_args=None):
+    """워크로드별 설정을 적용한 비동기 엔진 생성 (asyncpg)"""
+    timeout_ms = DB_POOLS[pool_name]['statement_timeout_ms']
+    db_engine = create_async_engine(
+        url,
+        poolclass=MeteredAsyncAdaptedQueuePool,
+        connect_args={'server_settings': {'statement_timeout': str(timeout_ms)}, **(connect_args or {})},
+        **_pool_kwargs(pool_name),
+    )
+    metrics = PoolMetrics(metrics_name or f'{pool_name}_async')
+    db_engine.pool.metrics = metrics
+    _metered_engines[metrics.name] = db_engine
+    return db_engine
+
+def get_pool_stats():
+    """풀별 체크아웃 수, 오버플로우, 대기 시간 지표"""
+    return [db_engine.pool.metrics.snapshot(db_engine.pool) for db_engine in _metered_engines.values()]
+
+# 게시판 API용 동기 엔진
+engine = create_pool_engine('api')
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
\ No newline at end of file
+
+# 스케줄러 배치 작업용 엔진 (긴 upsert가 API 커넥션을 점유하지 않도록 분리)
+batch_engine = create_pool_engine('batch')
+BatchSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=batch_engine)
+
+# 로그인/토큰 처리용 엔진
+auth_engine = create_pool_engine('auth')
+AuthSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=auth_engine)
+
+# OHLCV 내보내기용 엔진 (긴 스트리밍 쿼리를 API 풀과 분리)
+export_engine = create_pool_engine('export')
+
+# 시세 조회 API용 비동기 엔진 (asyncpg)
+async_engine = create_async_pool_engine('api')
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# 조회 전용 복제본 (장애/지연 시 primary로 대체)
+replica_router = ReplicaRouter(
+    [
+        Replica(
+            f'replica{i}',
+            create_pool_engine('api', url, metrics_name=f'replica{i}', connect_args={'connect_timeout': 3}),
+            create_async_pool_engine('api', to_async_url(url), metrics_name=f'replica{i}_async', connect_args={'timeout': 3}),
+        )
+        for i, url in enumerate(DATABASE_REPLICA_URLS, start=1)
+    ],
+    max_lag_seconds=REPLICA_MAX_LAG_SECONDS,
+    check_interval=REPLICA_HEALTH_CHECK_INTERVAL,
+)
+
+Base = declarative_base()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def get_read_db():
+    """조회 전용 세션. 쓰기(PostView insert 등)는 반드시 get_db 세션을 사용할 것"""
+    replica_engine = replica_router.pick() if replica_router.replicas else None
+    db = Session(bind=replica_engine, autoflush=False) if replica_engine is not None else SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_read_db():
+    replica_engine = await replica_router.pick_async() if replica_router.replicas else None
+    if replica_engine is None:
+        async with AsyncSessionLocal() as db:
+            yield db
+    else:
+        async with AsyncSession(bind=replica_engine, autoflush=False, expire_on_commit=False) as db:
+            yield db
@@ -1,8 +1,17 @@
 import logging
+import os
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.pool import NullPool
 
 logger = logging.getLogger('app.db')
 
-from app.db.database import engine, Base
+from app.config import DATABASE_URL
+from app.db.database import batch_engine
 from app.db.models.kiwoom_api_info import KiwoomApiInfo
 from app.db.models.stock_info import StockInfo
 from app.db.models.stock_ohlcv import StockOhlcv
@@ -16,16 +25,54 @@ from app.db.models.account import Account
 from app.db.models.refresh_token import RefreshToken
 from app.db.models.strategy_board import StrategyBoard
 
-# 필요한 모든 Base import
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'alembic.ini')
+BASELINE_REVISION = '0001'
+# 여러 인스턴스가 동시에 배포 단계를 실행해도 마이그레이션이 한 번에 하나만 돌도록 잡는 advisory lock 키
+MIGRATION_LOCK_KEY = 0x6A756D656E
+
+
+def run_migrations():
+    """alembic 마이그레이션을 head까지 적용 (배포 단계에서 `python -m app.db.init_db`로 실행)
+
+    서버 기동 경로에서는 호출하지 않는다. 워크로드 풀의 statement_timeout이 없는 전용 커넥션에서
+    pg_advisory_xact_lock으로 직렬화해 실행한다.
+    create_all로 만들어진 기존 DB(alembic_version 없음)는 baseline으로 stamp 후 이후 리비전만 적용한다.
+    """
+    cfg = Config(ALEMBIC_INI)
+    migration_engine = create_engine(DATABASE_URL, poolclass=NullPool)
+    try:
+        with migration_engine.begin() as connection:
+            connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {'key': MIGRATION_LOCK_KEY})
+            cfg.attributes['connection'] = connection
+            tables = inspect(connection).get_table_names()
+            if 'tb_user' in tables and 'alembic_version' not in tables:
+                command.stamp(cfg, BASELINE_REVISION)
+                logger.info(f"기존 DB를 baseline({BASELINE_REVISION})으로 stamp")
+            command.upgrade(cfg, 'head')
+    finally:
+        migration_engine.dispose()
+    logger.info("DB 마이그레이션 적용 완료")
+
+
+def check_migrations():
+    """DB 리비전이 코드의 head와 같은지 확인 (다르면 경고만 남기고 기동은 계속)"""
+    head = ScriptDirectory.from_config(Config(ALEMBIC_INI)).get_current_head()
+    with batch_engine.connect() as connection:
+        current = MigrationContext.configure(connection).get_current_revision()
+    if current != head:
+        logger.error(
+            f"DB 마이그레이션이 최신이 아닙니다 (현재: {current}, head: {head}). "
+            "배포 단계에서 `python -m app.db.init_db`를 실행하세요."
+        )
+    return current == head
+
 
 def init_db():
-    # 모든 Base에 대해 create_all 호출
-    Base.metadata.create_all(engine)
-    logger.info("DB 테이블 자동 생성 완료")
+    check_migrations()
     
     # 기본 전략 게시판 생성
-    from app.db.database import SessionLocal
-    db = SessionLocal()
+    from app.db.database import BatchSessionLocal
+    db = BatchSessionLocal()
     try:
         # 기본 전략 게시판이 있는지 확인
         existing_board = db.query(StrategyBoard).filter(StrategyBoard.id == 1).first()
@@ -88,4 +135,6 @@ def init_db():
         db.close()
 
 if __name__ == "__main__":
+    # 배포 단계: 마이그레이션 적용 후 기본 데이터 생성
+    run_migrations()
     init_db()
\ No newline at end of file
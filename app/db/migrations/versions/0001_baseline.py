@@ -0,0 +1,404 @@
+"""baseline: create_all 시절 스키마를 그대로 고정한 초기 리비전
+
+기존 운영 DB는 init_db()에서 이 리비전으로 stamp 된 뒤 이후 리비전만 적용된다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('free_boards',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('sort_order', sa.Integer(), nullable=True),
+    sa.Column('allowed_categories', sa.ARRAY(sa.String()), nullable=True),
+    sa.Column('allow_anonymous', sa.Boolean(), nullable=True),
+    sa.Column('max_tags_count', sa.Integer(), nullable=True),
+    sa.Column('require_moderation', sa.Boolean(), nullable=True),
+    sa.Column('max_content_length', sa.Integer(), nullable=True),
+    sa.Column('allow_image_upload', sa.Boolean(), nullable=True),
+    sa.Column('allow_video_upload', sa.Boolean(), nullable=True),
+    sa.Column('crt_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('mod_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('strategy_boards',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('sort_order', sa.Integer(), nullable=True),
+    sa.Column('max_risk_level', sa.Integer(), nullable=True),
+    sa.Column('allowed_strategy_types', sa.ARRAY(sa.String()), nullable=True),
+    sa.Column('require_stock_reference', sa.Boolean(), nullable=True),
+    sa.Column('require_theme_reference', sa.Boolean(), nullable=True),
+    sa.Column('allow_anonymous', sa.Boolean(), nullable=True),
+    sa.Column('max_tags_count', sa.Integer(), nullable=True),
+    sa.Column('require_target_price', sa.Boolean(), nullable=True),
+    sa.Column('require_risk_assessment', sa.Boolean(), nullable=True),
+    sa.Column('crt_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('mod_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('tb_index_info',
+    sa.Column('id', sa.BigInteger(), nullable=False),
+    sa.Column('order_no', sa.BigInteger(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('name', sa.Text(), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('crt_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('mod_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.create_table('tb_kiwoom_api_info',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('account_no', sa.String(), nullable=True),
+    sa.Column('investment_mode', sa.String(), nullable=True),
+    sa.Column('investment_type', sa.String(), nullable=True),
+    sa.Column('api_url', sa.String(), nullable=True),
+    sa.Column('app_key', sa.String(), nullable=True),
+    sa.Column('secret_key', sa.String(), nullable=True),
+    sa.Column('valid_token', sa.String(), nullable=True),
+    sa.Column('token_expire_date', sa.TIMESTAMP(timezone=True), nullable=True),
+    sa.Column('crt_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('mod_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('tb_sector_info',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('sector_code', sa.String(), nullable=False),
+    sa.Column('sector_name', sa.String(), nullable=False),
+    sa.Column('change_rate', sa.Numeric(), nullable=False),
+    sa.Column('up_ticker_count', sa.Integer(), nullable=False),
+    sa.Column('neutral_ticker_count', sa.Integer(), nullable=False),
+    sa.Column('down_ticker_count', sa.Integer(), nullable=False),
+    sa.Column('detail_url', sa.Text(), nullable=False),
+    sa.Column('ref', sa.String(), nullable=False),
+    sa.Column('crt_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('mod_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('sector_code', 'sector_name', 'ref', name='tb_sector_info_code_name_ref_unique')
+    )
+    op.create_table('tb_stock_info',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('ticker', sa.String(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('market', sa.String(), nullable=True),
+    sa.Column('stock_count', sa.BigInteger(), nullable=True),
+    sa.Column('market_cap', sa.BigInteger(), nullable=True),
+    sa.Column('bps', sa.BigInteger(), nullable=True),
+    sa.Column('per', sa.Numeric(), nullable=True),
+    sa.Column('pbr', sa.Numeric(), nullable=True),
+    sa.Column('eps', sa.BigInteger(), nullable=True),
+    sa.Column('div', sa.Numeric(), nullable=True),
+    sa.Column('dps', sa.BigInteger(), nullable=True),
+    sa.Column('crt_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('mod_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name'),
+    sa.UniqueConstraint('ticker')
+    )
+    op.create_table('tb_theme_info',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('theme_code', sa.String(), nullable=False),
+    sa.Column('theme_name', sa.String(), nullable=False),
+    sa.Column('change_rate', sa.Numeric(), nullable=False),
+    sa.Column('avg_change_rate_3days', sa.Numeric(), nullable=False),
+    sa.Column('up_ticker_count', sa.Integer(), nullable=False),
+    sa.Column('neutral_ticker_count', sa.Integer(), nullable=False),
+    sa.Column('down_ticker_count', sa.Integer(), nullable=False),
+    sa.Column('detail_url', sa.Text(), nullable=False),
+    sa.Column('ref', sa.String(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('crt_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('mod_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('theme_code', 'theme_name', 'ref', name='tb_theme_info_code_name_ref_unique')
+    )
+    op.create_table('tb_user',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('username', sa.String(length=100), nullable=True),
+    sa.Column('nickname', sa.String(length=100), nullable=False),
+    sa.Column('profile_img', sa.String(length=255), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('is_superuser', sa.Boolean(), nullable=True),
+    sa.Column('crt_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('mod_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('nickname'),
+    sa.UniqueConstraint('username')
+    )
+    op.create_table('free_posts',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('board_id', sa.BigInteger(), nullable=False),
+    sa.Column('user_id', sa.BigInteger(), nullable=False),
+    sa.Column('title', sa.String(length=200), nullable=False),
+    sa.Column('content', sa.String(), nullable=False),
+    sa.Column('view_count', sa.Integer(), nullable=True),
+    sa.Column('like_count', sa.Integer(), nullable=True),
+    sa.Column('comment_count', sa.Integer(), nullable=True),
+    sa.Column('is_deleted', sa.Boolean(), nullable=True),
+    sa.Column('is_notice', sa.Boolean(), nullable=True),
+    sa.Column('category', sa.String(length=50), nullable=True),
+    sa.Column('is_anonymous', sa.Boolean(), nullable=True),
+    sa.Column('is_pinned', sa.Boolean(), nullable=True),
+    sa.Column('is_hot', sa.Boolean(), nullable=True),
+    sa.Column('tags', sa.ARRAY(sa.String()), nullable=True),
+    sa.Column('crt_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('mod_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['board_id'], ['free_boards.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['tb_user.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('post_likes',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('post_type', sa.String(length=20), nullable=False),
+    sa.Column('post_id', sa.BigInteger(), nullable=False),
+    sa.Column('user_id', sa.BigInteger(), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('crt_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('mod_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['tb_user.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('post_type', 'post_id', 'user_id', name='uq_post_like')
+    )
+    op.create_table('post_views',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('post_type', sa.String(length=20), nullable=False),
+    sa.Column('post_id', sa.BigInteger(), nullable=False),
+    sa.Column('user_id', sa.BigInteger(), nullable=True),
+    sa.Column('ip_address', sa.String(length=45), nullable=True),
+    sa.Column('user_agent', sa.String(), nullable=True),
+    sa.Column('crt_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('mod_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['tb_user.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('strategy_posts',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('board_id', sa.BigInteger(), nullable=True),
+    sa.Column('user_id', sa.BigInteger(), nullable=False),
+    sa.Column('title', sa.String(length=200), nullable=False),
+    sa.Column('content', sa.String(), nullable=False),
+    sa.Column('view_count', sa.Integer(), nullable=True),
+    sa.Column('like_count', sa.Integer(), nullable=True),
+    sa.Column('comment_count', sa.Integer(), nullable=True),
+    sa.Column('is_deleted', sa.Boolean(), nullable=True),
+    sa.Column('is_notice', sa.Boolean(), nullable=True),
+    sa.Column('related_stock_id', sa.BigInteger(), nullable=True),
+    sa.Column('related_theme_id', sa.BigInteger(), nullable=True),
+    sa.Column('strategy_type', sa.String(length=20), nullable=True),
+    sa.Column('target_price', sa.DECIMAL(precision=10, scale=2), nullable=True),
+    sa.Column('risk_level', sa.Integer(), nullable=True),
+    sa.Column('performance_rating', sa.Integer(), nullable=True),
+    sa.Column('entry_price', sa.DECIMAL(precision=10, scale=2), nullable=True),
+    sa.Column('exit_price', sa.DECIMAL(precision=10, scale=2), nullable=True),
+    sa.Column('holding_period', sa.String(length=50), nullable=True),
+    sa.Column('tags', sa.ARRAY(sa.String()), nullable=True),
+    sa.Column('crt_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('mod_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['board_id'], ['strategy_boards.id'], ),
+    sa.ForeignKeyConstraint(['related_stock_id'], ['tb_stock_info.id'], ),
+    sa.ForeignKeyConstraint(['related_theme_id'], ['tb_theme_info.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['tb_user.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('tb_account',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.BigInteger(), nullable=False),
+    sa.Column('provider', sa.String(length=32), nullable=False),
+    sa.Column('provider_user_id', sa.String(length=128), nullable=True),
+    sa.Column('email', sa.String(length=120), nullable=False),
+    sa.Column('password_hash', sa.String(length=128), nullable=True),
+    sa.Column('access_token', sa.Text(), nullable=True),
+    sa.Column('refresh_token', sa.Text(), nullable=True),
+    sa.Column('crt_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('mod_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['tb_user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('provider', 'email', name='uq_account_provider_email'),
+    sa.UniqueConstraint('provider', 'provider_user_id', name='uq_account_provider_user_id')
+    )
+    op.create_table('tb_index_ohlcv',
+    sa.Column('index_id', sa.BigInteger(), nullable=False),
+    sa.Column('ymd', sa.Date(), nullable=False),
+    sa.Column('open', sa.Numeric(), nullable=True),
+    sa.Column('high', sa.Numeric(), nullable=True),
+    sa.Column('low', sa.Numeric(), nullable=True),
+    sa.Column('close', sa.Numeric(), nullable=True),
+    sa.Column('volume', sa.BigInteger(), nullable=True),
+    sa.ForeignKeyConstraint(['index_id'], ['tb_index_info.id'], ),
+    sa.PrimaryKeyConstraint('index_id', 'ymd')
+    )
+    op.create_table('tb_relation_stock_sector',
+    sa.Column('stock_id', sa.BigInteger(), nullable=False),
+    sa.Column('sector_id', sa.BigInteger(), nullable=False),
+    sa.Column('current_price', sa.Numeric(), nullable=True),
+    sa.Column('diff_price', sa.Numeric(), nullable=True),
+    sa.Column('change_rate', sa.Numeric(), nullable=True),
+    sa.Column('volume', sa.BigInteger(), nullable=True),
+    sa.Column('trading_value', sa.Numeric(), nullable=True),
+    sa.Column('volume_yesterday', sa.BigInteger(), nullable=True),
+    sa.Column('crt_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('mod_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['sector_id'], ['tb_sector_info.id'], ),
+    sa.ForeignKeyConstraint(['stock_id'], ['tb_stock_info.id'], ),
+    sa.PrimaryKeyConstraint('stock_id', 'sector_id')
+    )
+    op.create_table('tb_relation_stock_theme',
+    sa.Column('stock_id', sa.BigInteger(), nullable=False),
+    sa.Column('theme_id', sa.BigInteger(), nullable=False),
+    sa.Column('current_price', sa.Numeric(), nullable=True),
+    sa.Column('diff_price', sa.Numeric(), nullable=True),
+    sa.Column('change_rate', sa.Numeric(), nullable=True),
+    sa.Column('volume', sa.BigInteger(), nullable=True),
+    sa.Column('trading_value', sa.Numeric(), nullable=True),
+    sa.Column('volume_yesterday', sa.BigInteger(), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('crt_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('mod_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['stock_id'], ['tb_stock_info.id'], ),
+    sa.ForeignKeyConstraint(['theme_id'], ['tb_theme_info.id'], ),
+    sa.PrimaryKeyConstraint('stock_id', 'theme_id')
+    )
+    op.create_table('tb_stock_ohlcv',
+    sa.Column('stock_id', sa.BigInteger(), nullable=False),
+    sa.Column('ymd', sa.Date(), nullable=False),
+    sa.Column('open', sa.Numeric(), nullable=True),
+    sa.Column('high', sa.Numeric(), nullable=True),
+    sa.Column('low', sa.Numeric(), nullable=True),
+    sa.Column('close', sa.Numeric(), nullable=True),
+    sa.Column('volume', sa.BigInteger(), nullable=True),
+    sa.Column('ticker', sa.Text(), nullable=False),
+    sa.Column('change_rate', sa.Numeric(), nullable=True),
+    sa.Column('trading_value', sa.Numeric(), nullable=True),
+    sa.Column('trading_value_institution', sa.Numeric(), nullable=True),
+    sa.Column('trading_value_other_corporation', sa.Numeric(), nullable=True),
+    sa.Column('trading_value_individual', sa.Numeric(), nullable=True),
+    sa.Column('trading_value_foreign', sa.Numeric(), nullable=True),
+    sa.Column('volume_institution', sa.Numeric(), nullable=True),
+    sa.Column('volume_other_corporation', sa.Numeric(), nullable=True),
+    sa.Column('volume_individual', sa.Numeric(), nullable=True),
+    sa.Column('volume_foreign', sa.Numeric(), nullable=True),
+    sa.ForeignKeyConstraint(['stock_id'], ['tb_stock_info.id'], ),
+    sa.PrimaryKeyConstraint('stock_id', 'ymd', 'ticker')
+    )
+    op.create_table('free_attachments',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('post_id', sa.BigInteger(), nullable=False),
+    sa.Column('file_name', sa.String(length=255), nullable=False),
+    sa.Column('original_name', sa.String(length=255), nullable=False),
+    sa.Column('file_path', sa.String(length=500), nullable=False),
+    sa.Column('file_size', sa.BigInteger(), nullable=False),
+    sa.Column('mime_type', sa.String(length=100), nullable=False),
+    sa.Column('download_count', sa.Integer(), nullable=True),
+    sa.Column('file_type', sa.String(length=50), nullable=True),
+    sa.Column('thumbnail_path', sa.String(length=500), nullable=True),
+    sa.Column('crt_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('mod_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['post_id'], ['free_posts.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('free_comments',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('post_id', sa.BigInteger(), nullable=False),
+    sa.Column('user_id', sa.BigInteger(), nullable=False),
+    sa.Column('parent_id', sa.BigInteger(), nullable=True),
+    sa.Column('content', sa.String(), nullable=False),
+    sa.Column('depth', sa.Integer(), nullable=True),
+    sa.Column('is_deleted', sa.Boolean(), nullable=True),
+    sa.Column('is_anonymous', sa.Boolean(), nullable=True),
+    sa.Column('is_best_answer', sa.Boolean(), nullable=True),
+    sa.Column('crt_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('mod_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['parent_id'], ['free_comments.id'], ),
+    sa.ForeignKeyConstraint(['post_id'], ['free_posts.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['tb_user.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('strategy_attachments',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('post_id', sa.BigInteger(), nullable=False),
+    sa.Column('file_name', sa.String(length=255), nullable=False),
+    sa.Column('original_name', sa.String(length=255), nullable=False),
+    sa.Column('file_path', sa.String(length=500), nullable=False),
+    sa.Column('file_size', sa.BigInteger(), nullable=False),
+    sa.Column('mime_type', sa.String(length=100), nullable=False),
+    sa.Column('download_count', sa.Integer(), nullable=True),
+    sa.Column('file_type', sa.String(length=50), nullable=True),
+    sa.Column('is_public', sa.Boolean(), nullable=True),
+    sa.Column('crt_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('mod_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['post_id'], ['strategy_posts.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('strategy_comments',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('post_id', sa.BigInteger(), nullable=False),
+    sa.Column('user_id', sa.BigInteger(), nullable=False),
+    sa.Column('parent_id', sa.BigInteger(), nullable=True),
+    sa.Column('content', sa.String(), nullable=False),
+    sa.Column('depth', sa.Integer(), nullable=True),
+    sa.Column('is_deleted', sa.Boolean(), nullable=True),
+    sa.Column('is_analysis', sa.Boolean(), nullable=True),
+    sa.Column('confidence_level', sa.Integer(), nullable=True),
+    sa.Column('crt_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('mod_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['parent_id'], ['strategy_comments.id'], ),
+    sa.ForeignKeyConstraint(['post_id'], ['strategy_posts.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['tb_user.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('tb_refresh_token',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.BigInteger(), nullable=False),
+    sa.Column('account_id', sa.BigInteger(), nullable=False),
+    sa.Column('token', sa.String(length=512), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('user_agent', sa.String(length=255), nullable=True),
+    sa.Column('ip_address', sa.String(length=45), nullable=True),
+    sa.Column('crt_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('mod_date', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['account_id'], ['tb_account.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['tb_user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('token')
+    )
+
+
+def downgrade():
+    op.drop_table('tb_refresh_token')
+    op.drop_table('strategy_comments')
+    op.drop_table('strategy_attachments')
+    op.drop_table('free_comments')
+    op.drop_table('free_attachments')
+    op.drop_table('tb_stock_ohlcv')
+    op.drop_table('tb_relation_stock_theme')
+    op.drop_table('tb_relation_stock_sector')
+    op.drop_table('tb_index_ohlcv')
+    op.drop_table('tb_account')
+    op.drop_table('strategy_posts')
+    op.drop_table('post_views')
+    op.drop_table('post_likes')
+    op.drop_table('free_posts')
+    op.drop_table('tb_user')
+    op.drop_table('tb_theme_info')
+    op.drop_table('tb_stock_info')
+    op.drop_table('tb_sector_info')
+    op.drop_table('tb_kiwoom_api_info')
+    op.drop_table('tb_index_info')
+    op.drop_table('strategy_boards')
+    op.drop_table('free_boards')
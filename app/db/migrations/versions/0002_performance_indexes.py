@@ -0,0 +1,37 @@
+"""performance indexes: 라우터 핫패스용 인덱스 추가
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+# (인덱스명, 테이블, 컬럼) - 모델의 __table_args__ 선언과 동일하게 유지
+INDEXES = [
+    ('ix_relation_stock_theme_theme_id', 'tb_relation_stock_theme', ['theme_id']),
+    ('ix_relation_stock_sector_sector_id', 'tb_relation_stock_sector', ['sector_id']),
+    ('ix_post_likes_user_type_post_active', 'post_likes', ['user_id', 'post_type', 'post_id', 'is_active']),
+    ('ix_post_views_type_post_user', 'post_views', ['post_type', 'post_id', 'user_id']),
+    ('ix_free_posts_notice_crt_date', 'free_posts', ['is_notice', 'crt_date']),
+    ('ix_strategy_posts_notice_crt_date', 'strategy_posts', ['is_notice', 'crt_date']),
+    ('ix_free_comments_post_id', 'free_comments', ['post_id']),
+    ('ix_strategy_comments_post_id', 'strategy_comments', ['post_id']),
+    ('ix_refresh_token_expires_at', 'tb_refresh_token', ['expires_at']),
+]
+
+
+def upgrade():
+    # 운영 DB에 수동으로 만들어 둔 인덱스가 있을 수 있으므로 if_not_exists
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,90 @@
+"""partition tb_stock_ohlcv: ymd 기준 연도별 range 파티션 + BRIN(ymd)
+
+기존 테이블을 _old로 바꾼 뒤 파티션 부모를 만들고 데이터 범위의 연도 파티션(+ 미래 1년)을 생성해 옮긴다.
+PK (stock_id, ymd, ticker)는 파티션 키를 포함하므로 ON CONFLICT upsert는 부모 테이블에 그대로 동작한다.
+
+전체 데이터를 복사하는 마이그레이션이므로 서버 기동 경로에서는 실행되지 않는다. 배포 단계에서
+`python -m app.db.init_db`로 적용하며(복사 동안 tb_stock_ohlcv 쓰기가 막히므로 OHLCV 배치가 돌지 않는 시간에 실행),
+statement_timeout은 이 트랜잭션에서만 해제한다.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00
+"""
+import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+# 복사 시 컬럼 순서에 의존하지 않도록 명시
+COLUMN_NAMES = (
+    "stock_id, ymd, open, high, low, close, volume, ticker, change_rate, trading_value, "
+    "trading_value_institution, trading_value_other_corporation, trading_value_individual, trading_value_foreign, "
+    "volume_institution, volume_other_corporation, volume_individual, volume_foreign"
+)
+
+COLUMNS = """
+    stock_id BIGINT NOT NULL,
+    ymd DATE NOT NULL,
+    open NUMERIC,
+    high NUMERIC,
+    low NUMERIC,
+    close NUMERIC,
+    volume BIGINT,
+    ticker TEXT NOT NULL,
+    change_rate NUMERIC,
+    trading_value NUMERIC,
+    trading_value_institution NUMERIC,
+    trading_value_other_corporation NUMERIC,
+    trading_value_individual NUMERIC,
+    trading_value_foreign NUMERIC,
+    volume_institution NUMERIC,
+    volume_other_corporation NUMERIC,
+    volume_individual NUMERIC,
+    volume_foreign NUMERIC,
+    CONSTRAINT tb_stock_ohlcv_pkey PRIMARY KEY (stock_id, ymd, ticker),
+    CONSTRAINT tb_stock_ohlcv_stock_id_fkey FOREIGN KEY (stock_id) REFERENCES tb_stock_info (id)
+"""
+
+
+def upgrade():
+    op.execute("SET LOCAL statement_timeout = 0")
+    op.execute("ALTER TABLE tb_stock_ohlcv RENAME TO tb_stock_ohlcv_old")
+    op.execute("ALTER TABLE tb_stock_ohlcv_old RENAME CONSTRAINT tb_stock_ohlcv_pkey TO tb_stock_ohlcv_old_pkey")
+    op.execute("ALTER TABLE tb_stock_ohlcv_old RENAME CONSTRAINT tb_stock_ohlcv_stock_id_fkey TO tb_stock_ohlcv_old_stock_id_fkey")
+    op.execute(f"CREATE TABLE tb_stock_ohlcv ({COLUMNS}) PARTITION BY RANGE (ymd)")
+
+    bind = op.get_bind()
+    min_year, max_year = bind.execute(sa.text(
+        "SELECT extract(year FROM min(ymd))::int, extract(year FROM max(ymd))::int FROM tb_stock_ohlcv_old"
+    )).one()
+    this_year = datetime.date.today().year
+    first_year = min_year or this_year
+    last_year = max(max_year or this_year, this_year + 1)
+    for year in range(first_year, last_year + 1):
+        op.execute(
+            f"CREATE TABLE tb_stock_ohlcv_y{year} PARTITION OF tb_stock_ohlcv "
+            f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+        )
+
+    # 부모에 만든 인덱스는 모든 파티션(이후 생성분 포함)에 전파됨
+    op.execute("CREATE INDEX ix_stock_ohlcv_ymd_brin ON tb_stock_ohlcv USING brin (ymd)")
+    op.execute(f"INSERT INTO tb_stock_ohlcv ({COLUMN_NAMES}) SELECT {COLUMN_NAMES} FROM tb_stock_ohlcv_old")
+    op.execute("DROP TABLE tb_stock_ohlcv_old")
+
+
+def downgrade():
+    op.execute("SET LOCAL statement_timeout = 0")
+    op.execute("ALTER TABLE tb_stock_ohlcv RENAME TO tb_stock_ohlcv_partitioned")
+    op.execute("ALTER TABLE tb_stock_ohlcv_partitioned RENAME CONSTRAINT tb_stock_ohlcv_pkey TO tb_stock_ohlcv_partitioned_pkey")
+    op.execute("ALTER TABLE tb_stock_ohlcv_partitioned RENAME CONSTRAINT tb_stock_ohlcv_stock_id_fkey TO tb_stock_ohlcv_partitioned_stock_id_fkey")
+    op.execute(f"CREATE TABLE tb_stock_ohlcv ({COLUMNS})")
+    op.execute(f"INSERT INTO tb_stock_ohlcv ({COLUMN_NAMES}) SELECT {COLUMN_NAMES} FROM tb_stock_ohlcv_partitioned")
+    # 파티션도 함께 삭제됨
+    op.execute("DROP TABLE tb_stock_ohlcv_partitioned")
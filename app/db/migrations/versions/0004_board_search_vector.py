@@ -0,0 +1,67 @@
+"""board search: 2-gram tsvector 생성 컬럼 + GIN 인덱스
+
+한국어는 형태소 분석 없이도 검색되도록 공백/구두점으로 나눈 단어를 2글자씩 잘라 lexeme으로 쓴다.
+(1글자 단어는 그대로) 제목은 가중치 A, 본문은 B로 저장하고, 검색어 단어는 2-gram 구문 검색으로 찾는다.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+TABLES = ['free_posts', 'strategy_posts']
+
+SEARCH_VECTOR_EXPR = "setweight(board_bigrams(title), 'A') || setweight(board_bigrams(content), 'B')"
+
+
+def upgrade():
+    # 2-gram마다 순서대로 위치를 붙여야 setweight/ts_rank와 구문(<->) 검색이 동작함 (tsvector 위치 상한 16383)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION board_bigrams(txt text) RETURNS tsvector
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+            SELECT coalesce(string_agg(quote_literal(gram) || ':' || least(pos, 16383), ' ')::tsvector, ''::tsvector)
+            FROM (
+                SELECT substr(word, i, 2) AS gram, row_number() OVER (ORDER BY wn, i) AS pos
+                FROM regexp_split_to_table(lower(coalesce(txt, '')), '[[:space:][:punct:]]+')
+                         WITH ORDINALITY AS w(word, wn),
+                     generate_series(1, greatest(length(word) - 1, 1)) AS i
+                WHERE word <> ''
+            ) grams
+        $$
+    """)
+    # 검색어 단어마다 2-gram을 <-> 로 이어 붙이고(단어 내 연속 일치), 단어끼리는 AND
+    # 구두점은 분리 단계에서 제거되므로 quote_literal로 충분하고, lexeme이 없으면 NULL이라 아무것도 매칭되지 않음
+    op.execute("""
+        CREATE OR REPLACE FUNCTION board_bigram_query(q text) RETURNS tsquery
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+            SELECT string_agg('(' || phrase || ')', ' & ')::tsquery
+            FROM (
+                SELECT string_agg(quote_literal(substr(word, i, 2)), ' <-> ' ORDER BY i) AS phrase
+                FROM regexp_split_to_table(lower(coalesce(q, '')), '[[:space:][:punct:]]+')
+                         WITH ORDINALITY AS w(word, wn),
+                     generate_series(1, greatest(length(word) - 1, 1)) AS i
+                WHERE word <> ''
+                GROUP BY wn
+            ) phrases
+        $$
+    """)
+    for table in TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+            f"GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPR}) STORED"
+        )
+        op.create_index(f'ix_{table}_search_vector', table, ['search_vector'], postgresql_using='gin')
+
+
+def downgrade():
+    for table in TABLES:
+        op.drop_index(f'ix_{table}_search_vector', table_name=table)
+        op.drop_column(table, 'search_vector')
+    op.execute("DROP FUNCTION board_bigram_query(text)")
+    op.execute("DROP FUNCTION board_bigrams(text)")
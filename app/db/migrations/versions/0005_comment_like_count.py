@@ -0,0 +1,37 @@
+"""comment like_count: 댓글 좋아요 수 컬럼 추가
+
+댓글 좋아요도 게시글과 같은 단일 문장 토글(app/service/board/likes.py)로 처리하기 위해
+post_likes(post_type='{board}_comment')의 활성 좋아요 수로 채운다.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+# (댓글 테이블, post_likes.post_type)
+TABLES = [('free_comments', 'free_comment'), ('strategy_comments', 'strategy_comment')]
+
+
+def upgrade():
+    for table, post_type in TABLES:
+        op.add_column(table, sa.Column('like_count', sa.Integer(), nullable=True))
+        op.execute(f"""
+            UPDATE {table} c
+            SET like_count = (
+                SELECT count(*) FROM post_likes l
+                WHERE l.post_type = '{post_type}' AND l.post_id = c.id AND l.is_active
+            )
+        """)
+
+
+def downgrade():
+    for table, _ in TABLES:
+        op.drop_column(table, 'like_count')
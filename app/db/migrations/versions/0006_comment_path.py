@@ -0,0 +1,71 @@
+"""comment path: 댓글 materialized path + 트리 순서 인덱스
+
+path는 조상부터 자신까지의 id를 8자리 base36으로 이어 붙인 문자열이다. (app/service/board/comments.py)
+collate "C"로 바이트 순 정렬해 path 순서가 곧 트리 순서가 되고, 하위 트리는 (post_id, path) 범위 스캔으로 읽는다.
+기존 댓글은 parent_id를 따라 재귀로 채우고 depth도 다시 계산한다.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+TABLES = ['free_comments', 'strategy_comments']
+
+PATH_SEGMENT_WIDTH = 8
+
+
+def upgrade():
+    # 백필용 임시 함수 (세션 종료 시 사라짐)
+    op.execute(f"""
+        CREATE FUNCTION pg_temp.comment_path_segment(n bigint) RETURNS text
+        LANGUAGE plpgsql IMMUTABLE AS $$
+        DECLARE
+            digits text := '0123456789abcdefghijklmnopqrstuvwxyz';
+            result text := '';
+        BEGIN
+            LOOP
+                result := substr(digits, (n % 36)::int + 1, 1) || result;
+                n := n / 36;
+                EXIT WHEN n = 0;
+            END LOOP;
+            RETURN lpad(result, {PATH_SEGMENT_WIDTH}, '0');
+        END
+        $$
+    """)
+    for table in TABLES:
+        op.add_column(table, sa.Column('path', sa.Text(collation='C'), nullable=True))
+        op.execute(f"""
+            WITH RECURSIVE tree AS (
+                SELECT id, pg_temp.comment_path_segment(id) AS path, 0 AS depth
+                FROM {table} WHERE parent_id IS NULL
+                UNION ALL
+                SELECT c.id, tree.path || pg_temp.comment_path_segment(c.id), tree.depth + 1
+                FROM {table} c JOIN tree ON c.parent_id = tree.id
+            )
+            UPDATE {table} t SET path = tree.path, depth = tree.depth
+            FROM tree WHERE t.id = tree.id
+        """)
+        op.alter_column(table, 'path', nullable=False)
+        # (post_id, path)가 기존 post_id 단일 인덱스를 대신함
+        op.drop_index(f'ix_{table}_post_id', table_name=table, if_exists=True)
+        op.create_index(f'ix_{table}_post_path', table, ['post_id', 'path'])
+        op.create_index(
+            f'ix_{table}_post_root_path', table, ['post_id', 'path'],
+            postgresql_where=sa.text('parent_id IS NULL'),
+        )
+
+
+def downgrade():
+    for table in TABLES:
+        op.drop_index(f'ix_{table}_post_root_path', table_name=table)
+        op.drop_index(f'ix_{table}_post_path', table_name=table)
+        op.create_index(f'ix_{table}_post_id', table, ['post_id'])
+        op.drop_column(table, 'path')
@@ -0,0 +1,38 @@
+"""post hot scores: 인기순 정렬용 점수 테이블
+
+점수는 compute_hot_scores 배치가 최근 조회/좋아요/댓글에 시간 감쇠를 적용해 주기적으로 다시 채운다.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'post_hot_scores',
+        sa.Column('post_type', sa.String(length=20), nullable=False),
+        sa.Column('post_id', sa.BigInteger(), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('computed_at', sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('post_type', 'post_id', name='pk_post_hot_scores'),
+    )
+    op.create_index(
+        'ix_post_hot_scores_type_score', 'post_hot_scores',
+        ['post_type', sa.text('score DESC'), sa.text('post_id DESC')],
+    )
+    op.create_index('ix_post_views_type_crt_date', 'post_views', ['post_type', 'crt_date'])
+
+
+def downgrade():
+    op.drop_index('ix_post_views_type_crt_date', table_name='post_views')
+    op.drop_index('ix_post_hot_scores_type_score', table_name='post_hot_scores')
+    op.drop_table('post_hot_scores')
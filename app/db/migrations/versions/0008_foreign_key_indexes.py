@@ -0,0 +1,34 @@
+"""foreign key indexes: 게시글 상세/로그인에서 조인하는 FK 컬럼 인덱스
+
+실행계획 테스트(tests/db/test_query_plans.py)가 Seq Scan으로 잡은 조인 컬럼.
+    - 첨부파일: 게시글 상세의 joinedload(attachments)
+    - 계정: 로그인/토큰 갱신 시 사용자의 accounts 조회
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+
+
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+# (인덱스명, 테이블, 컬럼) - 모델의 __table_args__ 선언과 동일하게 유지
+INDEXES = [
+    ('ix_free_attachments_post_id', 'free_attachments', ['post_id']),
+    ('ix_strategy_attachments_post_id', 'strategy_attachments', ['post_id']),
+    ('ix_account_user_id', 'tb_account', ['user_id']),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
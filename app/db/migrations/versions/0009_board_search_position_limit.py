@@ -0,0 +1,34 @@
+"""board search: 위치 없는 2-gram 검색어 함수
+
+tsvector 위치는 16383이 상한이라 board_bigrams는 그 뒤의 2-gram을 모두 16383에 붙인다. 본문이 그만큼 길면
+뒷부분에서는 구문(<->) 검색이 동작하지 않으므로, 단어의 2-gram을 위치 없이 AND로만 묶은 검색어를 추가한다.
+search.match_condition이 이 검색어로 GIN 인덱스를 타고, 위치 상한을 넘을 수 있는 긴 게시글만 구문 일치 없이 통과시킨다.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+
+
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # board_bigram_query와 같은 2-gram을 & 로만 연결 (lexeme이 없으면 NULL이라 아무것도 매칭되지 않음)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION board_bigram_and_query(q text) RETURNS tsquery
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+            SELECT string_agg(DISTINCT quote_literal(substr(word, i, 2)), ' & ')::tsquery
+            FROM regexp_split_to_table(lower(coalesce(q, '')), '[[:space:][:punct:]]+') AS w(word),
+                 generate_series(1, greatest(length(word) - 1, 1)) AS i
+            WHERE word <> ''
+        $$
+    """)
+
+
+def downgrade():
+    op.execute("DROP FUNCTION board_bigram_and_query(text)")
@@ -0,0 +1,31 @@
+"""post is_notice not null: 공지 여부를 NOT NULL DEFAULT false로
+
+ORDER BY is_notice DESC 는 NULL을 맨 앞에 두는데, keyset 커서(pagination.keyset_filter)는
+is_notice = true/false 로만 비교해 NULL 행을 건너뛴다. coalesce로 비교하면
+ix_*_posts_notice_crt_date 인덱스 순서를 못 쓰므로 컬럼 자체에서 NULL을 없앤다.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+TABLES = ['free_posts', 'strategy_posts']
+
+
+def upgrade():
+    for table in TABLES:
+        op.execute(f"UPDATE {table} SET is_notice = false WHERE is_notice IS NULL")
+        op.alter_column(table, 'is_notice', existing_type=sa.Boolean(), nullable=False, server_default=sa.false())
+
+
+def downgrade():
+    for table in TABLES:
+        op.alter_column(table, 'is_notice', existing_type=sa.Boolean(), nullable=True, server_default=None)
@@ -4,8 +4,10 @@ from .index_info import IndexInfo
 from .index_ohlcv import IndexOhlcv
 from .kiwoom_api_info import KiwoomApiInfo
 from .refresh_token import RefreshToken
+from .sector_info import SectorInfo
 from .stock_info import StockInfo
 from .stock_ohlcv import StockOhlcv
+from .stock_sector_relation import StockSectorRelation
 from .stock_theme_relation import StockThemeRelation
 from .theme_info import ThemeInfo
 from .user import User
@@ -23,17 +25,18 @@ from .free_attachment import FreeAttachment
 
 from .post_like import PostLike
 from .post_view import PostView
+from .post_hot_score import PostHotScore
 
 # 이벤트 리스너 등록
 from . import board_events
 
 __all__ = [
     # 기존 모델들
-    'Account', 'IndexInfo', 'IndexOhlcv', 'KiwoomApiInfo', 'RefreshToken',
-    'StockInfo', 'StockOhlcv', 'StockThemeRelation', 'ThemeInfo', 'User',
+    'Account', 'IndexInfo', 'IndexOhlcv', 'KiwoomApiInfo', 'RefreshToken', 'SectorInfo',
+    'StockInfo', 'StockOhlcv', 'StockSectorRelation', 'StockThemeRelation', 'ThemeInfo', 'User',
     
     # 게시판 관련 모델들
     'StrategyBoard', 'StrategyPost', 'StrategyComment', 'StrategyAttachment',
     'FreeBoard', 'FreePost', 'FreeComment', 'FreeAttachment',
-    'PostLike', 'PostView',
+    'PostLike', 'PostView', 'PostHotScore',
 ] 
\ No newline at end of file
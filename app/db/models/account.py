@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, String, ForeignKey, UniqueConstraint, Text
+from sqlalchemy import Column, BigInteger, String, ForeignKey, UniqueConstraint, Text, Index
 from sqlalchemy.orm import relationship
 from app.db.models.timestamp_mixin import TimestampMixin
 from app.db.database import Base
@@ -18,4 +18,5 @@ class Account(TimestampMixin, Base):
     __table_args__ = (
         UniqueConstraint('provider', 'provider_user_id', name='uq_account_provider_user_id'),
         UniqueConstraint('provider', 'email', name='uq_account_provider_email'),
+        Index('ix_account_user_id', 'user_id'),
     ) 
\ No newline at end of file
@@ -1,10 +1,16 @@
-from sqlalchemy import Column, BigInteger, String, Boolean, Integer, ARRAY, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, BigInteger, String, Boolean, Integer, ARRAY, ForeignKey, Index, Computed, false
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred, query_expression
 from app.db.models.timestamp_mixin import TimestampMixin
 from app.db.database import Base
 
 class FreePost(TimestampMixin, Base):
     __tablename__ = 'free_posts'
+    __table_args__ = (
+        # 공지 우선 + 최신순 목록
+        Index('ix_free_posts_notice_crt_date', 'is_notice', 'crt_date'),
+        Index('ix_free_posts_search_vector', 'search_vector', postgresql_using='gin'),
+    )
     
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     board_id = Column(BigInteger, ForeignKey('free_boards.id'), nullable=False)
@@ -15,7 +21,7 @@ class FreePost(TimestampMixin, Base):
     like_count = Column(Integer, default=0)
     comment_count = Column(Integer, default=0)
     is_deleted = Column(Boolean, default=False)
-    is_notice = Column(Boolean, default=False)
+    is_notice = Column(Boolean, default=False, server_default=false(), nullable=False)
     
     # 자유 게시판 특화 필드
     category = Column(String(50))  # 'general', 'question', 'discussion', 'humor'
@@ -24,6 +30,14 @@ class FreePost(TimestampMixin, Base):
     is_hot = Column(Boolean, default=False)  # 인기글 여부
     tags = Column(ARRAY(String))
     
+    # 검색용 2-gram tsvector (DB 생성 컬럼, 0004 마이그레이션의 board_bigrams 참고)
+    search_vector = deferred(Column(
+        TSVECTOR, Computed("setweight(board_bigrams(title), 'A') || setweight(board_bigrams(content), 'B')", persisted=True)
+    ))
+    
+    # 인기순 목록에서만 post_hot_scores.score로 채워짐 (pagination.join_hot_scores)
+    hot_score = query_expression()
+    
     # 관계 설정
     board = relationship('FreeBoard', back_populates='posts')
     user = relationship('User', backref='free_posts')
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, BigInteger, String, Float, TIMESTAMP, Index, PrimaryKeyConstraint
+from app.db.database import Base
+
+class PostHotScore(Base):
+    """게시글 인기 점수 (compute_hot_scores 배치가 최근 조회/좋아요/댓글로 주기적으로 다시 계산)"""
+    __tablename__ = 'post_hot_scores'
+    __table_args__ = (
+        PrimaryKeyConstraint('post_type', 'post_id', name='pk_post_hot_scores'),
+    )
+    
+    post_type = Column(String(20), nullable=False)  # 'strategy', 'free'
+    post_id = Column(BigInteger, nullable=False)
+    score = Column(Float, nullable=False)
+    computed_at = Column(TIMESTAMP(timezone=True), nullable=False)
+
+# 인기순 목록: post_type 범위를 점수 내림차순으로 그대로 읽음
+Index('ix_post_hot_scores_type_score', PostHotScore.post_type, PostHotScore.score.desc(), PostHotScore.post_id.desc())
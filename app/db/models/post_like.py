@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, String, ForeignKey, UniqueConstraint, Boolean
+from sqlalchemy import Column, BigInteger, String, ForeignKey, UniqueConstraint, Boolean, Index
 from sqlalchemy.orm import relationship
 from app.db.models.timestamp_mixin import TimestampMixin
 from app.db.database import Base
@@ -15,6 +15,8 @@ class PostLike(TimestampMixin, Base):
     # 복합 유니크 제약조건
     __table_args__ = (
         UniqueConstraint('post_type', 'post_id', 'user_id', name='uq_post_like'),
+        # 사용자별 좋아요 여부 조회 (목록/상세의 is_liked)
+        Index('ix_post_likes_user_type_post_active', 'user_id', 'post_type', 'post_id', 'is_active'),
     )
     
     # 관계 설정
@@ -1,10 +1,16 @@
-from sqlalchemy import Column, BigInteger, String, ForeignKey
+from sqlalchemy import Column, BigInteger, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.db.models.timestamp_mixin import TimestampMixin
 from app.db.database import Base
 
 class PostView(TimestampMixin, Base):
     __tablename__ = 'post_views'
+    __table_args__ = (
+        # 중복 조회 방지 확인
+        Index('ix_post_views_type_post_user', 'post_type', 'post_id', 'user_id'),
+        # 인기 점수 계산 시 최근 조회만 범위 스캔
+        Index('ix_post_views_type_crt_date', 'post_type', 'crt_date'),
+    )
     
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     post_type = Column(String(20), nullable=False)  # 'strategy', 'free'
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, BigInteger, String, DateTime, ForeignKey
+from sqlalchemy import Column, BigInteger, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.db.models.timestamp_mixin import TimestampMixin
 from app.db.database import Base
 
 class RefreshToken(TimestampMixin, Base):
     __tablename__ = 'tb_refresh_token'
+    __table_args__ = (
+        # 만료 토큰 정리
+        Index('ix_refresh_token_expires_at', 'expires_at'),
+    )
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     user_id = Column(BigInteger, ForeignKey('tb_user.id', ondelete='CASCADE'), nullable=False)
     account_id = Column(BigInteger, ForeignKey('tb_account.id', ondelete='CASCADE'), nullable=False)
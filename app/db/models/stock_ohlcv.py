@@ -1,8 +1,13 @@
-from sqlalchemy import Column, BigInteger, Numeric, Date, Text, ForeignKey
+from sqlalchemy import Column, BigInteger, Numeric, Date, Text, ForeignKey, Index
 from app.db.database import Base
 
 class StockOhlcv(Base):
     __tablename__ = 'tb_stock_ohlcv'
+    # ymd 기준 연도별 range 파티션 (파티션 생성/분리는 app.db.partitions, 0003 마이그레이션 참고)
+    __table_args__ = (
+        Index('ix_stock_ohlcv_ymd_brin', 'ymd', postgresql_using='brin'),
+        {'postgresql_partition_by': 'RANGE (ymd)'},
+    )
 
     stock_id = Column(BigInteger, ForeignKey('tb_stock_info.id'), primary_key=True)
     ymd = Column(Date, primary_key=True)
@@ -1,9 +1,13 @@
-from sqlalchemy import Column, BigInteger, ForeignKey, Numeric, Text
+from sqlalchemy import Column, BigInteger, ForeignKey, Numeric, Text, Index
 from app.db.models.timestamp_mixin import TimestampMixin
 from app.db.database import Base 
 
 class StockSectorRelation(TimestampMixin, Base):
     __tablename__ = 'tb_relation_stock_sector'
+    __table_args__ = (
+        # 업종 상세의 종목 목록 조회 (PK 선두 컬럼이 stock_id라 별도 인덱스 필요)
+        Index('ix_relation_stock_sector_sector_id', 'sector_id'),
+    )
 
     stock_id = Column(BigInteger, ForeignKey('tb_stock_info.id'), primary_key=True)
     sector_id = Column(BigInteger, ForeignKey('tb_sector_info.id'), primary_key=True)
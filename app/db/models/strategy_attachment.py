@@ -1,10 +1,13 @@
-from sqlalchemy import Column, BigInteger, String, Boolean, Integer, ForeignKey
+from sqlalchemy import Column, BigInteger, String, Boolean, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.db.models.timestamp_mixin import TimestampMixin
 from app.db.database import Base
 
 class StrategyAttachment(TimestampMixin, Base):
     __tablename__ = 'strategy_attachments'
+    __table_args__ = (
+        Index('ix_strategy_attachments_post_id', 'post_id'),
+    )
     
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     post_id = Column(BigInteger, ForeignKey('strategy_posts.id'), nullable=False)
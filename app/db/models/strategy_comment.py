@@ -1,18 +1,25 @@
-from sqlalchemy import Column, BigInteger, String, Boolean, Integer, ForeignKey
+from sqlalchemy import Column, BigInteger, String, Text, Boolean, Integer, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from app.db.models.timestamp_mixin import TimestampMixin
 from app.db.database import Base
 
 class StrategyComment(TimestampMixin, Base):
     __tablename__ = 'strategy_comments'
+    __table_args__ = (
+        # 트리 순서 조회 (app/service/board/comments.py)
+        Index('ix_strategy_comments_post_path', 'post_id', 'path'),
+        Index('ix_strategy_comments_post_root_path', 'post_id', 'path', postgresql_where=text('parent_id IS NULL')),
+    )
     
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     post_id = Column(BigInteger, ForeignKey('strategy_posts.id'), nullable=False)
     user_id = Column(BigInteger, ForeignKey('tb_user.id'), nullable=False)
     parent_id = Column(BigInteger, ForeignKey('strategy_comments.id'))
     content = Column(String, nullable=False)
+    path = Column(Text(collation='C'), nullable=False)  # 조상~자신 id의 고정 폭 base36 경로
     depth = Column(Integer, default=0)
     is_deleted = Column(Boolean, default=False)
+    like_count = Column(Integer, default=0)
     
     # 전략 댓글 특화 필드
     is_analysis = Column(Boolean, default=False)  # 분석 댓글 여부
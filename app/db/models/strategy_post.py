@@ -1,10 +1,16 @@
-from sqlalchemy import Column, BigInteger, String, Boolean, Integer, ARRAY, DECIMAL, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, BigInteger, String, Boolean, Integer, ARRAY, DECIMAL, ForeignKey, Index, Computed, false
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred, query_expression
 from app.db.models.timestamp_mixin import TimestampMixin
 from app.db.database import Base
 
 class StrategyPost(TimestampMixin, Base):
     __tablename__ = 'strategy_posts'
+    __table_args__ = (
+        # 공지 우선 + 최신순 목록
+        Index('ix_strategy_posts_notice_crt_date', 'is_notice', 'crt_date'),
+        Index('ix_strategy_posts_search_vector', 'search_vector', postgresql_using='gin'),
+    )
     
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     board_id = Column(BigInteger, ForeignKey('strategy_boards.id'), nullable=True)
@@ -15,7 +21,7 @@ class StrategyPost(TimestampMixin, Base):
     like_count = Column(Integer, default=0)
     comment_count = Column(Integer, default=0)
     is_deleted = Column(Boolean, default=False)
-    is_notice = Column(Boolean, default=False)
+    is_notice = Column(Boolean, default=False, server_default=false(), nullable=False)
     
     # 전략 게시판 특화 필드
     related_stock_id = Column(BigInteger, ForeignKey('tb_stock_info.id'))
@@ -29,6 +35,14 @@ class StrategyPost(TimestampMixin, Base):
     holding_period = Column(String(50))  # 'short', 'medium', 'long'
     tags = Column(ARRAY(String))
     
+    # 검색용 2-gram tsvector (DB 생성 컬럼, 0004 마이그레이션의 board_bigrams 참고)
+    search_vector = deferred(Column(
+        TSVECTOR, Computed("setweight(board_bigrams(title), 'A') || setweight(board_bigrams(content), 'B')", persisted=True)
+    ))
+    
+    # 인기순 목록에서만 post_hot_scores.score로 채워짐 (pagination.join_hot_scores)
+    hot_score = query_expression()
+    
     # 관계 설정
     board = relationship('StrategyBoard', back_populates='posts')
     user = relationship('User', backref='strategy_posts')
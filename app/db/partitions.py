@@ -0,0 +1,70 @@
+"""tb_stock_ohlcv 연도별 range 파티션 관리
+
+부모 테이블은 PARTITION BY RANGE (ymd) 이고 파티션 이름은 tb_stock_ohlcv_y{연도} 이다.
+DEFAULT 파티션은 두지 않으므로(새 파티션 생성 시 DEFAULT 스캔/충돌 방지) 적재 전에 ensure 해야 한다.
+"""
+import logging
+import re
+
+from sqlalchemy import text
+
+logger = logging.getLogger('app.db')
+
+STOCK_OHLCV_TABLE = 'tb_stock_ohlcv'
+PARTITION_NAME_RE = re.compile(rf'^{STOCK_OHLCV_TABLE}_y(\d{{4}})$')
+
+_EXISTING_PARTITIONS_SQL = text("""
+    SELECT child.relname
+    FROM pg_inherits
+    JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+    JOIN pg_namespace ns ON ns.oid = parent.relnamespace
+    WHERE parent.relname = :table AND ns.nspname = current_schema()
+""")
+
+
+def partition_name(year):
+    return f'{STOCK_OHLCV_TABLE}_y{int(year)}'
+
+
+def list_stock_ohlcv_partitions(connection):
+    """현재 붙어 있는 파티션 연도 목록 (오름차순)"""
+    names = connection.execute(_EXISTING_PARTITIONS_SQL, {'table': STOCK_OHLCV_TABLE}).scalars().all()
+    return sorted(int(m.group(1)) for m in map(PARTITION_NAME_RE.match, names) if m)
+
+
+def ensure_stock_ohlcv_partitions(connection, years):
+    """주어진 연도의 파티션이 없으면 생성하고, 새로 만든 연도 목록을 반환
+
+    생성은 호출한 쪽 트랜잭션에 포함되어 롤백되면 함께 취소되므로, 프로세스 내 캐시 대신 매번 카탈로그를 확인한다.
+    (pg_inherits 조회 1회라 적재 쿼리에 비해 비용이 작고, 이미 있으면 DDL 락을 잡지 않음)
+    """
+    years = {int(y) for y in years}
+    if not years:
+        return []
+    existing = set(list_stock_ohlcv_partitions(connection))
+    created = []
+    for year in sorted(years - existing):
+        connection.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {partition_name(year)} PARTITION OF {STOCK_OHLCV_TABLE} "
+            f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+        ))
+        created.append(year)
+        logger.info(f"{partition_name(year)} 파티션 생성")
+    return created
+
+
+def detach_stock_ohlcv_partition(connection, year, archive_schema=None):
+    """파티션을 부모에서 분리하고, archive_schema가 있으면 그 스키마로 옮겨 보관
+
+    분리된 테이블은 조회 경로에서 빠지지만 데이터는 남으므로 pg_dump 후 DROP 하면 된다.
+    """
+    name = partition_name(year)
+    connection.execute(text(f"ALTER TABLE {STOCK_OHLCV_TABLE} DETACH PARTITION {name}"))
+    if archive_schema:
+        connection.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{archive_schema}"'))
+        connection.execute(text(f'ALTER TABLE {name} SET SCHEMA "{archive_schema}"'))
+        logger.info(f"{name} 파티션 분리 후 {archive_schema} 스키마로 보관")
+    else:
+        logger.info(f"{name} 파티션 분리")
+    return name
@@ -0,0 +1,102 @@
+import logging
+import threading
+import time
+from sqlalchemy import text
+
+logger = logging.getLogger('app.db')
+
+# 복제 지연(초). WAL 수신/재생 위치가 같으면 유휴 상태이므로 0으로 본다.
+REPLICATION_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+class Replica:
+    def __init__(self, name, engine, async_engine):
+        self.name = name
+        self.engine = engine
+        self.async_engine = async_engine
+        # 첫 점검 전까지는 primary 사용
+        self.healthy = False
+        self.lag = 0.0
+        self.checked_at = 0.0
+
+
+class ReplicaRouter:
+    """조회 요청을 복제본에 라운드로빈으로 분배하고, 지연/장애 시 primary로 되돌린다.
+
+    연결/지연 점검은 스케줄러가 check_interval마다 check()로 실행하고, 요청 경로(pick)는 마지막 점검 결과만 본다.
+    죽은 복제본의 연결 타임아웃을 요청이 기다리지 않도록 하기 위함이다.
+    """
+
+    # 점검 결과가 이 횟수만큼의 주기 동안 갱신되지 않으면(스케줄러 중단 등) 상태를 알 수 없으므로 사용하지 않음
+    STALE_CHECKS = 3
+
+    def __init__(self, replicas, max_lag_seconds, check_interval):
+        self.replicas = replicas
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._next = 0
+
+    def _candidates(self):
+        with self._lock:
+            start = self._next
+            self._next = (self._next + 1) % len(self.replicas)
+        return self.replicas[start:] + self.replicas[:start]
+
+    def _available(self, replica):
+        fresh = time.monotonic() - replica.checked_at < self.check_interval * self.STALE_CHECKS
+        return replica.healthy and fresh
+
+    def _record(self, replica, lag=None, error=None):
+        # 첫 점검은 이전 상태가 없으므로 결과를 그대로 기록
+        first = replica.checked_at == 0.0
+        was_healthy = replica.healthy
+        replica.checked_at = time.monotonic()
+        if error is not None:
+            replica.healthy = False
+            if was_healthy or first:
+                logger.warning(f'복제본 {replica.name} 연결 실패, primary로 전환: {error}')
+            return
+        replica.lag = float(lag or 0)
+        replica.healthy = replica.lag <= self.max_lag_seconds
+        if (was_healthy or first) and not replica.healthy:
+            logger.warning(f'복제본 {replica.name} 지연 {replica.lag:.1f}s, primary로 전환')
+        elif first:
+            logger.info(f'복제본 {replica.name} 사용 시작 (지연 {replica.lag:.1f}s)')
+        elif not was_healthy and replica.healthy:
+            logger.info(f'복제본 {replica.name} 복구 (지연 {replica.lag:.1f}s)')
+
+    def check(self):
+        """모든 복제본의 연결/복제 지연 점검 (동기/비동기 엔진은 같은 서버를 가리키므로 동기 엔진으로 한 번만)"""
+        for replica in self.replicas:
+            try:
+                with replica.engine.connect() as conn:
+                    self._record(replica, lag=conn.execute(REPLICATION_LAG_SQL).scalar())
+            except Exception as e:
+                self._record(replica, error=e)
+
+    def pick(self):
+        """사용 가능한 복제본의 동기 엔진, 없으면 None"""
+        for replica in self._candidates():
+            if self._available(replica):
+                return replica.engine
+        return None
+
+    async def pick_async(self):
+        """사용 가능한 복제본의 비동기 엔진, 없으면 None"""
+        for replica in self._candidates():
+            if self._available(replica):
+                return replica.async_engine
+        return None
+
+    def status(self):
+        return [
+            {'name': r.name, 'healthy': self._available(r), 'lag_seconds': round(r.lag, 3)}
+            for r in self.replicas
+        ]
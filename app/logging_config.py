@@ -12,6 +12,7 @@ LOG_CONFIG = {
     'app.service.batch': os.path.join(LOG_DIR, 'batch.log'),
     'app.service.kiwoom': os.path.join(LOG_DIR, 'kiwoom.log'),
     'app.db': os.path.join(LOG_DIR, 'db.log'),
+    'app.service.export': os.path.join(LOG_DIR, 'export.log'),
     # 필요시 추가
 }
 
@@ -1,4 +1,4 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from app.api import theme_info
 from app.api import index_info
@@ -6,16 +6,25 @@ from app.api import auth
 from app.api import strategy_board
 from app.api import free_board
 from app.api import sector_info
+from app.api import stock_ohlcv
+from app.api import export
+from app.api.auth import require_superuser
 from app.db.init_db import init_db
+from app.db.database import get_pool_stats, replica_router
 from app.service.batch.daemon import start_scheduler, shutdown_scheduler
+from app.service.auth.password import shutdown_password_pool
+from app.core.http_client import start_http_client, close_http_client
 from datetime import datetime
 
 init_db()
 
 async def lifespan(app):
+    await start_http_client()
     await start_scheduler()
     yield
     await shutdown_scheduler()
+    shutdown_password_pool()
+    await close_http_client()
 
 app = FastAPI(lifespan=lifespan)
 
@@ -26,6 +35,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 app.include_router(theme_info.router)
@@ -34,6 +44,8 @@ app.include_router(auth.router)
 app.include_router(strategy_board.router)
 app.include_router(free_board.router)
 app.include_router(sector_info.router)
+app.include_router(stock_ohlcv.router)
+app.include_router(export.router)
 @app.get("/")
 def read_root():
     return {"message": "Stock Theme Backend API"}
@@ -42,3 +54,8 @@ def read_root():
 def health_check():
     current_time = datetime.now().isoformat()
     return {"status": "healthy", "timestamp": current_time}
+
+# 풀 크기/사용량과 복제본 이름/지연이 노출되므로 관리자만 조회
+@app.get("/health/db-pools", dependencies=[Depends(require_superuser)])
+def db_pool_stats():
+    return {"pools": get_pool_stats(), "replicas": replica_router.status(), "timestamp": datetime.now().isoformat()}
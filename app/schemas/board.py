@@ -11,6 +11,7 @@ class SortOrder(str, Enum):
     VIEWS = "views"        # 조회수순
     LIKES = "likes"        # 좋아요순
     COMMENTS = "comments"  # 댓글수순
+    HOT = "hot"            # 인기순 (최근 활동 기준, post_hot_scores)
 
 # 전략 타입
 class StrategyType(str, Enum):
@@ -103,6 +104,8 @@ class CommentResponse(BaseModel):
     crt_date: datetime
     mod_date: Optional[datetime]
     children: List['CommentResponse'] = []
+    has_more_replies: bool = False  # 답글이 더 있으면 /comments/{id}/replies로 추가 조회
+    replies_cursor: Optional[str] = None  # 추가 조회 시작 커서 (이미 받은 답글 이후)
     
     class Config:
         from_attributes = True
@@ -155,6 +158,7 @@ class PostDetailResponse(BaseModel):
     mod_date: Optional[datetime]
     attachments: List[AttachmentResponse] = []
     comments: List[CommentResponse] = []
+    comments_next_cursor: Optional[str] = None  # 다음 루트 댓글 페이지 (/posts/{id}/comments)
     
     # 전략 게시판 특화 필드
     strategy_type: Optional[StrategyType] = None
@@ -179,7 +183,25 @@ class LikeResponse(BaseModel):
 # 페이지네이션 응답
 class PaginatedResponse(BaseModel):
     items: List[PostListResponse]
-    total: int
-    page: int
+    total: int  # 캐시된 개수라 최근 작성분이 잠시 반영되지 않을 수 있음
+    page: Optional[int] = None  # 커서 모드에서는 None
     size: int
-    total_pages: int 
\ No newline at end of file
+    total_pages: int
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
+
+# 검색 결과 항목 (title_highlight/snippet은 검색어를 <mark>로 감싼 HTML)
+class SearchResultResponse(PostListResponse):
+    score: float
+    title_highlight: str
+    snippet: str
+
+# 검색 응답 (관련도순 커서 페이지네이션)
+class SearchResponse(BaseModel):
+    items: List[SearchResultResponse]
+    size: int
+    next_cursor: Optional[str] = None
+
+# 댓글 페이지 응답 (루트 스레드 / 답글 추가 조회)
+class CommentPageResponse(BaseModel):
+    items: List[CommentResponse]
+    next_cursor: Optional[str] = None
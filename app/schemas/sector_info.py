@@ -18,4 +18,4 @@ class SectorInfoResponse(SectorInfoBase):
     mod_date: Optional[datetime]
 
     class Config:
-        orm_mode = True 
\ No newline at end of file
+        from_attributes = True
\ No newline at end of file
@@ -0,0 +1,41 @@
+from pydantic import BaseModel
+from typing import Optional, List, Any
+from datetime import date
+
+class StockOhlcvBase(BaseModel):
+    ymd: date
+    open: Optional[float]
+    high: Optional[float]
+    low: Optional[float]
+    close: Optional[float]
+    volume: Optional[int]
+    change_rate: Optional[float]
+    trading_value: Optional[float]
+
+class StockOhlcvResponse(StockOhlcvBase):
+    # 투자자별 거래대금/거래량
+    trading_value_institution: Optional[float]
+    trading_value_other_corporation: Optional[float]
+    trading_value_individual: Optional[float]
+    trading_value_foreign: Optional[float]
+    volume_institution: Optional[float]
+    volume_other_corporation: Optional[float]
+    volume_individual: Optional[float]
+    volume_foreign: Optional[float]
+
+    class Config:
+        from_attributes = True
+
+class StockOhlcvPageResponse(BaseModel):
+    ticker: str
+    name: Optional[str]
+    items: List[StockOhlcvResponse]
+    next_cursor: Optional[date] = None
+
+# 차트용 압축 응답 (columns 순서대로 배열의 배열)
+class StockOhlcvCompactResponse(BaseModel):
+    ticker: str
+    name: Optional[str]
+    columns: List[str]
+    data: List[List[Any]]
+    next_cursor: Optional[date] = None
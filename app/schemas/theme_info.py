@@ -20,4 +20,4 @@ class ThemeInfoResponse(ThemeInfoBase):
     mod_date: Optional[datetime]
 
     class Config:
-        orm_mode = True 
\ No newline at end of file
+        from_attributes = True
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""구글 OAuth: 인가 코드 교환 + id_token 로컬 검증
+
+userinfo API를 따로 호출하지 않고, 토큰 응답의 id_token을 캐시된 구글 공개키(JWKS)로 검증해 사용자 정보를 얻는다.
+"""
+import asyncio
+import logging
+import os
+import re
+import time
+
+from jose import jwt, JWTError
+
+from app.config import GOOGLE_JWKS_CACHE_TTL
+from app.core.http_client import get_http_client
+
+logger = logging.getLogger('app.api')
+
+GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
+GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET")
+GOOGLE_REDIRECT_URI = os.getenv("GOOGLE_REDIRECT_URI")
+
+GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
+GOOGLE_JWKS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+GOOGLE_ISSUERS = ("https://accounts.google.com", "accounts.google.com")
+
+_MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+
+
+class GoogleAuthError(Exception):
+    pass
+
+
+class _JwksCache:
+    """kid -> JWK, 만료되었거나 모르는 kid(키 교체)면 다시 받음 (동시 갱신은 한 번만)"""
+
+    def __init__(self):
+        self.keys = {}
+        self.expires_at = 0.0
+        self._lock = None
+
+    async def get(self, kid):
+        if kid not in self.keys or time.monotonic() >= self.expires_at:
+            if self._lock is None:
+                self._lock = asyncio.Lock()
+            async with self._lock:
+                if kid not in self.keys or time.monotonic() >= self.expires_at:
+                    await self._refresh()
+        return self.keys.get(kid)
+
+    async def _refresh(self):
+        resp = await get_http_client().get(GOOGLE_JWKS_URL)
+        if resp.status_code != 200:
+            logger.error(f"구글 JWKS 조회 실패: {resp.status_code}")
+            raise GoogleAuthError("구글 공개키 조회 실패")
+        match = _MAX_AGE_RE.search(resp.headers.get('cache-control', ''))
+        ttl = int(match.group(1)) if match else GOOGLE_JWKS_CACHE_TTL
+        self.keys = {key['kid']: key for key in resp.json().get('keys', [])}
+        self.expires_at = time.monotonic() + ttl
+
+
+jwks_cache = _JwksCache()
+
+
+async def exchange_code(code):
+    """인가 코드 -> 토큰 응답 (access_token, id_token, refresh_token ...)"""
+    data = {
+        "code": code,
+        "client_id": GOOGLE_CLIENT_ID,
+        "client_secret": GOOGLE_CLIENT_SECRET,
+        "redirect_uri": GOOGLE_REDIRECT_URI,
+        "grant_type": "authorization_code",
+    }
+    resp = await get_http_client().post(GOOGLE_TOKEN_URL, data=data)
+    if resp.status_code != 200:
+        logger.error(f"구글 토큰 요청 실패: {resp.status_code}")
+        raise GoogleAuthError("구글 토큰 요청 실패")
+    tokens = resp.json()
+    if not tokens.get("access_token") or not tokens.get("id_token"):
+        logger.error("구글 access_token/id_token 획득 실패")
+        raise GoogleAuthError("구글 access_token 획득 실패")
+    return tokens
+
+
+async def verify_id_token(id_token, access_token=None):
+    """서명(RS256)/aud/iss/exp/at_hash를 검증한 id_token 클레임 (이메일 미인증이면 거절)"""
+    try:
+        kid = jwt.get_unverified_header(id_token).get('kid')
+    except JWTError as e:
+        raise GoogleAuthError("구글 id_token 형식 오류") from e
+    key = await jwks_cache.get(kid)
+    if key is None:
+        raise GoogleAuthError("구글 id_token 서명 키를 찾을 수 없습니다")
+    try:
+        claims = jwt.decode(
+            id_token, key, algorithms=['RS256'],
+            audience=GOOGLE_CLIENT_ID, issuer=GOOGLE_ISSUERS, access_token=access_token,
+        )
+    except JWTError as e:
+        logger.error(f"구글 id_token 검증 실패: {e}")
+        raise GoogleAuthError("구글 id_token 검증 실패") from e
+    if not claims.get('email') or not claims.get('email_verified'):
+        raise GoogleAuthError("구글 이메일 인증이 필요합니다")
+    return claims
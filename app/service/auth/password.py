@@ -0,0 +1,109 @@
+"""bcrypt 해시/검증 전용 프로세스 풀
+
+bcrypt는 호출마다 수십~수백 ms CPU를 쓰므로 API 스레드/이벤트 루프 대신 크기가 고정된 프로세스 풀에서 실행한다.
+풀에 들어가 있는(실행 중 + 대기) 작업이 PASSWORD_HASH_MAX_PENDING을 넘으면 바로 PasswordHasherBusy로 거절해
+로그인 폭주가 다른 API를 굶기지 않게 한다.
+"""
+import asyncio
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from passlib.context import CryptContext
+
+from app.config import (
+    PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_PENDING, PASSWORD_HASH_TIMEOUT, PASSWORD_HASH_RETRY_AFTER,
+)
+
+logger = logging.getLogger('app.api')
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+class PasswordHasherBusy(Exception):
+    """대기 건수 초과 (클라이언트가 retry_after 초 후 재시도)"""
+
+    def __init__(self, retry_after=PASSWORD_HASH_RETRY_AFTER):
+        super().__init__('password hasher is busy')
+        self.retry_after = retry_after
+
+
+class PasswordHasherUnavailable(Exception):
+    """풀 장애 또는 시간 초과"""
+
+    def __init__(self, retry_after=PASSWORD_HASH_RETRY_AFTER):
+        super().__init__('password hasher is unavailable')
+        self.retry_after = retry_after
+
+
+# 워커 프로세스에서 실행되는 함수 (pickle 가능한 모듈 최상위 함수여야 함)
+def _hash(password):
+    return pwd_context.hash(password)
+
+
+def _verify(password, hashed):
+    return pwd_context.verify(password, hashed)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(PASSWORD_HASH_MAX_PENDING)
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # fork는 스케줄러/DB 풀 스레드 상태까지 복제하므로 spawn 사용
+            _pool = ProcessPoolExecutor(
+                max_workers=PASSWORD_HASH_WORKERS, mp_context=multiprocessing.get_context('spawn')
+            )
+        return _pool
+
+
+def _reset_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+async def _run(fn, *args):
+    if not _slots.acquire(blocking=False):
+        raise PasswordHasherBusy()
+    try:
+        pool_future = _get_pool().submit(fn, *args)
+    except BaseException:
+        _slots.release()
+        raise
+    # 요청이 시간 초과로 먼저 끝나도 워커에서 실제로 끝날 때까지 자리를 차지하도록 완료 시점에 반환
+    pool_future.add_done_callback(lambda _: _slots.release())
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(pool_future), timeout=PASSWORD_HASH_TIMEOUT)
+    except asyncio.TimeoutError as e:
+        logger.error(f'비밀번호 해시 시간 초과 ({PASSWORD_HASH_TIMEOUT}s)')
+        raise PasswordHasherUnavailable() from e
+    except BrokenProcessPool as e:
+        # 워커가 비정상 종료되면 다음 요청부터 새 풀을 사용
+        logger.exception(f'비밀번호 해시 프로세스 풀 오류: {e}')
+        _reset_pool()
+        raise PasswordHasherUnavailable() from e
+
+
+async def hash_password(password: str) -> str:
+    return await _run(_hash, password)
+
+
+async def verify_password(password: str, hashed: str) -> bool:
+    return await _run(_verify, password, hashed)
+
+
+def shutdown_password_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+            _pool = None
@@ -0,0 +1,96 @@
+"""리프레시 토큰 저장소
+
+토큰 -> 계정 -> 사용자를 한 번의 조인 쿼리로 읽고 결과를 짧게 캐시한다.
+캐시는 조회만 대신하며, 로테이션/폐기는 항상 DB 행 삭제 결과로 판단하므로
+다른 프로세스 캐시에 남아 있는 토큰이라도 이미 쓰인 토큰은 재사용할 수 없다.
+"""
+import dataclasses
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import joinedload
+
+from app.core.cache import refresh_token_cache
+from app.db.models.account import Account
+from app.db.models.refresh_token import RefreshToken
+from app.db.models.user import User
+from app.schemas.user import UserResponse
+
+
+@dataclasses.dataclass(frozen=True)
+class RefreshTokenRecord:
+    token_id: int
+    expires_at: datetime
+    account_id: int
+    user_id: int
+    provider: str
+    email: str
+    user: UserResponse
+
+
+def token_key(hashed):
+    return f'refresh_token:{hashed}'
+
+
+def _aware(dt):
+    # timezone-naive datetime을 timezone-aware로 변환
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
+
+
+def lookup(db, hashed):
+    """만료 전 토큰이면 RefreshTokenRecord, 아니면 None"""
+    record = refresh_token_cache.get(token_key(hashed))
+    if record is None:
+        row = db.execute(
+            select(RefreshToken.id, RefreshToken.expires_at, Account.id, Account.provider, Account.email, User)
+            .join(Account, Account.id == RefreshToken.account_id)
+            .join(User, User.id == Account.user_id)
+            .options(joinedload(User.accounts))
+            .where(RefreshToken.token == hashed)
+        ).unique().first()
+        if row is None:
+            return None
+        token_id, expires_at, account_id, provider, email, user = row
+        record = RefreshTokenRecord(
+            token_id=token_id,
+            expires_at=_aware(expires_at),
+            account_id=account_id,
+            user_id=user.id,
+            provider=provider,
+            email=email,
+            user=UserResponse.model_validate(user),
+        )
+        refresh_token_cache.set(token_key(hashed), record)
+    if record.expires_at < datetime.now(timezone.utc):
+        return None
+    return record
+
+
+def rotate(db, hashed, record, new_hashed, new_expires_at):
+    """기존 토큰 삭제 + 새 토큰 저장을 한 트랜잭션으로 처리
+
+    기존 토큰이 이미 삭제(동시 로테이션/로그아웃)된 경우 아무것도 저장하지 않고 False를 반환한다.
+    """
+    deleted = db.execute(
+        delete(RefreshToken).where(RefreshToken.id == record.token_id).returning(RefreshToken.id)
+    ).first()
+    if deleted is None:
+        db.rollback()
+        refresh_token_cache.invalidate(token_key(hashed))
+        return False
+    db.add(RefreshToken(
+        user_id=record.user_id,
+        account_id=record.account_id,
+        token=new_hashed,
+        expires_at=new_expires_at,
+    ))
+    db.commit()
+    refresh_token_cache.invalidate(token_key(hashed))
+    return True
+
+
+def revoke(db, hashed):
+    """토큰 폐기 (조회 없이 바로 삭제)"""
+    db.execute(delete(RefreshToken).where(RefreshToken.token == hashed))
+    db.commit()
+    refresh_token_cache.invalidate(token_key(hashed))
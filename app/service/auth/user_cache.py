@@ -0,0 +1,88 @@
+"""get_current_user용 사용자 캐시
+
+토큰의 sub/account_id/provider/email 클레임은 토큰 수명 동안 바뀌지 않으므로 토큰에서 바로 쓰고,
+바뀔 수 있는 닉네임/프로필/활성/관리자 여부만 user_id별로 캐시한다.
+User가 ORM으로 수정/삭제되면 커밋 시점에 이 프로세스의 캐시를 무효화하고, 다른 프로세스에는 USER_CACHE_TTL 이후 반영된다.
+"""
+import dataclasses
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.cache import user_cache
+from app.db.models.user import User
+
+_SESSION_KEY = 'invalidate_user_ids'
+
+
+@dataclasses.dataclass(frozen=True)
+class AuthUser:
+    """요청 간에 공유되는 읽기 전용 사용자 스냅샷 (ORM 세션에 묶이지 않음)"""
+    id: int
+    username: Optional[str]
+    nickname: str
+    profile_img: Optional[str]
+    is_active: bool
+    is_superuser: bool
+    # 토큰 클레임
+    account_id: Optional[int] = None
+    provider: Optional[str] = None
+    email: Optional[str] = None
+
+
+def user_key(user_id):
+    return f'user:{user_id}'
+
+
+def get_auth_user(db, user_id, claims=None):
+    """캐시된 사용자 스냅샷에 토큰 클레임을 붙여 반환 (없는 사용자면 None)
+
+    캐시 적중 시 DB 세션은 커넥션을 잡지 않는다.
+    """
+    cached = user_cache.get(user_key(user_id))
+    if cached is None:
+        user = db.query(User).filter(User.id == user_id).first()
+        if user is None:
+            return None
+        cached = AuthUser(
+            id=user.id,
+            username=user.username,
+            nickname=user.nickname,
+            profile_img=user.profile_img,
+            is_active=bool(user.is_active),
+            is_superuser=bool(user.is_superuser),
+        )
+        user_cache.set(user_key(user_id), cached)
+    if not claims:
+        return cached
+    return dataclasses.replace(
+        cached,
+        account_id=claims.get('account_id'),
+        provider=claims.get('provider'),
+        email=claims.get('email'),
+    )
+
+
+def invalidate_user(user_id):
+    user_cache.invalidate(user_key(user_id))
+
+
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def _mark_user_changed(mapper, connection, target):
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.setdefault(_SESSION_KEY, set()).add(target.id)
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_committed_users(session):
+    # 커밋 전에 지우면 다른 요청이 이전 값을 다시 캐시할 수 있으므로 커밋 후 무효화
+    for user_id in session.info.pop(_SESSION_KEY, ()):
+        invalidate_user(user_id)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_user_changes(session):
+    session.info.pop(_SESSION_KEY, None)
@@ -0,0 +1,76 @@
+import datetime
+import logging
+
+from sqlalchemy import text
+
+from app.config import HOT_SCORE_WINDOW_HOURS, HOT_SCORE_HALF_LIFE_HOURS
+from app.core.cache import board_count_cache
+from app.db.database import batch_engine
+
+logger = logging.getLogger('app.service.batch')
+
+# 활동별 가중치
+VIEW_WEIGHT = 1.0
+COMMENT_WEIGHT = 3.0
+LIKE_WEIGHT = 5.0
+
+# (게시글 테이블, 댓글 테이블)
+BOARD_TABLES = {'free': ('free_posts', 'free_comments'), 'strategy': ('strategy_posts', 'strategy_comments')}
+
+# 최근 활동마다 weight * 0.5 ^ (경과 시간 / 반감기)를 더한 값으로 점수를 갱신
+# 좋아요는 토글 시각(mod_date) 기준, 삭제된 게시글은 제외
+UPSERT_SCORES_SQL = """
+    INSERT INTO post_hot_scores (post_type, post_id, score, computed_at)
+    SELECT :post_type, e.post_id,
+           sum(e.weight * power(0.5, extract(epoch FROM (:now - e.at)) / :half_life)),
+           :now
+    FROM (
+        SELECT post_id, crt_date AS at, :view_weight AS weight
+        FROM post_views WHERE post_type = :post_type AND crt_date >= :since
+        UNION ALL
+        SELECT post_id, coalesce(mod_date, crt_date), :like_weight
+        FROM post_likes WHERE post_type = :post_type AND is_active AND coalesce(mod_date, crt_date) >= :since
+        UNION ALL
+        SELECT post_id, crt_date, :comment_weight
+        FROM {comments} WHERE crt_date >= :since
+    ) e
+    JOIN {posts} p ON p.id = e.post_id AND NOT coalesce(p.is_deleted, false)
+    GROUP BY e.post_id
+    ON CONFLICT (post_type, post_id) DO UPDATE
+    SET score = excluded.score, computed_at = excluded.computed_at
+"""
+
+# 이번 계산에 포함되지 않은(최근 활동이 없는) 게시글은 인기순에서 제외
+DELETE_STALE_SQL = "DELETE FROM post_hot_scores WHERE post_type = :post_type AND computed_at < :now"
+
+
+def compute(connection, post_type, now=None):
+    """post_type 게시판의 인기 점수를 다시 계산하고 (갱신 수, 제외 수) 반환"""
+    now = now or datetime.datetime.now(datetime.timezone.utc)
+    posts, comments = BOARD_TABLES[post_type]
+    params = {
+        'post_type': post_type,
+        'now': now,
+        'since': now - datetime.timedelta(hours=HOT_SCORE_WINDOW_HOURS),
+        'half_life': HOT_SCORE_HALF_LIFE_HOURS * 3600,
+        'view_weight': VIEW_WEIGHT,
+        'like_weight': LIKE_WEIGHT,
+        'comment_weight': COMMENT_WEIGHT,
+    }
+    upserted = connection.execute(text(UPSERT_SCORES_SQL.format(posts=posts, comments=comments)), params).rowcount
+    removed = connection.execute(text(DELETE_STALE_SQL), params).rowcount
+    return upserted, removed
+
+
+def main():
+    """메인 실행 함수 (게시판별로 한 트랜잭션이라 목록 조회는 이전/새 점수 중 하나만 봄)"""
+    result = {}
+    for post_type in BOARD_TABLES:
+        with batch_engine.begin() as connection:
+            result[post_type] = compute(connection, post_type)
+        board_count_cache.invalidate_prefix(f'board_count:{post_type}:hot:')
+    logger.info(f"인기 점수 계산 완료 (갱신/제외: {result})")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,12 @@
 import logging
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 import asyncio
+from datetime import datetime
+
+from app.config import (
+    COUNTER_FLUSH_INTERVAL, HOT_SCORE_INTERVAL_MINUTES, REFRESH_TOKEN_SWEEP_INTERVAL_MINUTES,
+    DATABASE_REPLICA_URLS, REPLICA_HEALTH_CHECK_INTERVAL,
+)
 
 logger = logging.getLogger('app.service.batch')
 
@@ -41,6 +47,49 @@ def run_get_stock_info():
     except Exception as e:
         logger.exception(f'get_stock_info 실행 오류: {e}')
 
+def run_manage_ohlcv_partitions():
+    try:
+        from app.service.batch import manage_ohlcv_partitions
+        manage_ohlcv_partitions.main()
+        logger.info('manage_ohlcv_partitions 실행 완료')
+    except Exception as e:
+        logger.exception(f'manage_ohlcv_partitions 실행 오류: {e}')
+
+def run_compute_hot_scores():
+    try:
+        from app.service.batch import compute_hot_scores
+        compute_hot_scores.main()
+        logger.info('compute_hot_scores 실행 완료')
+    except Exception as e:
+        logger.exception(f'compute_hot_scores 실행 오류: {e}')
+
+def run_flush_board_counters():
+    from app.service.board.counters import flush_counters
+    flush_counters()
+
+def run_reconcile_board_counters():
+    try:
+        from app.service.batch import reconcile_board_counters
+        reconcile_board_counters.main()
+        logger.info('reconcile_board_counters 실행 완료')
+    except Exception as e:
+        logger.exception(f'reconcile_board_counters 실행 오류: {e}')
+
+def run_sweep_refresh_tokens():
+    try:
+        from app.service.batch import sweep_refresh_tokens
+        sweep_refresh_tokens.main()
+        logger.info('sweep_refresh_tokens 실행 완료')
+    except Exception as e:
+        logger.exception(f'sweep_refresh_tokens 실행 오류: {e}')
+
+def run_check_replicas():
+    try:
+        from app.db.database import replica_router
+        replica_router.check()
+    except Exception as e:
+        logger.exception(f'check_replicas 실행 오류: {e}')
+
 async def start_scheduler():
     global scheduler
     if scheduler is None:
@@ -49,6 +98,26 @@ async def start_scheduler():
         scheduler.add_job(run_get_naver_sector_info, 'cron', minute='*/10', hour='9-16', id='sector_info')
         scheduler.add_job(run_get_index_ohlcv, 'cron', hour=17, minute=0, id='index_ohlcv')
         scheduler.add_job(run_get_stock_info, 'cron', hour=17, minute=0, id='stock_info')
+        scheduler.add_job(run_manage_ohlcv_partitions, 'cron', hour=6, minute=0, id='ohlcv_partitions')
+        scheduler.add_job(
+            run_flush_board_counters, 'interval', seconds=COUNTER_FLUSH_INTERVAL,
+            id='board_counters_flush', max_instances=1, coalesce=True,
+        )
+        scheduler.add_job(
+            run_compute_hot_scores, 'interval', minutes=HOT_SCORE_INTERVAL_MINUTES,
+            id='hot_scores', max_instances=1, coalesce=True,
+        )
+        scheduler.add_job(run_reconcile_board_counters, 'cron', hour=4, minute=0, id='board_counters_reconcile')
+        scheduler.add_job(
+            run_sweep_refresh_tokens, 'interval', minutes=REFRESH_TOKEN_SWEEP_INTERVAL_MINUTES,
+            id='refresh_token_sweep', max_instances=1, coalesce=True,
+        )
+        if DATABASE_REPLICA_URLS:
+            # 복제본 상태는 요청 경로가 아닌 여기서만 점검 (시작 직후 첫 점검, 그전까지는 primary 사용)
+            scheduler.add_job(
+                run_check_replicas, 'interval', seconds=REPLICA_HEALTH_CHECK_INTERVAL,
+                id='replica_health', max_instances=1, coalesce=True, next_run_time=datetime.now(),
+            )
         scheduler.start()
         logger.info('배치 데몬 서비스 시작')
     return scheduler
@@ -57,6 +126,8 @@ async def shutdown_scheduler():
     global scheduler
     if scheduler is not None:
         scheduler.shutdown(wait=True)
+        # 종료 전 남은 카운터 증감분 반영
+        run_flush_board_counters()
         logger.info('배치 데몬 서비스 종료')
         scheduler = None
 
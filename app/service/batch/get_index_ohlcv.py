@@ -1,17 +1,18 @@
 import logging
-from app.db.database import SessionLocal
+from app.db.database import BatchSessionLocal
 from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert
 from app.db.models.index_info import IndexInfo
 import FinanceDataReader as fdr
 import numpy as np
 from app.db.models.index_ohlcv import IndexOhlcv
+from app.core.cache import market_cache
 
 logger = logging.getLogger('app.service.batch')
 
 class IndexOhlcvService:
     def __init__(self):
-        self.db = SessionLocal()
+        self.db = BatchSessionLocal()
 
     def get_index_list(self):
         stmt = select(IndexInfo.name)
@@ -66,6 +67,8 @@ def main():
     """메인 실행 함수"""
     index_ohlcv_service = IndexOhlcvService()
     index_ohlcv_service.download_and_upsert_all_index_ohlcv('2020-01-01', '2025-07-22')
+    # 지수 조회 캐시 무효화
+    market_cache.invalidate_prefix('index_all')
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
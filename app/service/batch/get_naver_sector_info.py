@@ -1,63 +1,45 @@
 import asyncio
 import logging
-from playwright.async_api import async_playwright
 import pandas as pd
-from app.db.database import SessionLocal
+from app.db.database import BatchSessionLocal
 from sqlalchemy.dialects.postgresql import insert
 from datetime import datetime, timezone
 from app.db.models.stock_info import StockInfo
 from app.db.models.sector_info import SectorInfo
 from app.db.models.stock_sector_relation import StockSectorRelation
+from app.core.cache import market_cache
+from app.service.batch.naver_finance import NAVER_FINANCE_URL, NaverFinanceClient
 
 logger = logging.getLogger('app.service.batch')
 
 NAVER_SECTOR_URL = "https://finance.naver.com/sise/sise_group.naver?type=upjong"
 
-async def fetch_sector_table(page):
-    rows = await page.locator('table.type_1 > tbody > tr').all()
-    logger.debug(f"  row 개수: {len(rows)}")
+def fetch_sector_table(rows):
+    """업종 목록 표(table.type_1) 행 -> 업종 레코드"""
     sector_data = []
     for idx, row in enumerate(rows):
         try:
-            tds = await row.locator('td').all()
-            if len(tds) < 2:
-                continue  # 데이터 row가 아님
-            a_count = await tds[0].locator('a').count()
-            if a_count == 0:
-                continue  # 테마명이 없는 row
-            sector_name = await tds[0].locator('a').inner_text()
-            sector_link = await tds[0].locator('a').get_attribute('href')
-            change_rate = await tds[1].inner_text()
-            up_ticker_count = await tds[3].inner_text()
-            neutral_ticker_count = await tds[4].inner_text()
-            down_ticker_count = await tds[5].inner_text()
+            cells = row.cells
+            sector_link = row.link
             if sector_link:
-                sector_link = f"https://finance.naver.com{sector_link}"
+                sector_link = f"{NAVER_FINANCE_URL}{sector_link}"
             sector_data.append({
-                '업종명': sector_name.strip(),
-                '전일대비': change_rate.strip(),
-                '상승종목수': up_ticker_count.strip(),
-                '보합종목수': neutral_ticker_count.strip(),
-                '하락종목수': down_ticker_count.strip(),
+                '업종명': row.name,
+                '전일대비': cells[1],
+                '상승종목수': cells[3],
+                '보합종목수': cells[4],
+                '하락종목수': cells[5],
                 '상세링크': sector_link
             })
-            if (idx + 1) % 10 == 0:
-                logger.debug(f"    {idx + 1}개 row 파싱 완료")
         except Exception as e:
             logger.error(f"    row {idx} 파싱 오류: {e}")
             continue
     logger.debug(f"  크롤링 완료, 총 {len(sector_data)}개")
     return sector_data
 
-async def fetch_sector_table_all():
-    logger.debug("브라우저 실행 및 업종 페이지 접속 중...")
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-        await page.goto(NAVER_SECTOR_URL)
-        logger.debug("업종 페이지 접속 완료, 데이터 크롤링 중...")
-        sector_data = await fetch_sector_table(page)
-        await browser.close()
+async def fetch_sector_table_all(client):
+    page_tables = await client.fetch_tables(NAVER_SECTOR_URL)
+    sector_data = fetch_sector_table(page_tables.rows['type_1'])
     logger.debug(f"전체 크롤링 완료, 총 {len(sector_data)}개")
     return sector_data
 
@@ -83,72 +65,47 @@ def validate_stock_data(stock_data):
     df['전일거래량'] = pd.to_numeric(df['전일거래량'].str.replace(',','').str.strip(), errors='coerce')
     return df
 
-async def fetch_all_sector_stocks(sector_df):
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-        all_stock_data = []
-        for idx, row in sector_df.iterrows():
-            sector_name = row['업종명']
-            sector_url = row['상세링크']
-            sector_code = None
-            if row['상세링크'] and 'no=' in row['상세링크']:
-                sector_code = row['상세링크'].split('no=')[-1]
-            if sector_name == '기타':
-                continue  # 기타 업종은 제외
-            logger.debug(f"{sector_name} 종목 크롤링 중...")
-            await page.goto(sector_url)
-            table1 = await page.locator('table.type_1 > tbody > tr').all()
-            for r in table1:
-                tds = await r.locator('td').all()
-                if len(tds) < 2:
-                    continue
-                a_count = await tds[0].locator('a').count()
-                if a_count == 0:
-                    continue
-            table5 = await page.locator('table.type_5 > tbody > tr').all()
-            for r in table5:
-                tds = await r.locator('td').all()
-                if len(tds) < 2:
-                    continue
-                a_count = await tds[0].locator('a').count()
-                if a_count == 0:
-                    continue
-                stock_name = await tds[0].locator('a').inner_text()
-                stock_link = await tds[0].locator('a').get_attribute('href')
-                current_price = await tds[1].inner_text()
-                diff_price = await tds[2].evaluate("""
-                    (node) => {
-                        // <em> 태그를 모두 제거
-                        node.querySelectorAll('em').forEach(em => em.remove());
-                        return node.innerText;
-                    }
-                """)
-                change_rate = await tds[3].inner_text()
-                volume = await tds[6].inner_text()
-                trading_value = await tds[7].inner_text()
-                volume_yesterday = await tds[8].inner_text()
-                ticker = None
-                if stock_link and 'code=' in stock_link:
-                    ticker = stock_link.split('code=')[-1]
-                all_stock_data.append({
-                    '업종코드': sector_code,
-                    '업종명': sector_name,
-                    '종목명': stock_name.strip(),
-                    '티커': ticker,
-                    '현재가': current_price,
-                    '전일대비': diff_price,
-                    '등락률': change_rate,
-                    '거래량': volume,
-                    '거래대금': trading_value,
-                    '전일거래량': volume_yesterday
-                })
-        await browser.close()
+async def fetch_all_sector_stocks(client, sector_df):
+    all_stock_data = []
+    sectors = []
+    for idx, row in sector_df.iterrows():
+        sector_name = row['업종명']
+        sector_code = None
+        if row['상세링크'] and 'no=' in row['상세링크']:
+            sector_code = row['상세링크'].split('no=')[-1]
+        if sector_name == '기타':
+            continue  # 기타 업종은 제외
+        sectors.append((sector_name, sector_code, row['상세링크']))
+    logger.debug(f"업종 {len(sectors)}개 종목 크롤링 중...")
+    # 상세 페이지는 병렬로 받되 결과는 업종 목록 순서대로 처리
+    results = await client.fetch_many([url for _, _, url in sectors], tables=('type_5',))
+    for (sector_name, sector_code, sector_url), page_tables in zip(sectors, results):
+        if page_tables is None:
+            logger.warning(f"{sector_name} 종목 크롤링 실패, 건너뜀")
+            continue
+        for r in page_tables.rows['type_5']:
+            cells = r.cells
+            stock_link = r.link
+            ticker = None
+            if stock_link and 'code=' in stock_link:
+                ticker = stock_link.split('code=')[-1]
+            all_stock_data.append({
+                '업종코드': sector_code,
+                '업종명': sector_name,
+                '종목명': r.name,
+                '티커': ticker,
+                '현재가': cells[1],
+                '전일대비': cells[2],
+                '등락률': cells[3],
+                '거래량': cells[6],
+                '거래대금': cells[7],
+                '전일거래량': cells[8]
+            })
     return pd.DataFrame(all_stock_data)
 
 class SectorInfoService:
     def __init__(self):
-        self.db = SessionLocal()
+        self.db = BatchSessionLocal()
 
     def upsert_sector_info(self, df):
         """크롤링된 업종 DataFrame을 tb_sector_info 테이블에 upsert"""
@@ -199,7 +156,7 @@ class SectorInfoService:
             self.db.close()
 
     def upsert_stock_sector_relation(self, stock_df):
-        db = SessionLocal()
+        db = BatchSessionLocal()
         try:
             # DB에서 필요한 id 매핑 정보 미리 조회
             stock_map = dict(db.query(StockInfo.ticker, StockInfo.id).all())
@@ -251,7 +208,7 @@ class SectorInfoService:
 
     def upsert_sector_description(self, sector_description_df):
         from app.db.models.sector_info import SectorInfo
-        db = SessionLocal()
+        db = BatchSessionLocal()
         try:
             # 업종코드 → sector_id 매핑
             sector_map = dict(db.query(SectorInfo.sector_code, SectorInfo.id).filter(SectorInfo.ref == '네이버').all())
@@ -273,16 +230,25 @@ class SectorInfoService:
             db.close()
 
 async def main():
-    # 섹터 크롤링
-    sector_data = await fetch_sector_table_all()
-    df = validate_sector_data(sector_data)
-    # DB upsert
-    sector_info_service = SectorInfoService()
-    sector_info_service.upsert_sector_info(df)
-    # 섹터별 종목 크롤링
-    stock_df = await fetch_all_sector_stocks(df)
-    stock_df = validate_stock_data(stock_df)
-    sector_info_service.upsert_stock_sector_relation(stock_df)
+    async with NaverFinanceClient() as client:
+        # 섹터 크롤링
+        sector_data = await fetch_sector_table_all(client)
+        df = validate_sector_data(sector_data)
+        # DB upsert
+        sector_info_service = SectorInfoService()
+        sector_info_service.upsert_sector_info(df)
+        try:
+            # 섹터별 종목 크롤링
+            stock_df = await fetch_all_sector_stocks(client, df)
+            if stock_df.empty:
+                # 상세 페이지가 모두 실패(차단 등)하면 빈 DataFrame - 관계는 이전 값 유지
+                logger.warning("업종 종목 데이터가 없어 관계 upsert를 건너뜀")
+            else:
+                stock_df = validate_stock_data(stock_df)
+                sector_info_service.upsert_stock_sector_relation(stock_df)
+        finally:
+            # 이미 upsert한 업종 목록이 있으므로 실패해도 목록/상세 캐시는 무효화
+            market_cache.invalidate_prefix('sector')
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
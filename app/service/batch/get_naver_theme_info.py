@@ -1,84 +1,55 @@
 import asyncio
 import logging
 from datetime import datetime, timezone
-from playwright.async_api import async_playwright
 import pandas as pd
-from app.db.database import SessionLocal
+from app.db.database import BatchSessionLocal
 from sqlalchemy.dialects.postgresql import insert
 from app.db.models.stock_info import StockInfo
 from app.db.models.theme_info import ThemeInfo
 from app.db.models.stock_theme_relation import StockThemeRelation
+from app.core.cache import market_cache
+from app.service.batch.naver_finance import NAVER_FINANCE_URL, NaverFinanceClient
 
 # 로거 설정
 logger = logging.getLogger('app.service.batch')
 
 NAVER_THEME_URL = "https://finance.naver.com/sise/theme.naver"
 
-async def get_last_page_num(page):
-    # 페이지 하단의 페이징 링크에서 마지막 페이지 번호 추출
-    page_links = await page.locator('table.Nnavi a').all()
-    page_nums = []
-    for link in page_links:
-        text = await link.inner_text()
-        if text.isdigit():
-            page_nums.append(int(text))
-    return max(page_nums) if page_nums else 1
-
-async def fetch_theme_table(page):
-    rows = await page.locator('table.type_1 > tbody > tr').all()
-    logger.debug(f"  row 개수: {len(rows)}")
+def fetch_theme_table(rows):
+    """테마 목록 표(table.type_1) 행 -> 테마 레코드"""
     theme_data = []
     for idx, row in enumerate(rows):
         try:
-            tds = await row.locator('td').all()
-            if len(tds) < 2:
-                continue  # 데이터 row가 아님
-            a_count = await tds[0].locator('a').count()
-            if a_count == 0:
-                continue  # 테마명이 없는 row
-            theme_name = await tds[0].locator('a').inner_text()
-            theme_link = await tds[0].locator('a').get_attribute('href')
-            change_rate = await tds[1].inner_text()
-            change_rate_3days = await tds[2].inner_text()
-            up_ticker_count = await tds[3].inner_text()
-            neutral_ticker_count = await tds[4].inner_text()
-            down_ticker_count = await tds[5].inner_text()
+            cells = row.cells
+            theme_link = row.link
             if theme_link:
-                theme_link = f"https://finance.naver.com{theme_link}"
+                theme_link = f"{NAVER_FINANCE_URL}{theme_link}"
             theme_data.append({
-                '테마명': theme_name.strip(),
-                '전일대비': change_rate.strip(),
-                '최근3일등락률(평균)': change_rate_3days.strip(),
-                '상승종목수': up_ticker_count.strip(),
-                '보합종목수': neutral_ticker_count.strip(),
-                '하락종목수': down_ticker_count.strip(),
+                '테마명': row.name,
+                '전일대비': cells[1],
+                '최근3일등락률(평균)': cells[2],
+                '상승종목수': cells[3],
+                '보합종목수': cells[4],
+                '하락종목수': cells[5],
                 '상세링크': theme_link
             })
-            if (idx + 1) % 10 == 0:
-                logger.debug(f"    {idx + 1}개 row 파싱 완료")
         except Exception as e:
             logger.error(f"    row {idx} 파싱 오류: {e}")
             continue
     logger.debug(f"  크롤링 완료, 총 {len(theme_data)}개")
     return theme_data
 
-async def fetch_theme_table_all_pages():
-    logger.debug("브라우저 실행 및 첫 페이지 접속 중...")
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-        await page.goto(NAVER_THEME_URL)
-        logger.debug("첫 페이지 접속 완료")
-        last_page = await get_last_page_num(page)
-        logger.debug(f"총 {last_page}페이지 탐색 예정")
-        all_theme_data = []
-        for page_num in range(1, last_page + 1):
-            url = f"{NAVER_THEME_URL}?&page={page_num}"
-            await page.goto(url)
-            logger.debug(f"{page_num}페이지 크롤링 중...")
-            theme_data = await fetch_theme_table(page)
-            all_theme_data.extend(theme_data)
-        await browser.close()
+async def fetch_theme_table_all_pages(client):
+    first = await client.fetch_tables(NAVER_THEME_URL)
+    last_page = first.last_page
+    logger.debug(f"총 {last_page}페이지 탐색 예정")
+    all_theme_data = fetch_theme_table(first.rows['type_1'])
+    urls = [f"{NAVER_THEME_URL}?&page={page_num}" for page_num in range(2, last_page + 1)]
+    for page_num, page_tables in enumerate(await client.fetch_many(urls), start=2):
+        if page_tables is None:
+            logger.warning(f"{page_num}페이지 크롤링 실패, 건너뜀")
+            continue
+        all_theme_data.extend(fetch_theme_table(page_tables.rows['type_1']))
     logger.debug(f"전체 크롤링 완료, 총 {len(all_theme_data)}개")
     return all_theme_data
 
@@ -105,78 +76,51 @@ def validate_stock_data(stock_data):
     df['전일거래량'] = pd.to_numeric(df['전일거래량'].str.replace(',','').str.strip(), errors='coerce')
     return df
 
-async def fetch_all_theme_stocks(theme_df):
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-        all_theme_description = []
-        all_stock_data = []
-        for idx, row in theme_df.iterrows():
-            theme_name = row['테마명']
-            theme_url = row['상세링크']
-            theme_code = None
-            if row['상세링크'] and 'no=' in row['상세링크']:
-                theme_code = row['상세링크'].split('no=')[-1]
-            logger.debug(f"{theme_name} 종목 크롤링 중...")
-            await page.goto(theme_url)
-            table1 = await page.locator('table.type_1 > tbody > tr').all()
-            for r in table1:
-                tds = await r.locator('td').all()
-                if len(tds) < 2:
-                    continue
-                a_count = await tds[0].locator('a').count()
-                if a_count == 0:
-                    continue
-                theme_description = await tds[0].locator('div.info_layer_wrap').locator('p').inner_text()
-                all_theme_description.append({
-                    '테마코드': theme_code,
-                    '설명': theme_description
-                })
-            table5 = await page.locator('table.type_5 > tbody > tr').all()
-            for r in table5:
-                tds = await r.locator('td').all()
-                if len(tds) < 2:
-                    continue
-                a_count = await tds[0].locator('a').count()
-                if a_count == 0:
-                    continue
-                stock_name = await tds[0].locator('a').inner_text()
-                stock_link = await tds[0].locator('a').get_attribute('href')
-                description = await tds[1].locator('div.info_layer_wrap').locator('p').inner_text()
-                current_price = await tds[2].inner_text()
-                diff_price = await tds[3].evaluate("""
-                    (node) => {
-                        // <em> 태그를 모두 제거
-                        node.querySelectorAll('em').forEach(em => em.remove());
-                        return node.innerText;
-                    }
-                """)
-                change_rate = await tds[4].inner_text()
-                volume = await tds[5].inner_text()
-                trading_value = await tds[6].inner_text()
-                volume_yesterday = await tds[7].inner_text()
-                ticker = None
-                if stock_link and 'code=' in stock_link:
-                    ticker = stock_link.split('code=')[-1]
-                all_stock_data.append({
-                    '테마코드': theme_code,
-                    '테마명': theme_name,
-                    '종목명': stock_name.strip(),
-                    '티커': ticker,
-                    '설명': description,
-                    '현재가': current_price,
-                    '전일대비': diff_price,
-                    '등락률': change_rate,
-                    '거래량': volume,
-                    '거래대금': trading_value,
-                    '전일거래량': volume_yesterday
-                })
-        await browser.close()
+async def fetch_all_theme_stocks(client, theme_df):
+    all_theme_description = []
+    all_stock_data = []
+    themes = []
+    for idx, row in theme_df.iterrows():
+        theme_code = None
+        if row['상세링크'] and 'no=' in row['상세링크']:
+            theme_code = row['상세링크'].split('no=')[-1]
+        themes.append((row['테마명'], theme_code, row['상세링크']))
+    logger.debug(f"테마 {len(themes)}개 종목 크롤링 중...")
+    # 상세 페이지는 병렬로 받되 결과는 테마 목록 순서대로 처리
+    results = await client.fetch_many([url for _, _, url in themes], tables=('type_1', 'type_5'))
+    for (theme_name, theme_code, theme_url), page_tables in zip(themes, results):
+        if page_tables is None:
+            logger.warning(f"{theme_name} 종목 크롤링 실패, 건너뜀")
+            continue
+        for r in page_tables.rows['type_1']:
+            all_theme_description.append({
+                '테마코드': theme_code,
+                '설명': r.descs[0]
+            })
+        for r in page_tables.rows['type_5']:
+            cells = r.cells
+            stock_link = r.link
+            ticker = None
+            if stock_link and 'code=' in stock_link:
+                ticker = stock_link.split('code=')[-1]
+            all_stock_data.append({
+                '테마코드': theme_code,
+                '테마명': theme_name,
+                '종목명': r.name,
+                '티커': ticker,
+                '설명': r.descs[1],
+                '현재가': cells[2],
+                '전일대비': cells[3],
+                '등락률': cells[4],
+                '거래량': cells[5],
+                '거래대금': cells[6],
+                '전일거래량': cells[7]
+            })
     return pd.DataFrame(all_stock_data), pd.DataFrame(all_theme_description)
 
 class ThemeInfoService:
     def __init__(self):
-        self.db = SessionLocal()
+        self.db = BatchSessionLocal()
 
     def upsert_theme_info(self, df):
         """크롤링된 테마 DataFrame을 tb_theme_info 테이블에 upsert"""
@@ -231,7 +175,7 @@ class ThemeInfoService:
             self.db.close()
 
     def upsert_stock_theme_relation(self, stock_df):
-        db = SessionLocal()
+        db = BatchSessionLocal()
         try:
             # DB에서 필요한 id 매핑 정보 미리 조회
             stock_map = dict(db.query(StockInfo.ticker, StockInfo.id).all())
@@ -285,7 +229,7 @@ class ThemeInfoService:
 
     def upsert_theme_description(self, theme_description_df):
         from app.db.models.theme_info import ThemeInfo
-        db = SessionLocal()
+        db = BatchSessionLocal()
         try:
             # 테마코드 → theme_id 매핑
             theme_map = dict(db.query(ThemeInfo.theme_code, ThemeInfo.id).filter(ThemeInfo.ref == '네이버').all())
@@ -307,17 +251,27 @@ class ThemeInfoService:
             db.close()
 
 async def main():
-    # 테마 크롤링
-    theme_data = await fetch_theme_table_all_pages()
-    df = validate_theme_data(theme_data)
-    # DB upsert
-    theme_info_service = ThemeInfoService()
-    theme_info_service.upsert_theme_info(df)
-    # 테마별 종목 크롤링
-    stock_df, theme_description_df = await fetch_all_theme_stocks(df)
-    stock_df = validate_stock_data(stock_df)
-    theme_info_service.upsert_stock_theme_relation(stock_df)
-    theme_info_service.upsert_theme_description(theme_description_df)
+    async with NaverFinanceClient() as client:
+        # 테마 크롤링
+        theme_data = await fetch_theme_table_all_pages(client)
+        df = validate_theme_data(theme_data)
+        # DB upsert
+        theme_info_service = ThemeInfoService()
+        theme_info_service.upsert_theme_info(df)
+        try:
+            # 테마별 종목 크롤링
+            stock_df, theme_description_df = await fetch_all_theme_stocks(client, df)
+            if stock_df.empty:
+                # 상세 페이지가 모두 실패(차단 등)하면 빈 DataFrame - 관계는 이전 값 유지
+                logger.warning("테마 종목 데이터가 없어 관계 upsert를 건너뜀")
+            else:
+                stock_df = validate_stock_data(stock_df)
+                theme_info_service.upsert_stock_theme_relation(stock_df)
+            if not theme_description_df.empty:
+                theme_info_service.upsert_theme_description(theme_description_df)
+        finally:
+            # 이미 upsert한 테마 목록이 있으므로 실패해도 목록/상세 캐시는 무효화
+            market_cache.invalidate_prefix('theme')
     
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
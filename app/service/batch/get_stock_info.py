@@ -1,10 +1,11 @@
-from app.db.database import SessionLocal
+from app.db.database import BatchSessionLocal
 from pykrx import stock
 from datetime import datetime, timezone
 import FinanceDataReader as fdr
 import pandas as pd
 from sqlalchemy.dialects.postgresql import insert
 from app.db.models.stock_info import StockInfo
+from app.core.cache import market_cache
 import logging
 import warnings
 
@@ -14,7 +15,7 @@ logger = logging.getLogger('app.service.batch')
 
 class StockInfoService:
     def __init__(self):
-        self.db = SessionLocal()
+        self.db = BatchSessionLocal()
 
     def upsert_stock_info(self, market_type: str):
         current_date = datetime.now().strftime("%Y%m%d")
@@ -87,6 +88,9 @@ def main():
     stock_info_service = StockInfoService()
     stock_info_service.upsert_stock_info('KOSPI')
     stock_info_service.upsert_stock_info('KOSDAQ')
+    # 테마/업종 상세는 종목명을 조인해 응답하므로 캐시된 ETag/응답도 무효화
+    market_cache.invalidate_prefix('theme')
+    market_cache.invalidate_prefix('sector')
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
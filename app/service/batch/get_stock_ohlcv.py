@@ -1,10 +1,11 @@
 from datetime import datetime
 import time
-from app.db.database import SessionLocal
+from app.db.database import BatchSessionLocal
 from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert
 from app.db.models.stock_ohlcv import StockOhlcv
 from app.db.models.stock_info import StockInfo
+from app.db.partitions import ensure_stock_ohlcv_partitions
 from pykrx import stock
 import warnings
 import talib
@@ -14,7 +15,7 @@ warnings.filterwarnings('ignore')
 
 class StockOhlcvService:
     def __init__(self):
-        self.db = SessionLocal()
+        self.db = BatchSessionLocal()
 
     def get_ticker_list(self, market_type: str):
         stmt = select(StockInfo.ticker).where(StockInfo.market == market_type)
@@ -36,6 +37,8 @@ class StockOhlcvService:
         if not records:
             print('적재할 데이터가 없습니다.')
             return
+        # 적재 대상 연도의 파티션 확보 (DEFAULT 파티션이 없으므로 필수)
+        ensure_stock_ohlcv_partitions(self.db.connection(), {record['ymd'].year for record in records})
         stmt = insert(StockOhlcv).values(records)
         stmt = stmt.on_conflict_do_update(
             index_elements=['stock_id', 'ymd', 'ticker'],
@@ -0,0 +1,40 @@
+import datetime
+import logging
+
+from app.config import OHLCV_PARTITION_YEARS_AHEAD, OHLCV_RETENTION_YEARS, OHLCV_ARCHIVE_SCHEMA
+from app.db.database import batch_engine
+from app.db.partitions import (
+    ensure_stock_ohlcv_partitions, list_stock_ohlcv_partitions, detach_stock_ohlcv_partition,
+)
+
+logger = logging.getLogger('app.service.batch')
+
+
+def ensure_future_partitions(connection, today=None):
+    """올해부터 OHLCV_PARTITION_YEARS_AHEAD 년 뒤까지 파티션을 미리 생성"""
+    this_year = (today or datetime.date.today()).year
+    return ensure_stock_ohlcv_partitions(connection, range(this_year, this_year + OHLCV_PARTITION_YEARS_AHEAD + 1))
+
+
+def archive_old_partitions(connection, today=None):
+    """보관 연수를 넘은 파티션을 분리해 archive 스키마로 이동 (OHLCV_RETENTION_YEARS=0이면 유지)"""
+    if OHLCV_RETENTION_YEARS <= 0:
+        return []
+    cutoff_year = (today or datetime.date.today()).year - OHLCV_RETENTION_YEARS
+    archived = []
+    for year in list_stock_ohlcv_partitions(connection):
+        if year < cutoff_year:
+            archived.append(detach_stock_ohlcv_partition(connection, year, OHLCV_ARCHIVE_SCHEMA))
+    return archived
+
+
+def main():
+    """메인 실행 함수"""
+    with batch_engine.begin() as connection:
+        created = ensure_future_partitions(connection)
+        archived = archive_old_partitions(connection)
+    logger.info(f"tb_stock_ohlcv 파티션 관리 완료 (생성: {created}, 보관: {archived})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,362 @@
+"""네이버 금융 페이지 수집 공통 모듈
+
+테마/업종 목록과 상세 페이지의 표(table.type_1, table.type_5, table.Nnavi)는 서버에서 렌더링되므로
+httpx로 HTML을 받아(EUC-KR) lxml로 바로 파싱한다. 필요한 표가 HTML에 없거나 재시도 대상이 아닌 응답(403/404 제외)으로
+실패한 페이지만 Playwright(Chromium)로 렌더링하고, 페이지당 한 번의 page.evaluate로 같은 규칙의 행 JSON을 받는다.
+
+상세 페이지는 동시 요청 수(NAVER_CRAWL_CONCURRENCY)와 호스트별 요청 간격(NAVER_CRAWL_HOST_DELAY)을 지키며
+병렬로 받고, 429/5xx/네트워크 오류는 지수 백오프로 재시도한다. 표를 얻지 못한 페이지(오류 응답, 표 없음, 렌더링 실패)가
+연속으로 쌓이면(차단/스로틀링) 서킷을 열어 이번 수집의 남은 요청을 보내지 않는다. 결과는 요청한 URL 순서대로 반환한다.
+
+표의 각 행은 두 경로 모두 TableRow로 반환한다. (첫 번째 칸에 링크가 없는 행은 제외)
+"""
+import asyncio
+import dataclasses
+import logging
+import random
+from typing import Optional
+
+import httpx
+import lxml.etree
+import lxml.html
+
+from app.config import (
+    NAVER_CRAWL_TIMEOUT, NAVER_CRAWL_USER_AGENT, NAVER_CRAWL_CONCURRENCY, NAVER_CRAWL_HOST_DELAY,
+    NAVER_CRAWL_PAGE_TIMEOUT, NAVER_CRAWL_RETRIES, NAVER_CRAWL_BACKOFF, NAVER_CRAWL_BREAKER_THRESHOLD,
+)
+
+logger = logging.getLogger('app.service.batch')
+
+NAVER_FINANCE_URL = "https://finance.naver.com"
+# 네이버 금융은 EUC-KR로 응답 (cp949는 EUC-KR 확장이라 확장 한글까지 디코딩됨)
+NAVER_ENCODING = 'cp949'
+
+# 재시도할 응답 코드 (스로틀링/일시 장애)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+# 브라우저로 다시 읽어도 결과가 같은 응답 코드 (차단/없는 페이지)
+NO_FALLBACK_STATUS = {403, 404}
+
+_INFO_LAYER = "contains(concat(' ', normalize-space(@class), ' '), ' info_layer_wrap ')"
+
+
+class NaverCrawlError(Exception):
+    pass
+
+
+class NaverCircuitOpen(NaverCrawlError):
+    pass
+
+
+class _RetryableResponse(Exception):
+    def __init__(self, response):
+        super().__init__(f"HTTP {response.status_code}")
+        self.response = response
+
+
+class CircuitBreaker:
+    """연속 실패가 threshold에 도달하면 열림 (수집 1회 동안 유지, 성공하면 카운트 초기화)"""
+
+    def __init__(self, threshold=NAVER_CRAWL_BREAKER_THRESHOLD):
+        self.threshold = threshold
+        self.failures = 0
+        self.is_open = False
+
+    def check(self):
+        if self.is_open:
+            raise NaverCircuitOpen("네이버 요청 실패가 누적되어 이번 수집을 중단합니다.")
+
+    def record_success(self):
+        self.failures = 0
+
+    def record_failure(self):
+        self.failures += 1
+        if not self.is_open and self.failures >= self.threshold:
+            self.is_open = True
+            logger.error(f"네이버 연속 실패 {self.failures}회, 서킷 오픈 (남은 요청 중단)")
+
+
+# 브라우저 대체 경로: 표별 행을 [name, link, cells, descs] 배열로 한 번에 추출 (parse_table_rows와 같은 규칙)
+EXTRACT_TABLES_JS = """
+(tableClasses) => {
+    const text = (node) => node.textContent.split(/\\s+/).filter(Boolean).join(' ');
+    const tables = {};
+    for (const cls of tableClasses) {
+        const table = document.querySelector(`table.${cls}`);
+        if (!table) {
+            tables[cls] = null;
+            continue;
+        }
+        tables[cls] = [];
+        for (const tr of table.querySelectorAll(':scope > tbody > tr, :scope > tr')) {
+            const tds = Array.from(tr.querySelectorAll(':scope > td'));
+            if (tds.length < 2) continue;
+            const link = tds[0].querySelector('a');
+            if (!link) continue;
+            const descs = tds.map((td) => {
+                const p = td.querySelector('div.info_layer_wrap p');
+                return p ? p.textContent.trim() : null;
+            });
+            const cells = tds.map((td) => {
+                // <em>(등락 아이콘)과 숨김 설명 레이어를 뺀 텍스트
+                const clone = td.cloneNode(true);
+                clone.querySelectorAll('em, div.info_layer_wrap').forEach((node) => node.remove());
+                return text(clone);
+            });
+            tables[cls].push([text(link), link.getAttribute('href'), cells, descs]);
+        }
+    }
+    const pageNums = Array.from(document.querySelectorAll('table.Nnavi a'))
+        .map(text).filter((t) => /^\\d+$/.test(t)).map(Number);
+    return {tables, lastPage: pageNums.length ? Math.max(...pageNums) : 1};
+}
+"""
+
+
+@dataclasses.dataclass(frozen=True)
+class TableRow:
+    """표의 데이터 행"""
+    name: str  # 첫 번째 칸 <a> 텍스트
+    link: Optional[str]  # 첫 번째 칸 <a> href
+    cells: tuple  # 칸별 텍스트 (<em>과 숨김 설명 레이어(info_layer_wrap)를 제외하고 공백 정리)
+    descs: tuple  # 칸별 info_layer_wrap <p> 텍스트 (없으면 None)
+
+    @classmethod
+    def from_json(cls, row):
+        name, link, cells, descs = row
+        return cls(name=name, link=link, cells=tuple(cells), descs=tuple(descs))
+
+
+@dataclasses.dataclass
+class PageTables:
+    """페이지 하나에서 읽은 표 행들 (rows: 표 class -> 행 목록)"""
+    rows: dict
+    last_page: int = 1
+
+
+def _table(doc, table_class):
+    tables = doc.xpath(
+        f"//table[contains(concat(' ', normalize-space(@class), ' '), ' {table_class} ')]"
+    )
+    return tables[0] if tables else None
+
+
+def _text(node):
+    return ' '.join(node.text_content().split())
+
+
+def _parse_row(tr):
+    # 브라우저는 <tbody>를 자동으로 넣지만 원본 HTML에는 없을 수 있어 tr 바로 아래 td만 사용
+    tds = tr.xpath('./td')
+    if len(tds) < 2:
+        return None  # 데이터 row가 아님
+    links = tds[0].xpath('.//a')
+    if not links:
+        return None  # 이름(링크)이 없는 row
+    descs = []
+    for td in tds:
+        paragraphs = td.xpath(f'.//div[{_INFO_LAYER}]//p')
+        descs.append(paragraphs[0].text_content().strip() if paragraphs else None)
+    name = _text(links[0])
+    link = links[0].get('href')
+    # 화면에 보이는 텍스트만 남기도록 <em>(등락 아이콘)과 숨김 설명 레이어 제거
+    for node in tr.xpath(f'./td//em | ./td//div[{_INFO_LAYER}]'):
+        node.drop_tree()
+    return TableRow(name=name, link=link, cells=tuple(_text(td) for td in tds), descs=tuple(descs))
+
+
+def parse_table_rows(doc, table_class):
+    """table.{table_class}의 데이터 행 목록 (표가 없으면 None)"""
+    table = _table(doc, table_class)
+    if table is None:
+        return None
+    rows = []
+    for tr in table.xpath('./tr | ./tbody/tr'):
+        row = _parse_row(tr)
+        if row is not None:
+            rows.append(row)
+    return rows
+
+
+def parse_last_page(doc):
+    # 페이지 하단의 페이징 링크에서 마지막 페이지 번호 추출
+    navi = _table(doc, 'Nnavi')
+    if navi is None:
+        return 1
+    page_nums = [int(text) for text in (_text(a) for a in navi.xpath('.//a')) if text.isdigit()]
+    return max(page_nums) if page_nums else 1
+
+
+def parse_page(html, tables):
+    """HTML에서 tables에 해당하는 표를 읽어 PageTables 반환 (표가 하나라도 없으면 None)"""
+    try:
+        doc = lxml.html.fromstring(html)
+    except lxml.etree.ParserError:
+        return None  # 빈 응답 본문
+    rows = {}
+    for table_class in tables:
+        table_rows = parse_table_rows(doc, table_class)
+        if table_rows is None:
+            return None
+        rows[table_class] = table_rows
+    return PageTables(rows=rows, last_page=parse_last_page(doc))
+
+
+def page_tables_from_json(extracted, tables):
+    """EXTRACT_TABLES_JS 결과 -> PageTables (표가 하나라도 없으면 None)"""
+    rows = {}
+    for table_class in tables:
+        table_rows = extracted['tables'].get(table_class)
+        if table_rows is None:
+            return None
+        rows[table_class] = [TableRow.from_json(row) for row in table_rows]
+    return PageTables(rows=rows, last_page=extracted['lastPage'])
+
+
+class NaverFinanceClient:
+    """수집 1회 동안 커넥션을 재사용하는 클라이언트 (async with로 사용)
+
+    Playwright 브라우저는 대체 경로가 처음 필요할 때만 띄우고, 페이지는 요청마다 새로 열어 동시 요청 수만큼만 사용한다.
+    """
+
+    def __init__(self, timeout=NAVER_CRAWL_TIMEOUT, concurrency=NAVER_CRAWL_CONCURRENCY,
+                 host_delay=NAVER_CRAWL_HOST_DELAY, page_timeout=NAVER_CRAWL_PAGE_TIMEOUT,
+                 retries=NAVER_CRAWL_RETRIES, backoff=NAVER_CRAWL_BACKOFF):
+        self.timeout = timeout
+        self.host_delay = host_delay
+        self.page_timeout = page_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.breaker = CircuitBreaker()
+        self.http = None
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._host_lock = asyncio.Lock()
+        self._host_next_at = {}
+        self._playwright = None
+        self._browser = None
+        self._browser_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        self.http = httpx.AsyncClient(
+            base_url=NAVER_FINANCE_URL,
+            headers={'User-Agent': NAVER_CRAWL_USER_AGENT},
+            timeout=self.timeout,
+            follow_redirects=True,
+        )
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.http.aclose()
+        if self._browser is not None:
+            await self._browser.close()
+            await self._playwright.stop()
+
+    async def _wait_turn(self, url):
+        # 호스트별로 다음 요청 가능 시각을 예약하고, 락 밖에서 그 시각까지 대기
+        host = self.http.base_url.join(url).host
+        loop = asyncio.get_running_loop()
+        async with self._host_lock:
+            now = loop.time()
+            start_at = max(now, self._host_next_at.get(host, now))
+            self._host_next_at[host] = start_at + self.host_delay
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+
+    def _backoff_delay(self, attempt, response=None):
+        retry_after = response.headers.get('retry-after') if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return self.backoff * (2 ** attempt) * (1 + random.random() / 2)
+
+    async def fetch_html(self, url):
+        for attempt in range(self.retries + 1):
+            self.breaker.check()
+            await self._wait_turn(url)
+            try:
+                resp = await self.http.get(url)
+                if resp.status_code in RETRY_STATUS:
+                    raise _RetryableResponse(resp)
+                if resp.is_error:
+                    self.breaker.record_failure()
+                    resp.raise_for_status()
+            except (httpx.TransportError, _RetryableResponse) as e:
+                self.breaker.record_failure()
+                if attempt == self.retries:
+                    raise NaverCrawlError(f"{url}: 요청 실패 ({e!r})") from e
+                delay = self._backoff_delay(attempt, getattr(e, 'response', None))
+                logger.warning(f"{url}: 요청 실패({e!r}), {delay:.1f}초 후 재시도 ({attempt + 1}/{self.retries})")
+                await asyncio.sleep(delay)
+                continue
+            return resp.content.decode(NAVER_ENCODING, errors='replace')
+
+    async def fetch_tables(self, url, tables=('type_1',)):
+        """url 페이지의 표들을 읽음 (동시 요청 수 제한, 페이지당 제한 시간 적용)"""
+        async with self._semaphore:
+            try:
+                return await asyncio.wait_for(self._fetch_tables(url, tables), timeout=self.page_timeout)
+            except asyncio.TimeoutError as e:
+                self.breaker.record_failure()
+                raise NaverCrawlError(f"{url}: {self.page_timeout}초 안에 읽지 못했습니다.") from e
+
+    async def fetch_many(self, urls, tables=('type_1',)):
+        """여러 페이지를 병렬로 읽어 urls 순서대로 반환 (실패한 페이지는 None)"""
+        return await asyncio.gather(*(self._fetch_or_none(url, tables) for url in urls))
+
+    async def _fetch_or_none(self, url, tables):
+        try:
+            return await self.fetch_tables(url, tables)
+        except NaverCircuitOpen:
+            return None
+        except NaverCrawlError as e:
+            logger.error(str(e))
+            return None
+        except Exception as e:
+            # 예상하지 못한 오류도 해당 페이지만 건너뛰고 나머지 수집은 계속
+            logger.exception(f"{url}: 크롤링 오류 ({e!r})")
+            return None
+
+    async def _fetch_tables(self, url, tables):
+        # 표를 얻었을 때만 성공으로 기록 (차단 페이지가 200으로 오는 경우도 실패로 셈)
+        try:
+            page_tables = parse_page(await self.fetch_html(url), tables)
+            if page_tables is not None:
+                self.breaker.record_success()
+                return page_tables
+            self.breaker.record_failure()
+            logger.warning(f"{url}: HTML에 {tables} 표가 없어 브라우저로 다시 읽습니다.")
+        except httpx.HTTPStatusError as e:
+            status_code = e.response.status_code
+            if status_code in NO_FALLBACK_STATUS:
+                raise NaverCrawlError(f"{url}: HTTP {status_code}") from e
+            logger.warning(f"{url}: HTTP 요청 실패({status_code}), 브라우저로 다시 읽습니다.")
+        self.breaker.check()
+        try:
+            page_tables = await self._render(url, tables)
+        except Exception as e:
+            self.breaker.record_failure()
+            raise NaverCrawlError(f"{url}: 브라우저 렌더링 실패 ({e!r})") from e
+        if page_tables is None:
+            self.breaker.record_failure()
+            raise NaverCrawlError(f"{url}: {tables} 표를 찾을 수 없습니다.")
+        self.breaker.record_success()
+        return page_tables
+
+    async def _get_browser(self):
+        async with self._browser_lock:
+            if self._browser is None:
+                # 대체 경로에서만 필요하므로 지연 import
+                from playwright.async_api import async_playwright
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+            return self._browser
+
+    async def _render(self, url, tables):
+        """브라우저로 렌더링한 뒤 한 번의 evaluate로 표들을 읽음 (표가 하나라도 없으면 None)"""
+        browser = await self._get_browser()
+        await self._wait_turn(url)
+        page = await browser.new_page()
+        try:
+            await page.goto(str(self.http.base_url.join(url)), timeout=self.timeout * 1000)
+            extracted = await page.evaluate(EXTRACT_TABLES_JS, list(tables))
+        finally:
+            await page.close()
+        return page_tables_from_json(extracted, tables)
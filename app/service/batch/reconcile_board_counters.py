@@ -0,0 +1,72 @@
+import logging
+
+from sqlalchemy import text
+
+from app.db.database import batch_engine
+from app.service.board.counters import COUNTER_MODELS, flush_counters
+
+logger = logging.getLogger('app.service.batch')
+
+# 원본 테이블(post_views, 활성 post_likes, 댓글) 기준으로 카운터를 다시 계산해 값이 다른 행만 갱신
+RECONCILE_SQL = """
+    UPDATE {posts} p
+    SET view_count = c.view_count, like_count = c.like_count, comment_count = c.comment_count
+    FROM (
+        SELECT p2.id,
+               (SELECT count(*) FROM post_views v WHERE v.post_type = :post_type AND v.post_id = p2.id) AS view_count,
+               (SELECT count(*) FROM post_likes l
+                 WHERE l.post_type = :post_type AND l.post_id = p2.id AND l.is_active) AS like_count,
+               (SELECT count(*) FROM {comments} cm WHERE cm.post_id = p2.id) AS comment_count
+        FROM {posts} p2
+    ) c
+    WHERE p.id = c.id
+      AND (p.view_count, p.like_count, p.comment_count)
+          IS DISTINCT FROM (c.view_count, c.like_count, c.comment_count)
+"""
+
+# 댓글 좋아요 수 (post_likes.post_type = '{board}_comment', 토글이 같은 문장에서 ±1 하므로 버퍼 없음)
+RECONCILE_COMMENT_LIKES_SQL = """
+    UPDATE {comments} cm
+    SET like_count = c.like_count
+    FROM (
+        SELECT cm2.id,
+               (SELECT count(*) FROM post_likes l
+                 WHERE l.post_type = :post_type AND l.post_id = cm2.id AND l.is_active) AS like_count
+        FROM {comments} cm2
+    ) c
+    WHERE cm.id = c.id
+      AND cm.like_count IS DISTINCT FROM c.like_count
+"""
+
+COMMENT_TABLES = {'free': 'free_comments', 'strategy': 'strategy_comments'}
+
+
+def reconcile(connection, post_type):
+    """post_type 게시판의 카운터를 보정하고 보정한 행 수를 반환"""
+    sql = RECONCILE_SQL.format(posts=COUNTER_MODELS[post_type].__tablename__, comments=COMMENT_TABLES[post_type])
+    return connection.execute(text(sql), {'post_type': post_type}).rowcount
+
+
+def reconcile_comment_likes(connection, post_type):
+    """post_type 게시판 댓글의 좋아요 수를 보정하고 보정한 행 수를 반환"""
+    sql = RECONCILE_COMMENT_LIKES_SQL.format(comments=COMMENT_TABLES[post_type])
+    return connection.execute(text(sql), {'post_type': f'{post_type}_comment'}).rowcount
+
+
+def main():
+    """메인 실행 함수
+
+    버퍼를 먼저 반영한 뒤 보정한다. 보정 도중 커밋되어 버퍼에 쌓인 증감분은 다음 flush에서 한 번 더 더해질 수 있으나
+    다음 보정 주기에 다시 맞춰진다.
+    """
+    flush_counters()
+    fixed = {}
+    with batch_engine.begin() as connection:
+        for post_type in COUNTER_MODELS:
+            fixed[post_type] = reconcile(connection, post_type)
+            fixed[f'{post_type}_comment'] = reconcile_comment_likes(connection, post_type)
+    logger.info(f"게시글/댓글 카운터 보정 완료 (보정 행 수: {fixed})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+import logging
+
+from sqlalchemy import text
+
+from app.config import REFRESH_TOKEN_SWEEP_BATCH_SIZE
+from app.db.database import batch_engine
+
+logger = logging.getLogger('app.service.batch')
+
+# 만료된 토큰을 ix_refresh_token_expires_at 순서로 batch_size개씩 삭제 (배치마다 커밋해 잠금을 짧게 유지)
+SWEEP_SQL = """
+    DELETE FROM tb_refresh_token
+    WHERE id IN (
+        SELECT id FROM tb_refresh_token
+        WHERE expires_at < now()
+        ORDER BY expires_at
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+"""
+
+
+def sweep(batch_size=REFRESH_TOKEN_SWEEP_BATCH_SIZE):
+    """만료 토큰을 모두 지울 때까지 배치 단위로 삭제하고 삭제한 행 수를 반환"""
+    total = 0
+    while True:
+        with batch_engine.begin() as connection:
+            deleted = connection.execute(text(SWEEP_SQL), {'batch_size': batch_size}).rowcount
+        total += deleted
+        if deleted < batch_size:
+            return total
+
+
+def main():
+    """메인 실행 함수
+
+    로테이션/로그아웃된 토큰은 그 자리에서 삭제되므로 여기서는 만료된 토큰만 정리한다.
+    """
+    deleted = sweep()
+    logger.info(f"만료 리프레시 토큰 정리 완료 (삭제 행 수: {deleted})")
+
+
+if __name__ == '__main__':
+    main()
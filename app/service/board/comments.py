@@ -0,0 +1,141 @@
+from sqlalchemy import select, func, true
+from sqlalchemy.orm import joinedload
+
+from app.service.board.pagination import encode_values, decode_values
+
+# 댓글 경로(path): 조상부터 자신까지 id를 고정 폭 base36으로 이어 붙인 문자열 (collate "C")
+# 경로 순 정렬이 곧 트리 순서이고, 한 댓글의 하위 트리는 [path, path || '~') 범위 (0006 마이그레이션 참고)
+PATH_SEGMENT_WIDTH = 8
+PATH_UPPER_BOUND = '~'  # base36 문자(0-9a-z)보다 큰 문자
+_BASE36 = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+# 상세 화면의 첫 페이지: 루트 댓글 THREADS_PER_PAGE개, 각 스레드의 답글은 REPLIES_PER_THREAD개까지
+THREADS_PER_PAGE = 20
+REPLIES_PER_THREAD = 5
+REPLIES_PER_PAGE = 50
+
+
+def path_segment(comment_id):
+    digits = ''
+    while True:
+        comment_id, r = divmod(comment_id, 36)
+        digits = _BASE36[r] + digits
+        if comment_id == 0:
+            return digits.rjust(PATH_SEGMENT_WIDTH, '0')
+
+
+def assign_path(db, model, comment, parent=None):
+    """INSERT 전에 id를 시퀀스에서 먼저 받아 path/depth를 채움 (부모 조회 없이 INSERT 한 번)"""
+    comment.id = db.scalar(select(func.nextval(func.pg_get_serial_sequence(model.__tablename__, 'id'))))
+    segment = path_segment(comment.id)
+    comment.path = parent.path + segment if parent is not None else segment
+    comment.depth = len(comment.path) // PATH_SEGMENT_WIDTH - 1
+
+
+def _decode_path_cursor(cursor):
+    """잘못된 커서면 ValueError"""
+    values = decode_values(cursor)
+    if len(values) != 1 or not isinstance(values[0], str):
+        raise ValueError('invalid cursor')
+    return values[0]
+
+
+def threads_query(model, post_id, after_path=None, threads=THREADS_PER_PAGE, replies=REPLIES_PER_THREAD):
+    """루트 threads+1개(다음 페이지 확인용 1개 포함)와 스레드별 루트+답글 replies+1개(더 있는지 확인용 1개 포함)
+
+    루트는 (post_id, path) 부분 인덱스, 스레드별 답글은 (post_id, path) 범위 스캔을 LATERAL로 가져온다.
+    """
+    roots = select(model.path.label('root_path')).where(
+        model.post_id == post_id,
+        model.parent_id.is_(None),
+    )
+    if after_path is not None:
+        roots = roots.where(model.path > after_path)
+    roots = roots.order_by(model.path).limit(threads + 1).subquery('roots')
+
+    thread = select(model.id).where(
+        model.post_id == post_id,
+        model.path >= roots.c.root_path,
+        model.path < roots.c.root_path + PATH_UPPER_BOUND,
+    ).correlate(roots).order_by(model.path).limit(replies + 2).lateral('thread')
+
+    return (
+        select(model)
+        .select_from(roots)
+        .join(thread, true())
+        .join(model, model.id == thread.c.id)
+        .options(joinedload(model.user))
+        .order_by(model.path)
+    )
+
+
+def replies_query(model, post_id, parent_path, after_path, size):
+    """parent_path 하위 트리에서 after_path 이후 size+1개 (다음 페이지 확인용 1개 포함)"""
+    return (
+        select(model)
+        .where(
+            model.post_id == post_id,
+            model.path > after_path,
+            model.path < parent_path + PATH_UPPER_BOUND,
+        )
+        .options(joinedload(model.user))
+        .order_by(model.path)
+        .limit(size + 1)
+    )
+
+
+def load_threads(db, model, post_id, cursor=None, threads=THREADS_PER_PAGE, replies=REPLIES_PER_THREAD):
+    """루트 댓글 threads개와 각 스레드의 답글을 replies개까지 트리 순서로 한 번에 조회
+
+    반환: (댓글 목록(path 순), {답글이 더 있는 루트 id: 답글 추가 조회 커서}, 다음 루트 페이지 커서)
+    """
+    after_path = _decode_path_cursor(cursor) if cursor else None
+    rows = db.execute(threads_query(model, post_id, after_path, threads, replies)).scalars().unique().all()
+
+    comments, more_replies, root_paths = [], {}, []
+    thread_rows = {}
+    for comment in rows:
+        root_path = comment.path[:PATH_SEGMENT_WIDTH]
+        if root_path not in thread_rows:
+            root_paths.append(root_path)
+            thread_rows[root_path] = []
+        thread_rows[root_path].append(comment)
+
+    next_cursor = None
+    if len(root_paths) > threads:
+        root_paths = root_paths[:threads]
+        next_cursor = encode_values([root_paths[-1]])
+    for root_path in root_paths:
+        items = thread_rows[root_path]
+        if len(items) > replies + 1:
+            items = items[:replies + 1]
+            more_replies[items[0].id] = encode_values([items[-1].path])
+        comments.extend(items)
+    return comments, more_replies, next_cursor
+
+
+def load_replies(db, model, parent, cursor=None, size=REPLIES_PER_PAGE):
+    """parent 하위 트리의 답글을 트리 순서로 size개 조회 - (댓글 목록, 다음 커서)"""
+    after = _decode_path_cursor(cursor) if cursor else parent.path
+    if not after.startswith(parent.path):
+        raise ValueError('invalid cursor')
+    rows = db.execute(replies_query(model, parent.post_id, parent.path, after, size)).scalars().all()
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        next_cursor = encode_values([rows[-1].path])
+    return rows, next_cursor
+
+
+def build_tree(comments, to_response):
+    """path 순 댓글 목록 -> 최상위 응답 목록 (부모가 목록에 없으면 최상위로 둠)"""
+    top, by_id = [], {}
+    for comment in comments:
+        node = to_response(comment)
+        by_id[comment.id] = node
+        parent = by_id.get(comment.parent_id)
+        if parent is not None:
+            parent.children.append(node)
+        else:
+            top.append(node)
+    return top
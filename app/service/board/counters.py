@@ -0,0 +1,147 @@
+"""게시글 조회수/댓글 수 카운터 쓰기 병합
+
+커밋된 증감분을 (post_type, post_id) 별로 메모리에 모았다가 주기적으로 테이블당 한 번의
+UPDATE ... FROM (VALUES ...) 로 반영한다. 인기 게시글 한 행에 요청마다 UPDATE가 몰리는 락 경합을 없애는 대신,
+프로세스가 비정상 종료되면 마지막 flush 이후(COUNTER_FLUSH_INTERVAL 초) 증감분이 유실될 수 있으며
+이는 reconcile_board_counters 배치가 원본 테이블 기준으로 다시 맞춘다.
+
+세션 연동: board_events의 리스너가 session.info에 증감분을 쌓고, 커밋되면 버퍼로 옮기고 롤백되면 버린다.
+"""
+import atexit
+import logging
+import threading
+from collections import defaultdict
+
+from sqlalchemy import event, update, values, column, BigInteger, Integer, func
+from sqlalchemy.orm import Session
+
+from app.config import COUNTER_MAX_PENDING
+from app.db.models.free_post import FreePost
+from app.db.models.strategy_post import StrategyPost
+
+logger = logging.getLogger('app.db')
+
+COUNTER_MODELS = {'free': FreePost, 'strategy': StrategyPost}
+# like_count는 토글 문장에서 바로 갱신 (likes.py)
+COUNTER_FIELDS = ('view_count', 'comment_count')
+
+_SESSION_KEY = 'counter_deltas'
+
+
+class CounterBuffer:
+    """{post_type: {post_id: [view, comment 증감]}} 스레드 안전 버퍼"""
+
+    def __init__(self, max_pending=10000):
+        self.max_pending = max_pending
+        self._pending = defaultdict(dict)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self.flushed_rows = 0
+        self.failed_flushes = 0
+
+    def add_many(self, deltas):
+        """deltas: [(post_type, post_id, field, delta)] - 대기 건수가 max_pending을 넘으면 True"""
+        with self._lock:
+            for post_type, post_id, field, delta in deltas:
+                row = self._pending[post_type].setdefault(post_id, [0] * len(COUNTER_FIELDS))
+                row[COUNTER_FIELDS.index(field)] += delta
+            return sum(len(rows) for rows in self._pending.values()) >= self.max_pending
+
+    def pending(self, post_type, post_id, field):
+        """아직 반영되지 않은 증감분 (응답에 즉시 반영할 때 사용)"""
+        with self._lock:
+            row = self._pending.get(post_type, {}).get(post_id)
+            return row[COUNTER_FIELDS.index(field)] if row else 0
+
+    def _drain(self):
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(dict)
+            return pending
+
+    def _restore(self, pending):
+        with self._lock:
+            for post_type, rows in pending.items():
+                for post_id, delta in rows.items():
+                    row = self._pending[post_type].setdefault(post_id, [0] * len(COUNTER_FIELDS))
+                    for i, d in enumerate(delta):
+                        row[i] += d
+
+    def flush(self, bind):
+        """대기 중인 증감분을 게시판 테이블당 UPDATE 한 번으로 반영하고 반영한 행 수를 반환
+
+        실패하면 증감분을 버퍼에 되돌려 다음 flush에서 재시도한다.
+        """
+        with self._flush_lock:
+            pending = self._drain()
+            if not pending:
+                return 0
+            try:
+                with bind.begin() as connection:
+                    for post_type, rows in pending.items():
+                        rows = {post_id: delta for post_id, delta in rows.items() if any(delta)}
+                        if rows:
+                            connection.execute(_build_update(COUNTER_MODELS[post_type], rows))
+            except Exception:
+                self.failed_flushes += 1
+                self._restore(pending)
+                raise
+            flushed = sum(len(rows) for rows in pending.values())
+            self.flushed_rows += flushed
+            return flushed
+
+    def stats(self):
+        with self._lock:
+            size = sum(len(rows) for rows in self._pending.values())
+        return {'pending': size, 'flushed_rows': self.flushed_rows, 'failed_flushes': self.failed_flushes}
+
+
+def _build_update(model, rows):
+    """UPDATE {table} SET x = greatest(coalesce(x, 0) + v.x, 0) ... FROM (VALUES ...) v WHERE id = v.id"""
+    deltas = values(
+        column('id', BigInteger), *[column(field, Integer) for field in COUNTER_FIELDS], name='deltas'
+    ).data([(post_id, *delta) for post_id, delta in sorted(rows.items())])
+    return (
+        update(model.__table__)
+        .where(model.__table__.c.id == deltas.c.id)
+        .values({
+            field: func.greatest(func.coalesce(model.__table__.c[field], 0) + deltas.c[field], 0)
+            for field in COUNTER_FIELDS
+        })
+    )
+
+
+counter_buffer = CounterBuffer(max_pending=COUNTER_MAX_PENDING)
+
+
+def record(session, post_type, post_id, field, delta):
+    """현재 트랜잭션에 카운터 증감 기록 (커밋 시 버퍼로 이동)"""
+    if post_type in COUNTER_MODELS and session is not None:
+        session.info.setdefault(_SESSION_KEY, []).append((post_type, post_id, field, delta))
+
+
+def flush_counters():
+    """스케줄러/종료 훅에서 호출"""
+    from app.db.database import batch_engine
+    try:
+        flushed = counter_buffer.flush(batch_engine)
+        if flushed:
+            logger.debug(f"게시글 카운터 {flushed}건 반영")
+    except Exception as e:
+        logger.exception(f"게시글 카운터 반영 실패 (다음 주기에 재시도): {e}")
+
+
+@event.listens_for(Session, 'after_commit')
+def _push_committed_deltas(session):
+    deltas = session.info.pop(_SESSION_KEY, None)
+    if deltas and counter_buffer.add_many(deltas):
+        # 대기 건수 상한 초과 시 즉시 반영해 유실 범위를 제한
+        flush_counters()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _drop_rolled_back_deltas(session):
+    session.info.pop(_SESSION_KEY, None)
+
+
+# 스케줄러 없이 실행되는 프로세스(스크립트 등)에서도 종료 시 반영
+atexit.register(flush_counters)
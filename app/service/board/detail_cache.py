@@ -0,0 +1,62 @@
+from app.config import REPLICA_MAX_LAG_SECONDS, REPLICA_HEALTH_CHECK_INTERVAL
+from app.core.cache import post_detail_cache
+from app.schemas.board import PostDetailResponse
+from app.service.board.viewer_state import load_liked_ids
+
+# 복제본은 지연이 REPLICA_MAX_LAG_SECONDS를 넘어야 제외되고 그 판단도 점검 주기마다 갱신되므로,
+# 쓰기 후 이 시간 동안은 복제본에서 읽은 상세가 쓰기 이전 상태일 수 있다
+REPLICA_LAG_WINDOW = REPLICA_MAX_LAG_SECONDS + REPLICA_HEALTH_CHECK_INTERVAL
+
+
+def detail_key(post_type, post_id):
+    return f'post_detail:{post_type}:{post_id}'
+
+
+def get_detail(post_type, post_id):
+    """캐시된 상세 응답을 새 객체로 복원 (요청마다 오버레이를 적용해도 캐시 원본은 그대로)"""
+    cached = post_detail_cache.get(detail_key(post_type, post_id))
+    if cached is None:
+        return None
+    return PostDetailResponse.model_validate_json(cached)
+
+
+def store_detail(post_type, detail, from_replica=False):
+    """좋아요 여부를 뺀 상세 응답을 bytes로 저장
+
+    복제본에서 만든 상세는 조회 도중 쓰기(invalidate_detail)가 있었다면 이전 상태일 수 있으므로 저장하지 않는다.
+    """
+    if from_replica and recently_written(post_type, detail.id):
+        return
+    post_detail_cache.set(detail_key(post_type, detail.id), detail.model_dump_json().encode())
+
+
+def _written_key(post_type, post_id):
+    return f'{detail_key(post_type, post_id)}:written'
+
+
+def invalidate_detail(post_type, post_id):
+    """캐시를 지우고, 복제본 지연 구간 동안은 상세를 primary에서 다시 만들도록 표시"""
+    post_detail_cache.invalidate(detail_key(post_type, post_id))
+    post_detail_cache.set(_written_key(post_type, post_id), True, ttl=REPLICA_LAG_WINDOW)
+
+
+def recently_written(post_type, post_id):
+    """invalidate_detail 후 REPLICA_LAG_WINDOW가 지나지 않았으면 True (복제본에 아직 반영되지 않았을 수 있음)"""
+    return post_detail_cache.get(_written_key(post_type, post_id)) is not None
+
+
+def _walk(comments):
+    for comment in comments:
+        yield comment
+        yield from _walk(comment.children)
+
+
+def apply_viewer_state(db, user_id, post_type, detail):
+    """현재 사용자의 게시글/댓글 좋아요 여부를 덮어씀 (한 번의 IN 쿼리, 비로그인은 쿼리 없음)"""
+    comments = list(_walk(detail.comments))
+    comment_type = f'{post_type}_comment'
+    liked_ids = load_liked_ids(db, user_id, {post_type: [detail.id], comment_type: [c.id for c in comments]})
+    detail.is_liked = detail.id in liked_ids[post_type]
+    for comment in comments:
+        comment.is_liked = comment.id in liked_ids[comment_type]
+    return detail
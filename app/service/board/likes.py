@@ -0,0 +1,44 @@
+from sqlalchemy import text
+
+# post_likes.post_type -> like_count를 가진 대상 테이블
+LIKE_TARGET_TABLES = {
+    'free': 'free_posts',
+    'strategy': 'strategy_posts',
+    'free_comment': 'free_comments',
+    'strategy_comment': 'strategy_comments',
+}
+
+# 대상이 있을 때만 좋아요 행을 upsert(있으면 is_active 반전)하고 같은 문장에서 like_count를 ±1
+# post_likes 행 잠금(ON CONFLICT)과 대상 행 UPDATE 잠금으로 동시 토글이 직렬화되어 카운트가 어긋나지 않음
+TOGGLE_LIKE_SQL = """
+    WITH target AS (
+        SELECT id FROM {table} WHERE id = :target_id
+    ), toggled AS (
+        INSERT INTO post_likes (post_type, post_id, user_id, is_active)
+        SELECT :post_type, id, :user_id, true FROM target
+        ON CONFLICT ON CONSTRAINT uq_post_like
+        DO UPDATE SET is_active = NOT coalesce(post_likes.is_active, false), mod_date = now()
+        RETURNING is_active
+    ), counted AS (
+        UPDATE {table} t
+        SET like_count = greatest(coalesce(t.like_count, 0) + CASE WHEN toggled.is_active THEN 1 ELSE -1 END, 0)
+        FROM toggled
+        WHERE t.id = :target_id
+        RETURNING t.like_count
+    )
+    SELECT toggled.is_active, counted.like_count FROM toggled, counted
+"""
+
+
+def toggle_like(db, post_type, target_id, user_id):
+    """좋아요/취소를 한 문장으로 처리하고 (is_liked, like_count) 반환 - 대상이 없으면 None
+
+    호출한 쪽에서 commit 한다.
+    """
+    row = db.execute(
+        text(TOGGLE_LIKE_SQL.format(table=LIKE_TARGET_TABLES[post_type])),
+        {'post_type': post_type, 'target_id': target_id, 'user_id': user_id},
+    ).first()
+    if row is None:
+        return None
+    return bool(row.is_active), row.like_count
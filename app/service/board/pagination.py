@@ -0,0 +1,121 @@
+import base64
+import datetime
+import json
+
+from sqlalchemy import and_, or_, func, false
+from sqlalchemy.orm import with_expression
+
+from app.db.models.post_hot_score import PostHotScore
+from app.schemas.board import SortOrder
+
+# 정렬 기준별 (컬럼명, 내림차순 여부) - 공지 우선, 마지막에 id로 순서를 고정
+SORT_FIELDS = {
+    SortOrder.LATEST: ('crt_date', True),
+    SortOrder.OLDEST: ('crt_date', False),
+    SortOrder.VIEWS: ('view_count', True),
+    SortOrder.LIKES: ('like_count', True),
+    SortOrder.COMMENTS: ('comment_count', True),
+}
+
+_COUNT_FIELDS = {'view_count', 'like_count', 'comment_count'}
+
+
+def join_hot_scores(query, model, post_type):
+    """인기순 목록: 점수가 있는 게시글만 남기고 점수를 model.hot_score로 함께 조회"""
+    return query.join(
+        PostHotScore, and_(PostHotScore.post_type == post_type, PostHotScore.post_id == model.id)
+    ).options(with_expression(model.hot_score, PostHotScore.score))
+
+
+def sort_keys(model, sort):
+    """[(이름, 정렬식, 내림차순 여부)] - ORDER BY와 커서 비교에 같은 식을 사용"""
+    if sort == SortOrder.HOT:
+        # 공지 우선 없이 ix_post_hot_scores_type_score 순서 그대로 (join_hot_scores와 함께 사용)
+        return [
+            ('hot_score', PostHotScore.score, True),
+            ('id', PostHotScore.post_id, True),
+        ]
+    field, descending = SORT_FIELDS[sort]
+    column = getattr(model, field)
+    if field in _COUNT_FIELDS:
+        # 카운터 컬럼은 NULL이 섞일 수 있어 0으로 맞춰야 커서 비교가 어긋나지 않음
+        column = func.coalesce(column, 0)
+    # is_notice는 NOT NULL (0010 마이그레이션) - NULL이 있으면 아래 keyset_filter의 boolean 비교가 그 행을 건너뜀
+    return [
+        ('is_notice', model.is_notice, True),
+        (field, column, descending),
+        ('id', model.id, descending),
+    ]
+
+
+def order_by_keys(query, keys):
+    return query.order_by(*[expr.desc() if descending else expr.asc() for _, expr, descending in keys])
+
+
+def keyset_filter(keys, values):
+    """(k1, k2, k3) 가 커서 값 '이후'인 행 조건 (컬럼마다 방향이 달라 OR로 전개)"""
+    clauses = []
+    for i, (_, expr, descending) in enumerate(keys):
+        equal_prefix = [keys[j][1] == values[j] for j in range(i)]
+        if isinstance(values[i], bool):
+            # boolean은 대소 비교 대신: 내림차순이면 True 다음이 False, 오름차순이면 그 반대
+            after = expr == (not values[i]) if values[i] == descending else false()
+        else:
+            after = expr < values[i] if descending else expr > values[i]
+        clauses.append(and_(*equal_prefix, after))
+    return or_(*clauses)
+
+
+def encode_cursor(post, keys):
+    values = []
+    for name, _, _ in keys:
+        value = getattr(post, name)
+        if name in _COUNT_FIELDS:
+            value = value or 0
+        elif name == 'is_notice':
+            value = bool(value)
+        elif isinstance(value, datetime.datetime):
+            value = value.isoformat()
+        values.append(value)
+    return encode_values(values)
+
+
+def encode_values(values):
+    """커서 값 목록 -> base64url(JSON) 문자열"""
+    raw = json.dumps(values, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_values(cursor):
+    """encode_values의 역변환 (형식이 잘못되면 ValueError)"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (ValueError, TypeError) as e:
+        raise ValueError('invalid cursor') from e
+    if not isinstance(values, list):
+        raise ValueError('invalid cursor')
+    return values
+
+
+def decode_cursor(cursor, keys):
+    """잘못된 커서면 ValueError"""
+    try:
+        values = decode_values(cursor)
+        if len(values) != len(keys):
+            raise ValueError
+        for i, (name, _, _) in enumerate(keys):
+            value = values[i]
+            if name == 'is_notice':
+                valid = isinstance(value, bool)
+            elif name == 'crt_date':
+                values[i] = datetime.datetime.fromisoformat(value)
+                valid = True
+            elif name == 'hot_score':
+                valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+            else:
+                valid = isinstance(value, int) and not isinstance(value, bool)
+            if not valid:
+                raise ValueError
+    except (ValueError, TypeError) as e:
+        raise ValueError('invalid cursor') from e
+    return values
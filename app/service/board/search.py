@@ -0,0 +1,87 @@
+import html
+import re
+
+from sqlalchemy import func, cast, Float, tuple_, and_, or_
+
+from app.service.board.pagination import encode_values, decode_values
+
+# 2-gram 검색이라 최소 2글자 (0004 마이그레이션의 board_bigrams 참고)
+MIN_QUERY_LENGTH = 2
+SNIPPET_WIDTH = 80
+
+# tsvector 위치 상한. 넘어선 2-gram은 모두 이 위치에 붙으므로 그 뒤로는 구문(<->) 검색이 동작하지 않는다.
+# 제목(최대 200자)이 앞 위치를 쓰고 2-gram 수는 글자 수를 넘지 않으므로, 본문이 이 길이 이하면 위치가 잘리지 않는다.
+TSVECTOR_MAX_POSITION = 16383
+TITLE_MAX_LENGTH = 200
+PHRASE_SAFE_CONTENT_LENGTH = TSVECTOR_MAX_POSITION - TITLE_MAX_LENGTH
+
+_TERM_SPLIT_RE = re.compile(r'[\s!-/:-@\[-`{-~]+')
+
+
+def match_condition(model, q):
+    """search_vector GIN 인덱스를 타는 검색 조건 (검색어의 모든 단어를 포함)
+
+    인덱스 조건은 위치 없는 2-gram AND(board_bigram_and_query)이고, 단어 내 연속 일치는 구문 검색어로 거른다.
+    본문이 PHRASE_SAFE_CONTENT_LENGTH보다 길면 위치가 잘려 구문 검색이 빗나갈 수 있으므로 2-gram 포함 여부만 본다.
+    (이 경우 2-gram이 떨어져 있어도 매칭될 수 있고, 구문 검색어로 계산하는 rank_expr 점수는 낮게 나온다)
+    """
+    return and_(
+        model.search_vector.op('@@')(func.board_bigram_and_query(q)),
+        or_(
+            model.search_vector.op('@@')(func.board_bigram_query(q)),
+            func.length(model.content) > PHRASE_SAFE_CONTENT_LENGTH,
+        ),
+    )
+
+
+def rank_expr(model, q):
+    # 정규화 1: 문서 길이(log)로 나눠 긴 본문이 점수를 독식하지 않게 함
+    # real -> double precision으로 맞춰 커서 비교 시 값이 어긋나지 않게 함
+    return cast(func.ts_rank(model.search_vector, func.board_bigram_query(q), 1), Float)
+
+
+def keyset_after(model, rank, cursor):
+    """(score, id) 내림차순 커서 이후 조건 (잘못된 커서면 ValueError)"""
+    try:
+        score, post_id = decode_values(cursor)
+    except (ValueError, TypeError) as e:
+        raise ValueError('invalid cursor') from e
+    if not isinstance(score, (int, float)) or isinstance(score, bool) or not isinstance(post_id, int):
+        raise ValueError('invalid cursor')
+    return tuple_(rank, model.id) < tuple_(float(score), post_id)
+
+
+def encode_search_cursor(score, post_id):
+    return encode_values([score, post_id])
+
+
+def _terms(q):
+    return sorted({t for t in _TERM_SPLIT_RE.split(q) if t}, key=len, reverse=True)
+
+
+def highlight(text, q):
+    """검색어를 <mark>로 감싼 HTML (나머지 텍스트는 escape)"""
+    terms = _terms(q)
+    if not text or not terms:
+        return html.escape(text or '')
+    pattern = re.compile('|'.join(re.escape(t) for t in terms), re.IGNORECASE)
+    parts, last = [], 0
+    for m in pattern.finditer(text):
+        parts.append(html.escape(text[last:m.start()]))
+        parts.append(f'<mark>{html.escape(m.group())}</mark>')
+        last = m.end()
+    parts.append(html.escape(text[last:]))
+    return ''.join(parts)
+
+
+def snippet(text, q, width=SNIPPET_WIDTH):
+    """첫 번째 매칭 주변 width 글자를 잘라 하이라이트 (매칭이 없으면 앞부분)"""
+    text = text or ''
+    terms = _terms(q)
+    lowered = text.lower()
+    positions = [p for p in (lowered.find(t.lower()) for t in terms) if p >= 0]
+    start = max(min(positions) - width // 4, 0) if positions else 0
+    end = min(start + width, len(text))
+    prefix = '...' if start > 0 else ''
+    suffix = '...' if end < len(text) else ''
+    return prefix + highlight(text[start:end], q) + suffix
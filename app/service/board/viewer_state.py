@@ -0,0 +1,29 @@
+from sqlalchemy import select, and_, or_
+
+from app.db.models.post_like import PostLike
+
+
+def load_liked_ids(db, user_id, targets):
+    """현재 사용자가 좋아요 한 게시글/댓글 id를 한 번의 IN 쿼리로 조회
+
+    targets: {post_type: [id, ...]} (예: {'free': [게시글 id], 'free_comment': [댓글 id]})
+    반환: {post_type: {좋아요 한 id}} - targets의 모든 post_type 키가 들어 있음
+    """
+    liked = {post_type: set() for post_type in targets}
+    conditions = [
+        and_(PostLike.post_type == post_type, PostLike.post_id.in_(set(ids)))
+        for post_type, ids in targets.items() if ids
+    ]
+    if user_id is None or not conditions:
+        return liked
+
+    rows = db.execute(
+        select(PostLike.post_type, PostLike.post_id).where(
+            PostLike.user_id == user_id,
+            PostLike.is_active == True,
+            or_(*conditions),
+        )
+    ).all()
+    for post_type, post_id in rows:
+        liked[post_type].add(post_id)
+    return liked
@@ -0,0 +1,174 @@
+import logging
+import threading
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import select, text, Float
+from app.config import EXPORT_BATCH_SIZE, EXPORT_MAX_CONCURRENT, EXPORT_RETRY_AFTER, DB_POOLS
+from app.db.database import export_engine, replica_router
+from app.db.models.stock_info import StockInfo
+from app.db.models.stock_ohlcv import StockOhlcv
+from app.db.models.index_info import IndexInfo
+from app.db.models.index_ohlcv import IndexOhlcv
+
+logger = logging.getLogger('app.service.export')
+
+MEDIA_TYPES = {
+    'arrow': 'application/vnd.apache.arrow.stream',
+    'parquet': 'application/vnd.apache.parquet',
+}
+FILE_EXTENSIONS = {'arrow': 'arrows', 'parquet': 'parquet'}
+
+STOCK_OHLCV_NUMERIC_COLUMNS = [
+    'open', 'high', 'low', 'close', 'change_rate', 'trading_value',
+    'trading_value_institution', 'trading_value_other_corporation', 'trading_value_individual', 'trading_value_foreign',
+    'volume_institution', 'volume_other_corporation', 'volume_individual', 'volume_foreign',
+]
+
+STOCK_OHLCV_SCHEMA = pa.schema(
+    [('ticker', pa.string()), ('ymd', pa.date32()), ('volume', pa.int64())]
+    + [(col, pa.float64()) for col in STOCK_OHLCV_NUMERIC_COLUMNS]
+)
+
+INDEX_OHLCV_SCHEMA = pa.schema([
+    ('name', pa.string()),
+    ('ymd', pa.date32()),
+    ('open', pa.float64()),
+    ('high', pa.float64()),
+    ('low', pa.float64()),
+    ('close', pa.float64()),
+    ('volume', pa.int64()),
+])
+
+
+class ExportBusy(Exception):
+    """동시 내보내기 수 초과 (클라이언트가 retry_after 초 후 재시도)"""
+
+    def __init__(self, retry_after=EXPORT_RETRY_AFTER):
+        super().__init__('too many concurrent exports')
+        self.retry_after = retry_after
+
+
+_slots = threading.BoundedSemaphore(EXPORT_MAX_CONCURRENT)
+
+
+class _ChunkSink:
+    """pyarrow writer 출력을 받아 두었다가 배치마다 꺼내가는 write-only 스트림"""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data):
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def build_stock_ohlcv_query(tickers=None, market=None, from_date=None, to_date=None):
+    numeric = [getattr(StockOhlcv, col).cast(Float).label(col) for col in STOCK_OHLCV_NUMERIC_COLUMNS]
+    stmt = select(StockOhlcv.ticker, StockOhlcv.ymd, StockOhlcv.volume, *numeric)
+    if market:
+        stmt = stmt.join(StockInfo, StockInfo.id == StockOhlcv.stock_id).filter(StockInfo.market == market)
+    if tickers:
+        stmt = stmt.filter(StockOhlcv.ticker.in_(tickers))
+    if from_date:
+        stmt = stmt.filter(StockOhlcv.ymd >= from_date)
+    if to_date:
+        stmt = stmt.filter(StockOhlcv.ymd <= to_date)
+    return stmt.order_by(StockOhlcv.stock_id, StockOhlcv.ymd)
+
+
+def build_index_ohlcv_query(names=None, from_date=None, to_date=None):
+    stmt = (
+        select(
+            IndexInfo.name,
+            IndexOhlcv.ymd,
+            IndexOhlcv.open.cast(Float).label('open'),
+            IndexOhlcv.high.cast(Float).label('high'),
+            IndexOhlcv.low.cast(Float).label('low'),
+            IndexOhlcv.close.cast(Float).label('close'),
+            IndexOhlcv.volume,
+        )
+        .join(IndexInfo, IndexInfo.id == IndexOhlcv.index_id)
+    )
+    if names:
+        stmt = stmt.filter(IndexInfo.name.in_(names))
+    if from_date:
+        stmt = stmt.filter(IndexOhlcv.ymd >= from_date)
+    if to_date:
+        stmt = stmt.filter(IndexOhlcv.ymd <= to_date)
+    return stmt.order_by(IndexOhlcv.index_id, IndexOhlcv.ymd)
+
+
+def _open_writer(fmt, sink, schema):
+    if fmt == 'parquet':
+        return pq.ParquetWriter(sink, schema, compression='zstd')
+    return pa.ipc.new_stream(sink, schema)
+
+
+def _to_record_batch(rows, schema):
+    columns = list(zip(*rows))
+    return pa.RecordBatch.from_arrays(
+        [pa.array(col, type=field.type) for col, field in zip(columns, schema)],
+        schema=schema,
+    )
+
+
+def stream_export(stmt, schema, fmt, batch_size=EXPORT_BATCH_SIZE):
+    """슬롯/커넥션을 확보하고 쿼리를 연 뒤, Arrow IPC/Parquet 바이트 청크를 생성하는 제너레이터를 반환
+
+    준비 단계는 여기서 바로 실행되므로 동시 내보내기 초과(ExportBusy), 풀 체크아웃 타임아웃, 쿼리 오류는
+    StreamingResponse가 200을 보내기 전에 예외로 올라온다. (이후 실패는 잘린 파일이 될 수밖에 없음)
+    """
+    chunks = _export_chunks(stmt, schema, fmt, batch_size)
+    next(chunks)
+    return chunks
+
+
+def _export_chunks(stmt, schema, fmt, batch_size):
+    """서버 사이드 커서에서 batch_size행씩 읽어 인코딩 (첫 yield는 준비 완료 신호)
+
+    한 번에 한 배치만 메모리에 올리므로 내보내는 기간/종목 수와 무관하게 메모리 사용량이 일정하다.
+    """
+    if not _slots.acquire(blocking=False):
+        raise ExportBusy()
+    try:
+        db_engine = replica_router.pick() if replica_router.replicas else None
+        db_engine = db_engine or export_engine
+        sink = _ChunkSink()
+        total = 0
+        with db_engine.connect() as conn:
+            with conn.begin():
+                # 복제본 엔진의 짧은 API statement_timeout 대신 내보내기 한도를 적용
+                conn.execute(text(f"SET LOCAL statement_timeout = {int(DB_POOLS['export']['statement_timeout_ms'])}"))
+                result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(stmt)
+                yield
+                writer = _open_writer(fmt, sink, schema)
+                for rows in result.partitions():
+                    writer.write_batch(_to_record_batch(rows, schema))
+                    total += len(rows)
+                    chunk = sink.drain()
+                    if chunk:
+                        yield chunk
+                writer.close()
+        yield sink.drain()
+        logger.info(f'OHLCV {fmt} 내보내기 완료, 총 {total}건')
+    finally:
+        # 응답 도중 연결이 끊겨 제너레이터가 닫혀도 슬롯 반환
+        _slots.release()
@@ -1,6 +1,6 @@
 import logging
 from app.service.kiwoom import kiwoom_client, constant, update_kiwoom_token
-from app.db.database import SessionLocal
+from app.db.database import BatchSessionLocal
 from app.config import os
 from datetime import datetime, timezone
 from app.db.models.stock_info import StockInfo
@@ -11,7 +11,7 @@ logger = logging.getLogger('app.service.batch')
 
 class StockInfoService:
     def __init__(self):
-        self.db = SessionLocal()
+        self.db = BatchSessionLocal()
         result = update_kiwoom_token.get_kiwoom_api_url_and_valid_token()
         if result is None or result[0] is None or result[1] is None:
             raise ValueError("키움 API URL 또는 토큰을 가져올 수 없습니다. 계정 정보와 API 키를 확인해주세요.")
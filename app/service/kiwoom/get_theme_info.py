@@ -1,5 +1,5 @@
 from app.service.kiwoom import kiwoom_client, constant, update_kiwoom_token
-from app.db.database import SessionLocal
+from app.db.database import BatchSessionLocal
 from app.config import os
 from datetime import datetime, timezone
 from app.db.models.theme_info import ThemeInfo
@@ -7,7 +7,7 @@ from sqlalchemy.dialects.postgresql import insert
 
 class ThemeInfoService:
     def __init__(self):
-        self.db = SessionLocal()
+        self.db = BatchSessionLocal()
         self.api_url, self.token = update_kiwoom_token.get_kiwoom_api_url_and_valid_token()
 
     def get_theme_list(self):
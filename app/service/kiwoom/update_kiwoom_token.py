@@ -3,7 +3,7 @@ import os
 from dotenv import load_dotenv
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
-from app.db.database import SessionLocal
+from app.db.database import BatchSessionLocal
 from app.db.models.kiwoom_api_info import KiwoomApiInfo
 from app.config import os as app_os
 from app.service.kiwoom import kiwoom_client, constant
@@ -71,7 +71,7 @@ def get_kiwoom_api_url_and_valid_token():
     if not account_no:
         logger.error(".env 파일에 ACCOUNT_NO가 정의되어 있어야 합니다.")
         return None, None
-    db = SessionLocal()
+    db = BatchSessionLocal()
     try:
         result = get_valid_token(db, account_no)
         if result is None:
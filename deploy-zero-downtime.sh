@@ -16,16 +16,20 @@ export $(cat env.production | xargs)
 echo "3. 새 이미지 빌드"
 docker compose -f docker-compose.prod.yml build --no-cache
 
-# 4. 새 컨테이너 시작 (기존과 다른 포트)
-echo "4. 새 컨테이너 시작"
+# 4. DB 마이그레이션 적용 (서버 기동 시에는 적용하지 않음, 새 코드는 이전 스키마와 호환되어야 함)
+echo "4. DB 마이그레이션 적용"
+docker compose -f docker-compose.prod.yml run --rm backend python -m app.db.init_db
+
+# 5. 새 컨테이너 시작 (기존과 다른 포트)
+echo "5. 새 컨테이너 시작"
 docker compose -f docker-compose.prod.yml up -d --scale backend=2
 
-# 5. 새 컨테이너가 준비될 때까지 대기
-echo "5. 새 컨테이너 준비 대기"
+# 6. 새 컨테이너가 준비될 때까지 대기
+echo "6. 새 컨테이너 준비 대기"
 sleep 30
 
-# 6. Health check
-echo "6. Health check"
+# 7. Health check
+echo "7. Health check"
 for i in {1..10}; do
     if curl -f http://localhost:8000/health > /dev/null 2>&1; then
         echo "Health check 성공"
@@ -36,12 +40,12 @@ for i in {1..10}; do
     fi
 done
 
-# 7. 기존 컨테이너 제거
-echo "7. 기존 컨테이너 제거"
+# 8. 기존 컨테이너 제거
+echo "8. 기존 컨테이너 제거"
 docker compose -f docker-compose.prod.yml up -d --scale backend=1
 
-# 8. 최종 상태 확인
-echo "8. 최종 상태 확인"
+# 9. 최종 상태 확인
+echo "9. 최종 상태 확인"
 docker compose -f docker-compose.prod.yml ps
 
 echo "==== 무중단 배포 완료 ====" 
\ No newline at end of file
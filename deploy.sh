@@ -8,13 +8,16 @@ git pull origin main
 echo "==== [2] Docker 이미지 빌드 ===="
 docker compose build --no-cache
 
-echo "==== [3] 컨테이너 재시작 ===="
+echo "==== [3] DB 마이그레이션 적용 ===="
+docker compose run --rm backend python -m app.db.init_db
+
+echo "==== [4] 컨테이너 재시작 ===="
 docker compose up -d
 
-echo "==== [4] 컨테이너 상태 확인 ===="
+echo "==== [5] 컨테이너 상태 확인 ===="
 docker compose ps
 
-echo "==== [5] 불필요한 이미지/컨테이너 정리 ===="
+echo "==== [6] 불필요한 이미지/컨테이너 정리 ===="
 docker system prune -f
 
 echo "==== [배포 완료] ===="
@@ -0,0 +1,88 @@
+"""실제 Postgres가 필요한 테스트용 픽스처
+
+DATABASE_URL이 없으면 이 디렉터리의 테스트는 모두 건너뛴다 (app.config가 import 시점에 값을 읽으므로 import 전에 확인).
+"""
+import datetime
+import os
+import uuid
+
+import pytest
+
+if not os.getenv('DATABASE_URL'):
+    pytest.skip("DATABASE_URL이 설정되지 않아 DB 테스트를 건너뜀", allow_module_level=True)
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool
+
+from app.api import auth, export, free_board, index_info, sector_info, stock_ohlcv, strategy_board, theme_info
+from app.config import DATABASE_URL
+from app.core.cache import board_count_cache, market_cache, post_detail_cache, refresh_token_cache, user_cache
+from app.db.database import SessionLocal, async_engine
+from app.db.init_db import run_migrations
+from app.db.models import FreeBoard, FreeComment, FreePost, StrategyBoard, StrategyComment, StrategyPost
+from tests.db.seed import cleanup, seed_board, seed_market, seed_user
+
+_ROUTERS = (theme_info, index_info, auth, strategy_board, free_board, sector_info, stock_ohlcv, export)
+
+
+@pytest.fixture(scope='session')
+def seed():
+    """게시판/시세/인증 라우터가 빈 결과로 일찍 끝나지 않을 만큼의 데이터"""
+    run_migrations()
+    suffix = uuid.uuid4().hex[:8]
+    with SessionLocal() as db:
+        data = seed_user(db, suffix)
+        data['free'] = seed_board(db, FreeBoard, FreePost, FreeComment, 'free', data['user'])
+        data['strategy'] = seed_board(db, StrategyBoard, StrategyPost, StrategyComment, 'strategy', data['user'])
+        data['market'] = seed_market(db, suffix, datetime.date.today())
+        db.commit()
+    yield data
+    with SessionLocal() as db:
+        cleanup(db, data)
+
+
+@pytest.fixture(scope='session')
+def client():
+    """lifespan(스케줄러 등) 없이 라우터만 올린 앱. 비동기 엔진 커넥션이 한 이벤트 루프에 묶이도록 세션 동안 유지"""
+    app = FastAPI()
+    for module in _ROUTERS:
+        app.include_router(module.router)
+    with TestClient(app) as test_client:
+        yield test_client
+        test_client.portal.call(async_engine.dispose)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """캐시 적중으로 쿼리가 생략되지 않도록 테스트마다 비움"""
+    for cache in (market_cache, board_count_cache, post_detail_cache, user_cache, refresh_token_cache):
+        cache.clear()
+
+
+@pytest.fixture
+def captured_sql():
+    """테스트 동안 모든 엔진(동기/비동기, 풀별)이 실행한 (드라이버, SQL, 파라미터)"""
+    statements = []
+
+    def record(connection, cursor, statement, parameters, context, executemany):
+        if not executemany:
+            statements.append((connection.dialect.driver, statement, parameters))
+
+    event.listen(Engine, 'before_cursor_execute', record)
+    yield statements
+    event.remove(Engine, 'before_cursor_execute', record)
+
+
+@pytest.fixture(scope='session')
+def plan_connection():
+    """EXPLAIN 전용 커넥션 (SET LOCAL은 트랜잭션 롤백과 함께 사라짐)"""
+    plan_engine = create_engine(DATABASE_URL, poolclass=NullPool)
+    with plan_engine.connect() as connection, connection.begin() as transaction:
+        # 시드 데이터가 적어도 인덱스를 쓸 수 있으면 쓰도록 (그래도 Seq Scan이면 쓸 인덱스가 없다는 뜻)
+        connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        yield connection
+        transaction.rollback()
+    plan_engine.dispose()
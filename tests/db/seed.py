@@ -0,0 +1,147 @@
+"""실행계획 테스트용 시드 데이터 생성/정리
+
+실행마다 고유한 접미사를 붙여 커밋하고, 테스트 세션이 끝나면 같은 id로 지운다.
+"""
+import datetime
+
+from sqlalchemy import func, select, text
+
+from app.api.auth import create_access_token, create_refresh_token, hash_token
+from app.db.models import (
+    Account, FreeBoard, FreeComment, FreePost, IndexInfo, IndexOhlcv, PostHotScore, RefreshToken, SectorInfo,
+    StockInfo, StockOhlcv, StockSectorRelation, StockThemeRelation, StrategyBoard, StrategyComment, StrategyPost,
+    ThemeInfo, User,
+)
+from app.db.partitions import ensure_stock_ohlcv_partitions
+from app.service.auth.password import pwd_context
+from app.service.board.comments import REPLIES_PER_THREAD, THREADS_PER_PAGE, assign_path
+
+SEED_PASSWORD = 'plan-check-password'
+SEARCH_TERM = '삼성전자'
+
+def seed_board(db, board_model, post_model, comment_model, post_type, user_id):
+    board = board_model(name=f'{post_type} 게시판')
+    db.add(board)
+    db.flush()
+    posts = [
+        post_model(
+            board_id=board.id, user_id=user_id,
+            title=f'{SEARCH_TERM} 실적 전망 {i}', content=f'{SEARCH_TERM} 반도체 업황 정리 {i}',
+        )
+        for i in range(3)
+    ]
+    db.add_all(posts)
+    db.flush()
+    now = datetime.datetime.now(datetime.timezone.utc)
+    db.add_all([
+        PostHotScore(post_type=post_type, post_id=post.id, score=float(i + 1), computed_at=now)
+        for i, post in enumerate(posts)
+    ])
+
+    # 첫 게시글: 루트 댓글 한 페이지 + 1개, 첫 스레드는 답글이 REPLIES_PER_THREAD개를 넘도록
+    post = posts[0]
+    roots = []
+    for i in range(THREADS_PER_PAGE + 1):
+        root = comment_model(post_id=post.id, user_id=user_id, content=f'댓글 {i}')
+        assign_path(db, comment_model, root)
+        roots.append(root)
+    replies = []
+    for i in range(REPLIES_PER_THREAD + 1):
+        reply = comment_model(post_id=post.id, user_id=user_id, parent_id=roots[0].id, content=f'답글 {i}')
+        assign_path(db, comment_model, reply, roots[0])
+        replies.append(reply)
+    db.add_all(roots + replies)
+    db.flush()
+    return {'board': board.id, 'posts': [p.id for p in posts], 'root_comment': roots[0].id}
+
+
+def seed_market(db, suffix, today):
+    stock = StockInfo(ticker=f'T{suffix}', name=f'{SEARCH_TERM}-{suffix}', market='KOSPI')
+    theme = ThemeInfo(
+        theme_code=f'TH{suffix}', theme_name=f'테마-{suffix}', change_rate=1, avg_change_rate_3days=1,
+        up_ticker_count=1, neutral_ticker_count=0, down_ticker_count=0, detail_url='', description='',
+    )
+    sector = SectorInfo(
+        sector_code=f'SE{suffix}', sector_name=f'업종-{suffix}', change_rate=1,
+        up_ticker_count=1, neutral_ticker_count=0, down_ticker_count=0, detail_url='',
+    )
+    index_id = db.scalar(select(func.coalesce(func.max(IndexInfo.id), 0) + 1))
+    index = IndexInfo(id=index_id, order_no=index_id, name=f'IDX{suffix}', description='')
+    db.add_all([stock, theme, sector, index])
+    db.flush()
+    db.add_all([
+        StockThemeRelation(stock_id=stock.id, theme_id=theme.id, current_price=1, change_rate=1, volume=1),
+        StockSectorRelation(stock_id=stock.id, sector_id=sector.id, current_price=1, change_rate=1, volume=1),
+    ])
+    days = [today - datetime.timedelta(days=i) for i in range(5)]
+    ensure_stock_ohlcv_partitions(db.connection(), {d.year for d in days})
+    db.add_all([
+        StockOhlcv(stock_id=stock.id, ticker=stock.ticker, ymd=d, open=1, high=1, low=1, close=1, volume=1)
+        for d in days
+    ] + [
+        IndexOhlcv(index_id=index.id, ymd=d, open=1, high=1, low=1, close=1, volume=1)
+        for d in days
+    ])
+    return {
+        'stock': stock.id, 'ticker': stock.ticker, 'theme': theme.id, 'theme_code': theme.theme_code,
+        'sector': sector.id, 'sector_code': sector.sector_code, 'index': index.id,
+        'from_date': days[-1].isoformat(),
+    }
+
+
+def seed_user(db, suffix):
+    user = User(username=f'plan-{suffix}', nickname=f'plan-{suffix}')
+    db.add(user)
+    db.flush()
+    account = Account(
+        user_id=user.id, provider='email', email=f'plan-{suffix}@example.com',
+        password_hash=pwd_context.hash(SEED_PASSWORD),
+    )
+    db.add(account)
+    db.flush()
+    now = datetime.datetime.now(datetime.timezone.utc)
+    refresh_token = create_refresh_token()
+    db.add_all([
+        RefreshToken(
+            user_id=user.id, account_id=account.id, token=hash_token(refresh_token),
+            expires_at=now + datetime.timedelta(days=1),
+        ),
+        # 정리 배치가 지울 만료 토큰
+        RefreshToken(
+            user_id=user.id, account_id=account.id, token=hash_token(create_refresh_token()),
+            expires_at=now - datetime.timedelta(days=1),
+        ),
+    ])
+    return {
+        'user': user.id, 'email': account.email, 'refresh_token': refresh_token,
+        'access_token': create_access_token(data={'sub': str(user.id), 'account_id': account.id,
+                                                  'provider': account.provider, 'email': account.email}),
+    }
+
+
+def cleanup(db, seed):
+    user_id = seed['user']
+    for post_type, post_model, comment_model, board_model in (
+        ('free', FreePost, FreeComment, FreeBoard),
+        ('strategy', StrategyPost, StrategyComment, StrategyBoard),
+    ):
+        post_ids = seed[post_type]['posts']
+        db.execute(text("DELETE FROM post_hot_scores WHERE post_type = :t AND post_id = ANY(:ids)"),
+                   {'t': post_type, 'ids': post_ids})
+        db.execute(comment_model.__table__.delete().where(comment_model.post_id.in_(post_ids)))
+        db.execute(post_model.__table__.delete().where(post_model.id.in_(post_ids)))
+        db.execute(board_model.__table__.delete().where(board_model.id == seed[post_type]['board']))
+    db.execute(text("DELETE FROM post_views WHERE user_id = :u"), {'u': user_id})
+    db.execute(text("DELETE FROM post_likes WHERE user_id = :u"), {'u': user_id})
+    db.execute(User.__table__.delete().where(User.id == user_id))  # 계정/리프레시 토큰은 CASCADE
+
+    market = seed['market']
+    db.execute(StockThemeRelation.__table__.delete().where(StockThemeRelation.stock_id == market['stock']))
+    db.execute(StockSectorRelation.__table__.delete().where(StockSectorRelation.stock_id == market['stock']))
+    db.execute(StockOhlcv.__table__.delete().where(StockOhlcv.stock_id == market['stock']))
+    db.execute(IndexOhlcv.__table__.delete().where(IndexOhlcv.index_id == market['index']))
+    db.execute(ThemeInfo.__table__.delete().where(ThemeInfo.id == market['theme']))
+    db.execute(SectorInfo.__table__.delete().where(SectorInfo.id == market['sector']))
+    db.execute(IndexInfo.__table__.delete().where(IndexInfo.id == market['index']))
+    db.execute(StockInfo.__table__.delete().where(StockInfo.id == market['stock']))
+    db.commit()
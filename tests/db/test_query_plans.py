@@ -0,0 +1,168 @@
+"""라우터 핫패스 쿼리의 실행계획 회귀 테스트
+
+각 엔드포인트를 실제로 호출해 라우터/서비스가 만든 SQL을 그대로 수집하고, EXPLAIN (FORMAT JSON)에서
+Seq Scan이 나오면 실패한다. 쿼리 빌더(threads_query, replies_query, sort_keys/join_hot_scores, keyset 커서,
+search.match_condition, OHLCV lateral 조회 등)를 바꾸면 이 테스트가 인덱스를 못 타는 변경을 잡는다.
+
+    DATABASE_URL=... pytest tests/db
+"""
+import json
+import re
+
+import pytest
+
+from tests.db.seed import SEARCH_TERM, SEED_PASSWORD
+
+_EXPLAINABLE = ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE')
+
+
+def _seq_scans(plan):
+    """실행계획 트리에서 Seq Scan 노드의 테이블명을 수집"""
+    found = []
+    if plan.get('Node Type') == 'Seq Scan':
+        found.append(plan.get('Relation Name'))
+    for child in plan.get('Plans', []):
+        found.extend(_seq_scans(child))
+    return found
+
+
+def _to_pyformat(statement, parameters):
+    """asyncpg 문장($1)을 psycopg2 커넥션에서 EXPLAIN 할 수 있게 %(p1)s 형식으로 변환"""
+    statement = re.sub(r'\$(\d+)', r'%(p\1)s', statement.replace('%', '%%'))
+    return statement, {f'p{i}': value for i, value in enumerate(parameters, start=1)}
+
+
+def explain(connection, driver, statement, parameters):
+    if driver == 'asyncpg':
+        statement, parameters = _to_pyformat(statement, parameters)
+    row = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters or {}).scalar()
+    plan = row if isinstance(row, list) else json.loads(row)
+    return plan[0]['Plan']
+
+
+def assert_no_seq_scan(connection, statements, allowed=()):
+    """수집한 SQL 중 Seq Scan이 남는 문장을 모아 한 번에 실패 (EXPLAIN 자체도 수집되므로 복사본을 순회)"""
+    explained = 0
+    failures = []
+    for driver, statement, parameters in list(statements):
+        if not statement.lstrip().upper().startswith(_EXPLAINABLE):
+            continue
+        explained += 1
+        tables = [t for t in _seq_scans(explain(connection, driver, statement, parameters)) if t not in allowed]
+        if tables:
+            failures.append(f"Seq Scan on {', '.join(tables)}:\n{statement}")
+    assert explained, "수집된 쿼리가 없음 (캐시 적중 또는 라우터가 DB를 조회하지 않음)"
+    assert not failures, '\n\n'.join(failures)
+
+
+def _auth_headers(seed):
+    return {'Authorization': f"Bearer {seed['access_token']}"}
+
+
+def _next_cursor(client, seed, path):
+    response = client.get(path, headers=_auth_headers(seed))
+    assert response.status_code == 200, response.text
+    cursor = response.json()['next_cursor']
+    assert cursor, f"{path}: 다음 페이지가 없음 (시드 데이터 부족)"
+    return cursor
+
+
+# (경로, Seq Scan을 허용할 테이블)
+MARKET_ENDPOINTS = [
+    # 테마/업종 목록은 전체 조회라 Seq Scan이 정상
+    ('/themes', ('tb_theme_info',)),
+    ('/theme/{market[theme_code]}', ()),
+    ('/themes/{market[theme]}', ()),
+    ('/sectors', ('tb_sector_info',)),
+    ('/sector/{market[sector_code]}', ()),
+    ('/sectors/{market[sector]}', ()),
+    ('/index_all?n_days=30', ()),
+    ('/index_all?n_days=30&format=columnar', ()),
+    ('/stocks/{market[ticker]}/ohlcv', ()),
+    ('/stocks/{market[ticker]}/ohlcv?from={market[from_date]}&order=desc&limit=2', ()),
+]
+
+BOARD_ENDPOINTS = [
+    '/{board}/posts',
+    '/{board}/posts?sort=hot',
+    '/{board}/posts?search=' + SEARCH_TERM,
+    '/{board}/search?q=' + SEARCH_TERM,
+    '/{board}/posts/{post}',
+    '/{board}/comments/{comment}/replies',
+]
+
+BOARDS = [('free-board', 'free'), ('strategy-board', 'strategy')]
+
+
+@pytest.mark.parametrize('path, allowed', MARKET_ENDPOINTS)
+def test_market_endpoints(client, seed, captured_sql, plan_connection, path, allowed):
+    response = client.get(path.format(market=seed['market']))
+    assert response.status_code == 200, response.text
+    assert_no_seq_scan(plan_connection, captured_sql, allowed)
+
+
+@pytest.mark.parametrize('board, post_type', BOARDS)
+@pytest.mark.parametrize('path', BOARD_ENDPOINTS)
+def test_board_endpoints(client, seed, captured_sql, plan_connection, board, post_type, path):
+    data = seed[post_type]
+    response = client.get(
+        path.format(board=board, post=data['posts'][0], comment=data['root_comment']),
+        headers=_auth_headers(seed),
+    )
+    assert response.status_code == 200, response.text
+    assert_no_seq_scan(plan_connection, captured_sql)
+
+
+@pytest.mark.parametrize('board, post_type', BOARDS)
+@pytest.mark.parametrize('sort', ['latest', 'hot'])
+def test_board_list_cursor(client, seed, plan_connection, captured_sql, board, post_type, sort):
+    cursor = _next_cursor(client, seed, f'/{board}/posts?sort={sort}&size=1')
+    captured_sql.clear()
+    response = client.get(f'/{board}/posts', params={'sort': sort, 'size': 1, 'cursor': cursor},
+                          headers=_auth_headers(seed))
+    assert response.status_code == 200, response.text
+    assert_no_seq_scan(plan_connection, captured_sql)
+
+
+@pytest.mark.parametrize('board, post_type', BOARDS)
+def test_board_search_cursor(client, seed, plan_connection, captured_sql, board, post_type):
+    cursor = _next_cursor(client, seed, f'/{board}/search?q={SEARCH_TERM}&size=1')
+    captured_sql.clear()
+    response = client.get(f'/{board}/search', params={'q': SEARCH_TERM, 'size': 1, 'cursor': cursor},
+                          headers=_auth_headers(seed))
+    assert response.status_code == 200, response.text
+    assert_no_seq_scan(plan_connection, captured_sql)
+
+
+@pytest.mark.parametrize('board, post_type', BOARDS)
+def test_board_comment_threads_cursor(client, seed, plan_connection, captured_sql, board, post_type):
+    post_id = seed[post_type]['posts'][0]
+    response = client.get(f'/{board}/posts/{post_id}', headers=_auth_headers(seed))
+    assert response.status_code == 200, response.text
+    cursor = response.json()['comments_next_cursor']
+    assert cursor, "루트 댓글 다음 페이지가 없음 (시드 데이터 부족)"
+    captured_sql.clear()
+    response = client.get(f'/{board}/posts/{post_id}/comments', params={'cursor': cursor},
+                          headers=_auth_headers(seed))
+    assert response.status_code == 200, response.text
+    assert_no_seq_scan(plan_connection, captured_sql)
+
+
+def test_email_login(client, seed, plan_connection, captured_sql):
+    response = client.post('/auth/email/login', json={'email': seed['email'], 'password': SEED_PASSWORD})
+    assert response.status_code == 200, response.text
+    assert_no_seq_scan(plan_connection, captured_sql)
+
+
+def test_refresh_token_rotation(client, seed, plan_connection, captured_sql):
+    response = client.post('/auth/refresh', headers={'Cookie': f"refresh_token={seed['refresh_token']}"})
+    assert response.status_code == 200, response.text
+    seed['refresh_token'] = response.json()['refresh_token']
+    assert_no_seq_scan(plan_connection, captured_sql)
+
+
+def test_refresh_token_sweep(seed, plan_connection, captured_sql):
+    from app.service.batch.sweep_refresh_tokens import sweep
+
+    assert sweep() >= 1
+    assert_no_seq_scan(plan_connection, captured_sql)